@@ -0,0 +1,324 @@
+from __future__ import annotations
+
+import asyncio
+import ssl
+import urllib.error
+import urllib.parse
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from email.message import Message
+from email.parser import BytesHeaderParser
+from typing import Any, Awaitable, Callable, TypeVar
+
+# Minimal asyncio HTTP/1.1 client with per-host keep-alive pools and a global in-flight cap.
+# Stdlib only; enough of HTTP for feeds and JSON APIs (Content-Length, chunked, read-to-close,
+# redirects). No compression: requests send `Accept-Encoding: identity`.
+
+USER_AGENT = "postcast/0.1 (+https://example.invalid)"
+_REDIRECTS = {301, 302, 303, 307, 308}
+_T = TypeVar("_T")
+
+
+@dataclass
+class _Conn:
+    key: tuple[str, str, int]
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    requests: int = 0
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+@dataclass
+class AsyncResponse:
+    url: str
+    status: int
+    reason: str
+    headers: Message
+    _fetcher: AsyncFetcher
+    _conn: _Conn | None
+    _remaining: int | None  # bytes left (Content-Length); None = chunked or read-to-close
+    _chunked: bool
+    _chunk_left: int = 0
+    _done: bool = False
+    _reusable: bool = True
+    _released: bool = field(default=False, repr=False)
+
+    async def _io(self, aw: Awaitable[_T]) -> _T:
+        return await asyncio.wait_for(aw, timeout=self._fetcher.timeout)
+
+    async def _read_some(self, n: int) -> bytes:
+        conn = self._conn
+        if conn is None or self._done:
+            return b""
+        if self._chunked:
+            if self._chunk_left == 0:
+                size_line = await self._io(conn.reader.readline())
+                size = int(size_line.split(b";", 1)[0].strip() or b"0", 16)
+                if size == 0:
+                    # trailers until blank line
+                    while (await self._io(conn.reader.readline())) not in (b"\r\n", b"\n", b""):
+                        pass
+                    self._done = True
+                    return b""
+                self._chunk_left = size
+            data = await self._io(conn.reader.read(min(n, self._chunk_left)))
+            if not data:
+                raise ConnectionError("connection closed mid-chunk")
+            self._chunk_left -= len(data)
+            if self._chunk_left == 0:
+                await self._io(conn.reader.readline())  # CRLF after chunk
+            return data
+        if self._remaining is not None:
+            if self._remaining == 0:
+                self._done = True
+                return b""
+            data = await self._io(conn.reader.read(min(n, self._remaining)))
+            if not data:
+                raise ConnectionError("connection closed before Content-Length bytes arrived")
+            self._remaining -= len(data)
+            if self._remaining == 0:
+                self._done = True
+            return data
+        data = await self._io(conn.reader.read(n))
+        if not data:
+            self._done = True
+        return data
+
+    async def read(self, n: int = -1) -> bytes:
+        if n is None or n < 0:
+            chunks = []
+            while True:
+                data = await self._read_some(64 * 1024)
+                if not data:
+                    break
+                chunks.append(data)
+            await self.aclose()
+            return b"".join(chunks)
+        data = await self._read_some(n)
+        if self._done:
+            await self.aclose()
+        return data
+
+    async def _drain_for_redirect(self) -> None:
+        # keep the in-flight slot (the redirect target reuses it), give the connection back
+        while await self._read_some(64 * 1024):
+            pass
+        conn, self._conn = self._conn, None
+        self._released = True
+        if conn is not None:
+            self._fetcher._release(conn, reusable=self._done and self._reusable)
+
+    async def aclose(self) -> None:
+        if self._released:
+            return
+        self._released = True
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            self._fetcher._release(conn, reusable=self._done and self._reusable)
+        self._fetcher._in_flight.release()
+
+
+class AsyncFetcher:
+    """Pooled keep-alive HTTP/1.1 fetcher.
+
+    At most `max_in_flight` responses are open at once (a response counts until its body is
+    read or it is closed); idle connections are kept per (scheme, host, port), up to
+    `max_idle_per_host`, and reused for later requests to the same host.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_in_flight: int = 16,
+        max_idle_per_host: int = 4,
+        timeout: float = 30.0,
+        connect_timeout: float | None = None,
+        user_agent: str = USER_AGENT,
+        max_redirects: int = 5,
+    ) -> None:
+        # `timeout` bounds each read (status line, header line, body chunk); connecting has its own
+        self.timeout = float(timeout)
+        self.connect_timeout = float(connect_timeout) if connect_timeout is not None else self.timeout
+        self.user_agent = user_agent
+        self.max_redirects = int(max_redirects)
+        self.max_idle_per_host = int(max_idle_per_host)
+        self._in_flight = asyncio.Semaphore(max(1, int(max_in_flight)))
+        self._idle: dict[tuple[str, str, int], list[_Conn]] = {}
+        self._ssl = ssl.create_default_context()
+        self.connections_opened = 0
+
+    async def __aenter__(self) -> AsyncFetcher:
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        for conns in self._idle.values():
+            for c in conns:
+                c.close()
+        self._idle.clear()
+
+    def _release(self, conn: _Conn, *, reusable: bool) -> None:
+        idle = self._idle.setdefault(conn.key, [])
+        if reusable and len(idle) < self.max_idle_per_host and not conn.writer.is_closing():
+            idle.append(conn)
+        else:
+            conn.close()
+
+    async def _connect(self, key: tuple[str, str, int]) -> _Conn:
+        scheme, host, port = key
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(host, port, ssl=self._ssl if scheme == "https" else None),
+            timeout=self.connect_timeout,
+        )
+        self.connections_opened += 1
+        return _Conn(key=key, reader=reader, writer=writer)
+
+    async def _exchange(
+        self, conn: _Conn, *, method: str, target: str, host_header: str, headers: dict[str, str]
+    ) -> tuple[int, str, Message]:
+        lines = [f"{method} {target} HTTP/1.1", f"Host: {host_header}"]
+        base = {"User-Agent": self.user_agent, "Accept-Encoding": "identity", "Connection": "keep-alive"}
+        for k, v in {**base, **headers}.items():
+            lines.append(f"{k}: {v}")
+        conn.writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+        await conn.writer.drain()
+        conn.requests += 1
+
+        while True:
+            status_line = await asyncio.wait_for(conn.reader.readline(), timeout=self.timeout)
+            if not status_line:
+                raise ConnectionResetError("server closed the connection")
+            parts = status_line.decode("latin-1").rstrip("\r\n").split(" ", 2)
+            status = int(parts[1])
+            reason = parts[2] if len(parts) > 2 else ""
+            raw = b""
+            while True:
+                line = await asyncio.wait_for(conn.reader.readline(), timeout=self.timeout)
+                raw += line
+                if line in (b"\r\n", b"\n", b""):
+                    break
+            if status != 100:
+                return status, reason, BytesHeaderParser().parsebytes(raw)
+
+    async def open(self, url: str, headers: dict[str, str] | None = None, *, method: str = "GET") -> AsyncResponse:
+        """Send a request and return once headers arrived; the caller must read or aclose() the body."""
+        headers = dict(headers or {})
+        await self._in_flight.acquire()
+        try:
+            for _ in range(self.max_redirects + 1):
+                resp = await self._open_once(url, headers, method=method)
+                location = resp.headers.get("Location")
+                if resp.status in _REDIRECTS and location:
+                    await resp._drain_for_redirect()
+                    url = urllib.parse.urljoin(url, location)
+                    if resp.status == 303:
+                        method = "GET"
+                    continue
+                return resp
+            raise urllib.error.URLError(f"too many redirects: {url}")
+        except BaseException:
+            self._in_flight.release()
+            raise
+
+    async def _open_once(self, url: str, headers: dict[str, str], *, method: str) -> AsyncResponse:
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in ("http", "https"):
+            raise ValueError(f"unsupported URL scheme: {url}")
+        host = parts.hostname or ""
+        port = parts.port or (443 if scheme == "https" else 80)
+        key = (scheme, host, port)
+        target = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        host_header = host if parts.port is None else f"{host}:{port}"
+
+        idle = self._idle.get(key) or []
+        conn = idle.pop() if idle else None
+        reused = conn is not None
+        if conn is None:
+            conn = await self._connect(key)
+        try:
+            status, reason, resp_headers = await self._exchange(
+                conn, method=method, target=target, host_header=host_header, headers=headers
+            )
+        except (ConnectionError, asyncio.IncompleteReadError, OSError):
+            conn.close()
+            if not reused:
+                raise
+            # the pooled connection went stale while idle; retry once on a fresh one
+            conn = await self._connect(key)
+            status, reason, resp_headers = await self._exchange(
+                conn, method=method, target=target, host_header=host_header, headers=headers
+            )
+
+        te = (resp_headers.get("Transfer-Encoding") or "").lower()
+        length = resp_headers.get("Content-Length")
+        no_body = method == "HEAD" or status in (204, 304) or 100 <= status < 200
+        resp = AsyncResponse(
+            url=url,
+            status=status,
+            reason=reason,
+            headers=resp_headers,
+            _fetcher=self,
+            _conn=conn,
+            _remaining=0 if no_body else (None if "chunked" in te or length is None else int(length)),
+            _chunked=not no_body and "chunked" in te,
+        )
+        if "close" in (resp_headers.get("Connection") or "").lower() or (
+            not no_body and not resp._chunked and resp._remaining is None
+        ):
+            resp._reusable = False
+        if no_body:
+            resp._done = True
+        return resp
+
+    async def fetch(self, url: str, headers: dict[str, str] | None = None, *, method: str = "GET") -> tuple[int, Message, bytes]:
+        resp = await self.open(url, headers, method=method)
+        body = await resp.read()
+        return resp.status, resp.headers, body
+
+    def blocking_opener(self, loop: asyncio.AbstractEventLoop) -> Callable[[str, dict[str, str]], BlockingResponse]:
+        """A urlopen-like callable for worker threads: requests run on `loop` (and its pools).
+
+        Non-2xx statuses raise urllib.error.HTTPError, like urllib.request.urlopen.
+        """
+
+        def opener(url: str, headers: dict[str, str]) -> BlockingResponse:
+            resp = _run(loop, self.open(url, headers))
+            if not 200 <= resp.status < 300:
+                _run(loop, resp.aclose())
+                raise urllib.error.HTTPError(url, resp.status, resp.reason, resp.headers, None)
+            return BlockingResponse(resp, loop)
+
+        return opener
+
+
+def _run(loop: asyncio.AbstractEventLoop, coro: Awaitable[_T]) -> _T:
+    fut: Future[_T] = asyncio.run_coroutine_threadsafe(coro, loop)  # type: ignore[arg-type]
+    return fut.result()
+
+
+class BlockingResponse:
+    """File-like view of an AsyncResponse for code running in a worker thread."""
+
+    def __init__(self, resp: AsyncResponse, loop: asyncio.AbstractEventLoop) -> None:
+        self._resp = resp
+        self._loop = loop
+        self.status = resp.status
+        self.headers = resp.headers
+        self.url = resp.url
+
+    def read(self, n: int = -1) -> bytes:
+        return _run(self._loop, self._resp.read(n))
+
+    def close(self) -> None:
+        _run(self._loop, self._resp.aclose())
+
+    def __enter__(self) -> BlockingResponse:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
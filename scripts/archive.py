@@ -0,0 +1,315 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
+
+# Columnar, compressed, append-only history of data/processed/<date>/<topic>/{items,shortlist}.jsonl.
+#
+#   data/archive/<YYYY-MM>.pca   column blobs appended back to back (never rewritten)
+#   data/archive/index.json      "<date>/<topic>/<kind>" -> file, rows, sha256 of the JSONL
+#                                 it mirrors, and per column: offset, length, encoding
+#
+# Column encodings (each blob is independently zlib-compressed, so a reader only touches
+# the columns it asks for):
+#   json  zlib(JSON array of values)
+#   dict  u32 n + zlib(JSON array of distinct values) [n bytes] + zlib(u32 codes)
+DICT_COLUMNS = {"source", "source_id", "fetched_at"}
+KINDS = ("items", "shortlist")
+_U32 = struct.Struct("<I")
+_MISSING = object()
+
+
+def _jsonl_bytes(rows: Iterable[dict[str, Any]]) -> bytes:
+    # same serialization as run_daily._write_jsonl, so hashes line up with the files on disk
+    return "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows).encode("utf-8")
+
+
+def _encode_json(values: list[Any]) -> bytes:
+    return zlib.compress(json.dumps(values, ensure_ascii=False).encode("utf-8"), 9)
+
+
+def _encode_dict(values: list[Any]) -> bytes:
+    codes_of: dict[str, int] = {}
+    distinct: list[Any] = []
+    codes = array("I")
+    for v in values:
+        key = json.dumps(v, ensure_ascii=False)
+        code = codes_of.get(key)
+        if code is None:
+            code = codes_of[key] = len(distinct)
+            distinct.append(v)
+        codes.append(code)
+    if sys.byteorder != "little":
+        codes.byteswap()
+    head = _encode_json(distinct)
+    return _U32.pack(len(head)) + head + zlib.compress(codes.tobytes(), 9)
+
+
+def _decode(encoding: str, blob: bytes) -> list[Any]:
+    if encoding == "json":
+        return json.loads(zlib.decompress(blob).decode("utf-8"))
+    if encoding == "dict":
+        (n,) = _U32.unpack_from(blob, 0)
+        distinct = json.loads(zlib.decompress(blob[_U32.size : _U32.size + n]).decode("utf-8"))
+        codes = array("I")
+        codes.frombytes(zlib.decompress(blob[_U32.size + n :]))
+        if sys.byteorder != "little":
+            codes.byteswap()
+        return [distinct[c] for c in codes]
+    raise ValueError(f"Unknown column encoding: {encoding}")
+
+
+class Archive:
+    def __init__(self, root: Path = Path("data/archive")) -> None:
+        self.root = Path(root)
+        self._index: dict[str, Any] | None = None
+
+    @property
+    def index_path(self) -> Path:
+        return self.root / "index.json"
+
+    def _load_index(self) -> dict[str, Any]:
+        if self._index is None:
+            if self.index_path.exists():
+                self._index = json.loads(self.index_path.read_text(encoding="utf-8"))
+            else:
+                self._index = {"version": 1, "segments": {}}
+        return self._index
+
+    def _save_index(self) -> None:
+        index = self._load_index()
+        self.root.mkdir(parents=True, exist_ok=True)
+        tmp = self.index_path.with_name(f"index.json.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(index, ensure_ascii=False, indent=1, sort_keys=True) + "\n", encoding="utf-8")
+        os.replace(tmp, self.index_path)
+
+    @staticmethod
+    def _key(date: str, topic: str, kind: str) -> str:
+        return f"{date}/{topic}/{kind}"
+
+    def segment(self, *, date: str, topic: str, kind: str) -> dict[str, Any] | None:
+        return self._load_index()["segments"].get(self._key(date, topic, kind))
+
+    def keys(self) -> list[tuple[str, str, str]]:
+        return sorted(tuple(k.split("/", 2)) for k in self._load_index()["segments"])  # type: ignore[misc]
+
+    def append(self, *, date: str, topic: str, kind: str, rows: list[dict[str, Any]]) -> bool:
+        """Archive one JSONL file's rows; a no-op (False) when the same content is already archived."""
+        columns: list[str] = []
+        for r in rows:
+            for k in r:
+                if k not in columns:
+                    columns.append(k)
+        sha = hashlib.sha256(_jsonl_bytes(rows)).hexdigest()
+        return self._append(
+            date=date,
+            topic=topic,
+            kind=kind,
+            sha=sha,
+            n_rows=len(rows),
+            columns=columns,
+            column=lambda name: [r.get(name, _MISSING) for r in rows],
+        )
+
+    def append_jsonl(self, *, date: str, topic: str, kind: str, path: Path) -> bool:
+        """append() straight from a JSONL file. An unchanged file is only hashed; otherwise it is
+        parsed once, spooling each column to a temporary file, and encoded one column at a time."""
+        h = hashlib.sha256()
+        n_rows = 0
+        with Path(path).open("rb") as f:
+            for raw in f:
+                if raw.strip():
+                    h.update(raw)
+                    n_rows += 1
+        sha = h.hexdigest()
+        prev = self.segment(date=date, topic=topic, kind=kind)
+        if prev is not None and prev.get("sha256") == sha:
+            return False
+        with tempfile.TemporaryDirectory(prefix="archive-") as tmp:
+            spools = _spool_columns(path, Path(tmp))
+            return self._append(
+                date=date,
+                topic=topic,
+                kind=kind,
+                sha=sha,
+                n_rows=n_rows,
+                columns=list(spools),
+                column=lambda name: _read_spool(spools[name], n_rows=n_rows),
+            )
+
+    def _append(
+        self,
+        *,
+        date: str,
+        topic: str,
+        kind: str,
+        sha: str,
+        n_rows: int,
+        columns: list[str],
+        column: Callable[[str], list[Any]],
+    ) -> bool:
+        prev = self.segment(date=date, topic=topic, kind=kind)
+        if prev is not None and prev.get("sha256") == sha:
+            return False
+
+        data_path = self.root / f"{date[:7]}.pca"
+        data_path.parent.mkdir(parents=True, exist_ok=True)
+        meta: dict[str, Any] = {"file": data_path.name, "rows": n_rows, "sha256": sha, "columns": {}}
+        with data_path.open("ab") as f:
+            offset = f.tell()
+            for name in columns:
+                values = column(name)
+                absent = [i for i, v in enumerate(values) if v is _MISSING]
+                values = [None if v is _MISSING else v for v in values]
+                encoding = "dict" if name in DICT_COLUMNS else "json"
+                blob = _encode_dict(values) if encoding == "dict" else _encode_json(values)
+                f.write(blob)
+                col: dict[str, Any] = {"offset": offset, "length": len(blob), "encoding": encoding}
+                if absent:
+                    col["absent"] = absent
+                meta["columns"][name] = col
+                offset += len(blob)
+        # column order is part of the row layout (dict key order), keep it explicit
+        meta["order"] = columns
+        self._load_index()["segments"][self._key(date, topic, kind)] = meta
+        self._save_index()
+        return True
+
+    def read(
+        self, *, date: str, topic: str, kind: str, columns: list[str] | None = None
+    ) -> list[dict[str, Any]] | None:
+        """Rows of one archived file, decoding only `columns` (all when None); None if not archived."""
+        meta = self.segment(date=date, topic=topic, kind=kind)
+        if meta is None:
+            return None
+        names = [c for c in meta["order"] if columns is None or c in columns]
+        decoded: dict[str, list[Any]] = {}
+        with (self.root / meta["file"]).open("rb") as f:
+            for name in names:
+                col = meta["columns"][name]
+                f.seek(col["offset"])
+                decoded[name] = _decode(col["encoding"], f.read(col["length"]))
+        absent = {name: set(meta["columns"][name].get("absent") or ()) for name in names}
+
+        rows: list[dict[str, Any]] = []
+        for i in range(int(meta["rows"])):
+            rows.append({name: decoded[name][i] for name in names if i not in absent[name]})
+        return rows
+
+
+def _iter_jsonl(path: Path) -> Iterator[tuple[bytes, dict[str, Any]]]:
+    """(line bytes, parsed row) for each non-blank line of a JSONL file."""
+    with Path(path).open("rb") as f:
+        for raw in f:
+            if raw.strip():
+                yield raw, json.loads(raw)
+
+
+def _spool_columns(path: Path, tmp: Path) -> dict[str, Path]:
+    """Column name -> file of `[row, value]` lines, in order of first appearance."""
+    spools: dict[str, Path] = {}
+    files: dict[str, BinaryIO] = {}
+    try:
+        for i, (_, row) in enumerate(_iter_jsonl(path)):
+            for name, value in row.items():
+                f = files.get(name)
+                if f is None:
+                    spools[name] = tmp / f"{len(spools)}.jsonl"
+                    f = files[name] = spools[name].open("wb")
+                f.write(json.dumps([i, value], ensure_ascii=False).encode("utf-8") + b"\n")
+    finally:
+        for f in files.values():
+            f.close()
+    return spools
+
+
+def _read_spool(path: Path, *, n_rows: int) -> list[Any]:
+    # rows lacking the column stay _MISSING
+    values: list[Any] = [_MISSING] * n_rows
+    with path.open("rb") as f:
+        for line in f:
+            i, value = json.loads(line)
+            values[i] = value
+    return values
+
+
+def convert(archive: Archive, *, processed: Path) -> int:
+    """Archive every existing data/processed/<date>/<topic>/{items,shortlist}.jsonl."""
+    n = 0
+    for date_dir in sorted(p for p in processed.iterdir() if p.is_dir()):
+        for topic_dir in sorted(p for p in date_dir.iterdir() if p.is_dir()):
+            for kind in KINDS:
+                path = topic_dir / f"{kind}.jsonl"
+                if path.exists() and archive.append_jsonl(
+                    date=date_dir.name, topic=topic_dir.name, kind=kind, path=path
+                ):
+                    n += 1
+    return n
+
+
+def prune_jsonl(archive: Archive, *, processed: Path, keep_days: int) -> int:
+    """Delete archived JSONL files older than the newest `keep_days` dates, once verified byte-identical."""
+    dates = sorted((p.name for p in processed.iterdir() if p.is_dir()), reverse=True)
+    removed = 0
+    for date in dates[keep_days:]:
+        for topic_dir in sorted(p for p in (processed / date).iterdir() if p.is_dir()):
+            for kind in KINDS:
+                path = topic_dir / f"{kind}.jsonl"
+                if not path.exists():
+                    continue
+                rows = archive.read(date=date, topic=topic_dir.name, kind=kind)
+                if rows is None or _jsonl_bytes(rows) != path.read_bytes():
+                    print(f"KEEP: {path} (not archived or archive differs)", file=sys.stderr)
+                    continue
+                path.unlink()
+                removed += 1
+    return removed
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Columnar archive of data/processed history (data/archive/).")
+    p.add_argument("--root", default="data/archive")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    c = sub.add_parser("convert", help="Archive all existing items/shortlist JSONL files")
+    c.add_argument("--processed", default="data/processed")
+
+    r = sub.add_parser("cat", help="Print one archived file as JSONL")
+    r.add_argument("--date", required=True)
+    r.add_argument("--topic", required=True)
+    r.add_argument("--kind", choices=KINDS, default="items")
+    r.add_argument("--columns", default="", help="Comma-separated column subset, e.g. title,url")
+
+    pr = sub.add_parser("prune-jsonl", help="Drop archived JSONL files outside the newest N dates")
+    pr.add_argument("--processed", default="data/processed")
+    pr.add_argument("--keep-days", type=int, default=30)
+    args = p.parse_args()
+
+    archive = Archive(Path(args.root))
+    if args.cmd == "convert":
+        print(f"OK: archived {convert(archive, processed=Path(args.processed))} files -> {archive.root}")
+    elif args.cmd == "cat":
+        cols = [c.strip() for c in args.columns.split(",") if c.strip()] or None
+        rows = archive.read(date=args.date, topic=args.topic, kind=args.kind, columns=cols)
+        if rows is None:
+            print(f"ERROR: not archived: {args.date}/{args.topic}/{args.kind}", file=sys.stderr)
+            return 1
+        sys.stdout.write(_jsonl_bytes(rows).decode("utf-8"))
+    elif args.cmd == "prune-jsonl":
+        n = prune_jsonl(archive, processed=Path(args.processed), keep_days=args.keep_days)
+        print(f"OK: removed {n} archived JSONL files")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
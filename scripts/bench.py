@@ -0,0 +1,451 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import dataclass
+from html import escape
+from pathlib import Path
+from typing import Any, Callable, Iterator
+
+# NOTE: runnable as `python scripts/bench.py`; sibling modules are imported directly (before
+# any chdir, since build_board works on paths relative to the current directory).
+import build_board  # type: ignore
+from rank import Ranker, RankingConfig, TopK  # type: ignore
+from sources import _matches_keywords, collect_arxiv, collect_rss  # type: ignore
+from text import build_digest_markdown  # type: ignore
+
+# Offline benchmarks on synthetic data. `run` times each case (best of --repeat) and, in one
+# extra pass under tracemalloc, its peak Python heap; `compare` re-runs (or loads --current)
+# and flags cases slower / hungrier than the baseline by more than --threshold.
+
+INCLUDE = ["ultrasound", "medical imaging", "diffusion model", "segmentation", "re:\\bLLMs?\\b", "CT"]
+EXCLUDE = ["retracted", "erratum"]
+_HITS = ["ultrasound", "medical imaging", "diffusion models", "LLM", "CT scans", "segmentation"]
+_WORDS = (
+    "learning network model data method results approach performance training task robust "
+    "efficient graph language vision benchmark transformer sparse latent policy signal"
+).split()
+
+
+@dataclass(frozen=True)
+class Params:
+    entries: int
+    density: float
+    days: int
+    topics: int
+    items: int
+    texts: int
+    seed: int
+
+
+# --- synthetic data -------------------------------------------------------------------------
+
+
+def _sentence(rng: random.Random, n: int, *, hit: bool, excluded: bool = False) -> str:
+    words = [rng.choice(_WORDS) for _ in range(n)]
+    if hit:
+        words.insert(rng.randrange(len(words) + 1), rng.choice(_HITS))
+    if excluded:
+        words.insert(0, rng.choice(EXCLUDE))
+    return " ".join(words)
+
+
+def _entry_texts(rng: random.Random, *, density: float) -> tuple[str, str]:
+    hit = rng.random() < density
+    # ~1 in 10 matching entries also carries an exclude keyword
+    excluded = hit and rng.random() < 0.1
+    title = _sentence(rng, 8, hit=hit and rng.random() < 0.5, excluded=excluded)
+    summary = _sentence(rng, 120, hit=hit)
+    return title.capitalize(), summary
+
+
+def synth_arxiv(n: int, *, density: float, seed: int = 0) -> bytes:
+    """arXiv API response (Atom + arxiv namespace) with `n` entries, newest first."""
+    rng = random.Random(seed)
+    start = dt.datetime(2026, 1, 1, tzinfo=dt.timezone.utc)
+    out = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<feed xmlns="http://www.w3.org/2005/Atom" xmlns:arxiv="http://arxiv.org/schemas/atom">\n'
+        "<title>ArXiv Query: synthetic</title>\n"
+    ]
+    for i in range(n):
+        title, summary = _entry_texts(rng, density=density)
+        stamp = (start - dt.timedelta(minutes=i)).strftime("%Y-%m-%dT%H:%M:%SZ")
+        authors = "".join(f"<author><name>Author {rng.randrange(10_000)}</name></author>" for _ in range(4))
+        out.append(
+            f"<entry><id>http://arxiv.org/abs/2601.{i:05d}v1</id><updated>{stamp}</updated>"
+            f"<published>{stamp}</published><title>{escape(title)}</title><summary>{escape(summary)}</summary>"
+            f'{authors}<link href="http://arxiv.org/abs/2601.{i:05d}v1" rel="alternate" type="text/html"/>'
+            f'<link title="pdf" href="http://arxiv.org/pdf/2601.{i:05d}v1" rel="related" type="application/pdf"/>'
+            '<arxiv:primary_category term="cs.CV"/></entry>\n'
+        )
+    out.append("</feed>\n")
+    return "".join(out).encode("utf-8")
+
+
+def synth_rss(n: int, *, density: float, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    out = ['<?xml version="1.0" encoding="UTF-8"?>\n<rss version="2.0"><channel><title>synthetic</title>\n']
+    for i in range(n):
+        title, summary = _entry_texts(rng, density=density)
+        out.append(
+            f"<item><title>{escape(title)}</title><link>https://example.com/posts/{i}</link>"
+            f"<description>{escape(summary)}</description><pubDate>Thu, 01 Jan 2026 00:00:00 GMT</pubDate>"
+            f"<guid>https://example.com/posts/{i}</guid></item>\n"
+        )
+    out.append("</channel></rss>\n")
+    return "".join(out).encode("utf-8")
+
+
+def synth_atom(n: int, *, density: float, seed: int = 0) -> bytes:
+    rng = random.Random(seed)
+    out = ['<?xml version="1.0" encoding="UTF-8"?>\n<feed xmlns="http://www.w3.org/2005/Atom"><title>synthetic</title>\n']
+    for i in range(n):
+        title, summary = _entry_texts(rng, density=density)
+        out.append(
+            f"<entry><title>{escape(title)}</title><id>urn:synthetic:{i}</id>"
+            f'<link rel="alternate" href="https://example.org/{i}"/><updated>2026-01-01T00:00:00Z</updated>'
+            f"<summary>{escape(summary)}</summary></entry>\n"
+        )
+    out.append("</feed>\n")
+    return "".join(out).encode("utf-8")
+
+
+def synth_items(n: int, *, density: float, seed: int = 0, source_id: str = "synthetic") -> list[dict[str, Any]]:
+    rng = random.Random(seed)
+    items = []
+    for i in range(n):
+        title, summary = _entry_texts(rng, density=density)
+        items.append(
+            {
+                "source": "rss",
+                "source_id": source_id,
+                "title": title,
+                "summary": summary,
+                "url": f"https://example.com/{source_id}/{i}",
+                "published": "2026-01-01T00:00:00Z",
+                "authors": [],
+                "fetched_at": "2026-01-01T00:30:00+00:00",
+            }
+        )
+    return items
+
+
+def synth_history(root: Path, *, days: int, topics: int, items: int, seed: int = 0) -> None:
+    """topics/*.toml plus data/processed/<date>/<topic>/{items,shortlist}.jsonl + digest.md under `root`."""
+    (root / "topics").mkdir(parents=True, exist_ok=True)
+    end = dt.date(2026, 1, 31)
+    for t in range(topics):
+        topic_id = f"topic_{t:02d}"
+        (root / "topics" / f"{topic_id}.toml").write_text(
+            f'[meta]\nid = "{topic_id}"\ntitle = "Synthetic topic {t}"\n', encoding="utf-8"
+        )
+        for d in range(days):
+            date = (end - dt.timedelta(days=d)).isoformat()
+            rows = synth_items(items, density=1.0, seed=seed + t * 10_000 + d, source_id=topic_id)
+            out = root / "data" / "processed" / date / topic_id
+            out.mkdir(parents=True, exist_ok=True)
+            lines = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows)
+            (out / "items.jsonl").write_text(lines, encoding="utf-8")
+            shortlist = rows[:8]
+            (out / "shortlist.jsonl").write_text(
+                "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in shortlist), encoding="utf-8"
+            )
+            (out / "digest.md").write_text(
+                build_digest_markdown(topic_title=f"Synthetic topic {t}", date=date, items=shortlist), encoding="utf-8"
+            )
+
+
+# --- cases ----------------------------------------------------------------------------------
+
+
+@contextmanager
+def _chdir(path: Path) -> Iterator[None]:
+    prev = Path.cwd()
+    os.chdir(path)
+    try:
+        yield
+    finally:
+        os.chdir(prev)
+
+
+# name -> setup(params, workdir) returning (fn, ops, unit); fn is what gets timed
+Case = Callable[[Params, Path], tuple[Callable[[], Any], int, str]]
+
+
+def _case_collect_arxiv(p: Params, work: Path) -> tuple[Callable[[], Any], int, str]:
+    fixture = work / "arxiv.atom.xml"
+    fixture.write_bytes(synth_arxiv(p.entries, density=p.density, seed=p.seed))
+    source = {
+        "id": "bench_arxiv",
+        "kind": "arxiv",
+        "query": "cat:cs.CV",
+        "page_size": p.entries,
+        "include_keywords": INCLUDE,
+        "exclude_keywords": EXCLUDE,
+        "offline": "1",
+        "fixture_path": str(fixture),
+    }
+    return (lambda: collect_arxiv(source=source, raw_dir=work / "raw")), p.entries, "entries"
+
+
+def _rss_case(kind: str, synth: Callable[..., bytes]) -> Case:
+    def case(p: Params, work: Path) -> tuple[Callable[[], Any], int, str]:
+        feed = work / f"{kind}.xml"
+        feed.write_bytes(synth(p.entries, density=p.density, seed=p.seed))
+        source = {
+            "id": f"bench_{kind}",
+            "kind": "rss",
+            "url": f"file://{feed}",
+            "max_results": p.entries,
+            "include_keywords": INCLUDE,
+            "exclude_keywords": EXCLUDE,
+        }
+        return (lambda: collect_rss(source=source, raw_dir=work / "raw")), p.entries, "entries"
+
+    return case
+
+
+def _case_keywords(p: Params, work: Path) -> tuple[Callable[[], Any], int, str]:
+    texts = [f"{it['title']}\n{it['summary']}" for it in synth_items(p.texts, density=p.density, seed=p.seed)]
+
+    def run() -> int:
+        return sum(_matches_keywords(text=t, include=INCLUDE, exclude=EXCLUDE) for t in texts)
+
+    return run, len(texts), "texts"
+
+
+def _case_digest(p: Params, work: Path) -> tuple[Callable[[], Any], int, str]:
+    items = synth_items(p.entries, density=p.density, seed=p.seed)
+    return (lambda: build_digest_markdown(topic_title="Bench", date="2026-01-01", items=items)), len(items), "items"
+
+
+def _case_rank(p: Params, work: Path) -> tuple[Callable[[], Any], int, str]:
+    items = synth_items(p.entries, density=p.density, seed=p.seed)
+    for i, it in enumerate(items):
+        it["published"] = f"2026-01-{1 + i % 28:02d}T00:00:00Z"
+    cfg = RankingConfig(
+        keyword_weights={kw: 1.0 + i % 3 for i, kw in enumerate(INCLUDE)},
+        recency_weight=2.0,
+        duplicate_penalty=5.0,
+    )
+    ranker = Ranker(cfg, sources=[])
+
+    def run() -> Any:
+        # as run_daily merges a topic: score each item as it arrives, keep the best in a bounded heap
+        score_item = ranker.scorer(date="2026-01-28")
+        best = TopK(8)
+        for i, it in enumerate(items):
+            best.push(score_item(it), i)
+        return best.ranked()
+
+    return run, len(items), "items"
+
+
+def _board_root(p: Params, work: Path) -> Path:
+    root = work / "board"
+    if not root.exists():
+        synth_history(root, days=p.days, topics=p.topics, items=p.items, seed=p.seed)
+    return root
+
+
+def _case_board_full(p: Params, work: Path) -> tuple[Callable[[], Any], int, str]:
+    root = _board_root(p, work)
+
+    def run() -> Any:
+        with _chdir(root):
+            return build_board.build_board(max_days=p.days, full=True)
+
+    return run, p.days * p.topics, "digests"
+
+
+def _case_board_noop(p: Params, work: Path) -> tuple[Callable[[], Any], int, str]:
+    # incremental rebuild with nothing changed (the daily-CI common case)
+    root = _board_root(p, work)
+    with _chdir(root):
+        build_board.build_board(max_days=p.days)
+
+    def run() -> Any:
+        with _chdir(root):
+            return build_board.build_board(max_days=p.days)
+
+    return run, p.days * p.topics, "digests"
+
+
+CASES: dict[str, Case] = {
+    "collect_arxiv": _case_collect_arxiv,
+    "collect_rss.rss": _rss_case("rss", synth_rss),
+    "collect_rss.atom": _rss_case("atom", synth_atom),
+    "matches_keywords": _case_keywords,
+    "build_digest_markdown": _case_digest,
+    "rank": _case_rank,
+    "build_board.full": _case_board_full,
+    "build_board.noop": _case_board_noop,
+}
+
+
+def _quiet(fn: Callable[[], Any]) -> Callable[[], Any]:
+    # collectors/build_board may print progress; keep the report readable
+    def run() -> Any:
+        stdout = sys.stdout
+        with open(os.devnull, "w") as devnull:
+            sys.stdout = devnull
+            try:
+                return fn()
+            finally:
+                sys.stdout = stdout
+
+    return run
+
+
+def run_cases(params: Params, *, names: list[str], repeat: int) -> dict[str, Any]:
+    results: dict[str, Any] = {}
+    with tempfile.TemporaryDirectory(prefix="postcast-bench-") as tmp:
+        work = Path(tmp)
+        for name in names:
+            fn, ops, unit = CASES[name](params, work)
+            fn = _quiet(fn)
+            fn()  # warm-up (imports, regex compilation, page cache)
+            times = []
+            for _ in range(max(1, repeat)):
+                t0 = time.perf_counter()
+                fn()
+                times.append(time.perf_counter() - t0)
+            tracemalloc.start()
+            try:
+                fn()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+            best = min(times)
+            results[name] = {
+                "seconds": round(best, 6),
+                "ops": ops,
+                "unit": unit,
+                "per_second": round(ops / best, 1) if best > 0 else None,
+                "peak_mb": round(peak / (1024 * 1024), 3),
+            }
+            print(
+                f"{name:<24} {best * 1000:10.2f} ms  {results[name]['per_second'] or 0:>12,.0f} {unit}/s"
+                f"  peak {results[name]['peak_mb']:8.2f} MB",
+                file=sys.stderr,
+            )
+    return {
+        "version": 1,
+        "created_at": dt.datetime.now(tz=dt.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "params": params.__dict__,
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict[str, Any], current: dict[str, Any], *, threshold: float, min_delta: float = 0.005
+) -> list[str]:
+    """Human-readable regressions: cases slower, or with a higher peak, than baseline * (1 + threshold).
+
+    Slowdowns under `min_delta` seconds are timer noise on the small cases and are not flagged.
+    """
+    if baseline.get("params") != current.get("params"):
+        print("WARN: benchmark params differ from the baseline; ratios are not comparable", file=sys.stderr)
+    regressions: list[str] = []
+    for name, cur in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None:
+            print(f"{name:<24} (new)", file=sys.stderr)
+            continue
+        t_ratio = cur["seconds"] / base["seconds"] if base["seconds"] else 1.0
+        m_ratio = cur["peak_mb"] / base["peak_mb"] if base["peak_mb"] else 1.0
+        flags = []
+        if t_ratio > 1 + threshold and cur["seconds"] - base["seconds"] > min_delta:
+            flags.append(f"time x{t_ratio:.2f}")
+        if m_ratio > 1 + threshold and cur["peak_mb"] - base["peak_mb"] > 0.1:
+            flags.append(f"peak x{m_ratio:.2f}")
+        print(
+            f"{name:<24} time x{t_ratio:5.2f}  peak x{m_ratio:5.2f}  {'REGRESSION: ' + ', '.join(flags) if flags else 'ok'}",
+            file=sys.stderr,
+        )
+        if flags:
+            regressions.append(f"{name}: {', '.join(flags)}")
+    return regressions
+
+
+def _write_json(path: Path, data: dict[str, Any]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Offline benchmarks on synthetic feeds and board histories.")
+    sub = p.add_subparsers(dest="cmd", required=True)
+    for name in ("run", "compare"):
+        c = sub.add_parser(name)
+        c.add_argument("--entries", type=int, default=2000, help="Entries per synthetic feed / digest items.")
+        c.add_argument("--density", type=float, default=0.3, help="Fraction of entries containing an include keyword.")
+        c.add_argument("--days", type=int, default=60, help="Days of synthetic data/processed history.")
+        c.add_argument("--topics", type=int, default=5)
+        c.add_argument("--items", type=int, default=50, help="Items per topic per day in the history.")
+        c.add_argument("--texts", type=int, default=20000, help="Texts for the keyword matcher case.")
+        c.add_argument("--seed", type=int, default=0)
+        c.add_argument("--repeat", type=int, default=3)
+        c.add_argument("--only", action="append", default=[], choices=sorted(CASES), help="Run only these cases.")
+    sub.choices["run"].add_argument("--out", default="data/bench/baseline.json")
+    cmp_ = sub.choices["compare"]
+    cmp_.add_argument("--baseline", default="data/bench/baseline.json")
+    cmp_.add_argument("--current", default="", help="Compare this results file instead of running now.")
+    cmp_.add_argument("--out", default="", help="Also save the fresh results here.")
+    cmp_.add_argument("--threshold", type=float, default=0.15, help="Allowed slowdown / peak growth (0.15 = 15%%).")
+    cmp_.add_argument("--min-delta-ms", type=float, default=5.0, help="Ignore slowdowns smaller than this.")
+    args = p.parse_args()
+
+    params = Params(
+        entries=args.entries,
+        density=args.density,
+        days=args.days,
+        topics=args.topics,
+        items=args.items,
+        texts=args.texts,
+        seed=args.seed,
+    )
+    names = args.only or list(CASES)
+
+    if args.cmd == "run":
+        results = run_cases(params, names=names, repeat=args.repeat)
+        _write_json(Path(args.out), results)
+        print(f"OK: {args.out}")
+        return 0
+
+    baseline_path = Path(args.baseline)
+    if not baseline_path.exists():
+        print(f"ERROR: baseline not found: {baseline_path} (create one with `bench.py run`)", file=sys.stderr)
+        return 2
+    baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+    if args.current:
+        current = json.loads(Path(args.current).read_text(encoding="utf-8"))
+    else:
+        if not args.only:
+            names = [n for n in CASES if n in baseline.get("results", {})] or names
+        current = run_cases(Params(**baseline["params"]) if baseline.get("params") else params, names=names, repeat=args.repeat)
+        if args.out:
+            _write_json(Path(args.out), current)
+    regressions = compare(baseline, current, threshold=args.threshold, min_delta=args.min_delta_ms / 1000)
+    if regressions:
+        print(f"FAIL: {len(regressions)} regression(s)")
+        return 1
+    print("OK: no regressions")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -2,8 +2,11 @@
 from __future__ import annotations
 
 import argparse
+import gzip
+import hashlib
 import html
 import json
+import os
 import re
 import shutil
 from dataclasses import dataclass
@@ -11,6 +14,10 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+# NOTE: runnable as `python scripts/build_board.py`; sibling modules are imported directly.
+import topic_registry  # type: ignore
+from archive import Archive  # type: ignore
+
 
 @dataclass(frozen=True)
 class DigestEntry:
@@ -19,7 +26,9 @@ class DigestEntry:
     topic_title: str
     digest_path: str
     shortlist_path: str
+    # top rows only (enough for the board); `count` is the full shortlist length
     items: list[dict[str, Any]]
+    count: int
 
 
 def _read_jsonl(path: Path) -> list[dict[str, Any]]:
@@ -37,24 +46,55 @@ def _read_jsonl(path: Path) -> list[dict[str, Any]]:
     return out
 
 
-def _guess_topic_title(topic_id: str) -> str:
-    cfg = Path("topics") / f"{topic_id}.toml"
-    if not cfg.exists():
-        return topic_id
+def _file_sig(path: Path, prev: dict[str, Any] | None) -> dict[str, Any] | None:
+    """size/mtime/sha256 of `path`; reuses `prev` (and anything cached in it) when size+mtime match."""
     try:
-        text = cfg.read_text(encoding="utf-8", errors="ignore")
-        m = re.search(r'^\s*title\s*=\s*"([^"]+)"\s*$', text, flags=re.MULTILINE)
-        if m:
-            return m.group(1).strip()
-    except Exception:
-        pass
-    return topic_id
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    if prev and prev.get("size") == st.st_size and prev.get("mtime_ns") == st.st_mtime_ns and prev.get("sha256"):
+        return prev
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            h.update(chunk)
+    return {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": h.hexdigest()}
+
+
+def _shortlist_summary(
+    path: Path, sig: dict[str, Any] | None, *, archive: Archive, date: str, topic_id: str
+) -> dict[str, Any]:
+    """count + top rows of a shortlist, cached in its manifest signature so unchanged files are not re-parsed.
+
+    Prefers the columnar archive (title/url columns only) when it holds the same content, and
+    falls back to it when the JSONL file was pruned.
+    """
+    if sig is not None and "summary" in sig:
+        return sig["summary"]
+    segment = archive.segment(date=date, topic=topic_id, kind="shortlist")
+    if segment is not None and (sig is None or segment.get("sha256") == sig.get("sha256")):
+        items = archive.read(date=date, topic=topic_id, kind="shortlist", columns=["title", "url"]) or []
+    else:
+        items = _read_jsonl(path)
+    summary = {
+        "count": len(items),
+        "top": [{"title": it.get("title") or "", "url": it.get("url") or ""} for it in items[:3]],
+    }
+    if sig is not None:
+        sig["summary"] = summary
+    return summary
 
 
-def _collect_digests(*, max_days: int) -> list[DigestEntry]:
+def _collect_digests(
+    *, max_days: int, prev_files: dict[str, Any] | None = None, files: dict[str, Any] | None = None
+) -> list[DigestEntry]:
+    """Scan data/processed; `files` receives the signature of every digest/shortlist/items file seen."""
     base = Path("data/processed")
     if not base.exists():
         return []
+    prev_files = prev_files if prev_files is not None else {}
+    files = files if files is not None else {}
+    archive = Archive()
 
     dates = sorted([p.name for p in base.iterdir() if p.is_dir()], reverse=True)
     dates = dates[:max_days]
@@ -68,14 +108,22 @@ def _collect_digests(*, max_days: int) -> list[DigestEntry]:
             shortlist = topic_dir / "shortlist.jsonl"
             if not digest.exists() and not shortlist.exists():
                 continue
+            for p in (digest, shortlist, topic_dir / "items.jsonl"):
+                sig = _file_sig(p, prev_files.get(str(p)))
+                if sig is not None:
+                    files[str(p)] = sig
+            summary = _shortlist_summary(
+                shortlist, files.get(str(shortlist)), archive=archive, date=d, topic_id=topic_id
+            )
             entries.append(
                 DigestEntry(
                     date=d,
                     topic_id=topic_id,
-                    topic_title=_guess_topic_title(topic_id),
+                    topic_title=topic_registry.topic_title(topic_id),
                     digest_path=str(digest),
                     shortlist_path=str(shortlist),
-                    items=_read_jsonl(shortlist),
+                    items=summary["top"],
+                    count=summary["count"],
                 )
             )
     return entries
@@ -123,9 +171,21 @@ def _board_artifacts_root() -> Path:
     return Path("docs/board-data/processed")
 
 
-def _sync_board_artifacts(entries: list[DigestEntry], *, keep_dates: set[str]) -> None:
+def _sync_board_artifacts(
+    entries: list[DigestEntry],
+    *,
+    keep_dates: set[str],
+    files: dict[str, Any] | None = None,
+    prev_files: dict[str, Any] | None = None,
+) -> bool:
+    """Mirror digests/shortlists/items into docs/board-data; only files whose hash changed are copied.
+
+    Without signatures (`files` is None) everything is copied. Returns True if anything changed.
+    """
     root = _board_artifacts_root()
     root.mkdir(parents=True, exist_ok=True)
+    prev_files = prev_files or {}
+    changed = False
 
     # prune old dates
     for p in root.iterdir():
@@ -133,24 +193,28 @@ def _sync_board_artifacts(entries: list[DigestEntry], *, keep_dates: set[str]) -
             continue
         if p.name not in keep_dates:
             shutil.rmtree(p, ignore_errors=True)
+            changed = True
 
     # copy current artifacts
     for e in entries:
         dest_dir = root / e.date / e.topic_id
         dest_dir.mkdir(parents=True, exist_ok=True)
 
-        src_digest = Path(e.digest_path)
-        if src_digest.exists():
-            shutil.copyfile(src_digest, dest_dir / "digest.md")
-
-        src_shortlist = Path(e.shortlist_path)
-        if src_shortlist.exists():
-            shutil.copyfile(src_shortlist, dest_dir / "shortlist.jsonl")
-
-        # Optional but useful for debugging: all items
-        src_items = Path("data/processed") / e.date / e.topic_id / "items.jsonl"
-        if src_items.exists():
-            shutil.copyfile(src_items, dest_dir / "items.jsonl")
+        # items.jsonl is optional but useful for debugging
+        src_dir = Path("data/processed") / e.date / e.topic_id
+        for name in ("digest.md", "shortlist.jsonl", "items.jsonl"):
+            src = src_dir / name
+            if not src.exists():
+                continue
+            dest = dest_dir / name
+            if files is not None and dest.exists():
+                new_sig = files.get(str(src)) or {}
+                old_sig = prev_files.get(str(src)) or {}
+                if new_sig.get("sha256") and new_sig.get("sha256") == old_sig.get("sha256"):
+                    continue
+            shutil.copyfile(src, dest)
+            changed = True
+    return changed
 
 
 def _write_board_data_indexes(*, keep_dates: set[str]) -> None:
@@ -213,56 +277,186 @@ def _write_board_data_indexes(*, keep_dates: set[str]) -> None:
     )
 
 
-def _render_digests(entries: list[DigestEntry]) -> str:
-    if not entries:
-        return "<div class=\"card\"><div class=\"muted\">暂无 digest 产物。</div></div>"
+def _chunks_root() -> Path:
+    return Path("docs/board-data/chunks")
+
+
+def _dumps_min(data: Any) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+
+def _digest_chunks(entries: list[DigestEntry]) -> tuple[dict[str, Any], dict[str, bytes]]:
+    """(chunk index for the board page, {chunk file name: body}).
+
+    One chunk per date/topic holding its top rows, as a JSONP call so it also loads from
+    file://. File names carry a hash of the body, so a chunk never changes once written.
+    The index has one `[date, count, hash, flags]` row per chunk (flags: 1 digest, 2 shortlist),
+    grouped by topic, newest first; the chunk file is `<date>.<topic>.<hash>.js`.
+    """
+    chunks: dict[str, bytes] = {}
+    topics: dict[str, dict[str, Any]] = {}
+    for e in sorted(entries, key=lambda x: (x.topic_id, x.date), reverse=True):
+        key = f"{e.date}/{e.topic_id}"
+        top = [
+            {"title": (it.get("title") or "").strip().replace("\n", " "), "url": (it.get("url") or "").strip()}
+            for it in e.items[:3]
+        ]
+        body = f"zonBoardChunk({_dumps_min(key)},{_dumps_min({'top': top})});\n".encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()[:12]
+        chunks[f"{e.date}.{e.topic_id}.{digest}.js"] = body
+        flags = (1 if Path(e.digest_path).exists() else 0) | (2 if Path(e.shortlist_path).exists() else 0)
+        topic = topics.setdefault(e.topic_id, {"id": e.topic_id, "title": e.topic_title, "rows": []})
+        topic["rows"].append([e.date, e.count, digest, flags])
+    index = {
+        "base": "../board-data/chunks/",
+        "repo": _repo_origin_http() or "",
+        "topics": sorted(topics.values(), key=lambda t: t["id"]),
+    }
+    return index, chunks
 
-    repo_http = _repo_origin_http()
 
-    # group by topic
-    by_topic: dict[str, list[DigestEntry]] = {}
-    for e in entries:
-        by_topic.setdefault(e.topic_id, []).append(e)
-
-    parts: list[str] = []
-    for topic_id, items in sorted(by_topic.items(), key=lambda x: x[0]):
-        topic_title = items[0].topic_title
-        parts.append("<details open>")
-        parts.append(f"<summary><b>{_h(topic_title)}</b> <span class=\"muted\">({topic_id})</span></summary>")
-        parts.append("<div style=\"margin-top:10px\">")
-        parts.append("<table class=\"table\">")
-        parts.append("<thead><tr><th>Date</th><th>Count</th><th>Open</th><th>Top</th></tr></thead>")
-        parts.append("<tbody>")
-        for e in sorted(items, key=lambda x: x.date, reverse=True):
-            count = len(e.items)
-            open_links = []
-            local_dir = f"../board-data/processed/{_h(e.date)}/{_h(e.topic_id)}"
-            if Path(e.digest_path).exists():
-                open_links.append(f"<a href=\"{local_dir}/digest.md\">digest</a>")
-            if Path(e.shortlist_path).exists():
-                open_links.append(f"<a href=\"{local_dir}/shortlist.jsonl\">shortlist</a>")
-            if repo_http:
-                gh_base = f"{repo_http}/blob/main"
-                if Path(e.digest_path).exists():
-                    open_links.append(f"<a href=\"{_h(gh_base)}/data/processed/{_h(e.date)}/{_h(e.topic_id)}/digest.md\" target=\"_blank\" rel=\"noreferrer\">github</a>")
-            top_titles = []
-            for it in e.items[:3]:
-                t = (it.get("title") or "").strip().replace("\n", " ")
-                u = (it.get("url") or "").strip()
-                if t and u:
-                    top_titles.append(f"<a href=\"{_h(u)}\" target=\"_blank\" rel=\"noreferrer\">{_h(t)}</a>")
-                elif t:
-                    top_titles.append(_h(t))
-            parts.append(
-                "<tr>"
-                f"<td>{_h(e.date)}</td>"
-                f"<td>{count}</td>"
-                f"<td>{' · '.join(open_links) if open_links else ''}</td>"
-                f"<td>{'<br />'.join(top_titles) if top_titles else '<span class=\"muted\">(empty)</span>'}</td>"
-                "</tr>"
-            )
-        parts.append("</tbody></table></div></details>")
-    return "\n".join(parts)
+_CHUNK_INDEX_PREFIX = "window.zonBoardChunks="
+
+
+def _referenced_chunks(boards_dir: Path) -> set[str]:
+    """Chunk file names the `board-*.data.js` pages in `boards_dir` still load."""
+    names: set[str] = set()
+    for path in boards_dir.glob("board-*.data.js"):
+        try:
+            lines = path.read_text(encoding="utf-8").splitlines()
+        except OSError:
+            continue
+        for line in lines:
+            if not line.startswith(_CHUNK_INDEX_PREFIX):
+                continue
+            try:
+                index = json.loads(line[len(_CHUNK_INDEX_PREFIX) :].rstrip(";"))
+            except ValueError:
+                continue
+            for topic in index.get("topics") or []:
+                for row in topic.get("rows") or []:
+                    names.add(f"{row[0]}.{topic.get('id')}.{row[2]}.js")
+    return names
+
+
+def _write_chunks(chunks: dict[str, bytes], *, gzip_chunks: bool, boards_dir: Path) -> None:
+    """Write missing chunks (plus `.gz` siblings with `gzip_chunks`) and delete the files that
+    neither this build nor any board page kept in `boards_dir` references."""
+    root = _chunks_root()
+    root.mkdir(parents=True, exist_ok=True)
+    keep = _referenced_chunks(boards_dir)
+    keep |= {f"{name}.gz" for name in keep}
+    for name, body in chunks.items():
+        keep.add(name)
+        path = root / name
+        if not path.exists():
+            tmp = path.with_name(f"{name}.{os.getpid()}.tmp")
+            tmp.write_bytes(body)
+            os.replace(tmp, path)
+        if gzip_chunks:
+            keep.add(f"{name}.gz")
+            gz = root / f"{name}.gz"
+            if not gz.exists():
+                # mtime=0: identical bytes on every build, so the .gz does not churn in git
+                gz.write_bytes(gzip.compress(body, compresslevel=9, mtime=0))
+    for p in root.iterdir():
+        if p.name not in keep:
+            p.unlink(missing_ok=True)
+
+
+# Renders the Digests block from window.zonBoardChunks once zon-report.js has rendered the page;
+# each row's chunk is loaded when the row scrolls into view (all at once without IntersectionObserver).
+_DIGESTS_LOADER_JS = r"""
+(function () {
+  var idx = window.zonBoardChunks;
+  if (!idx) return;
+  var waiting = {};
+  var loaded = {};
+  window.zonBoardChunk = function (key, data) {
+    loaded[key] = data;
+    (waiting[key] || []).forEach(function (cb) { cb(data); });
+    delete waiting[key];
+  };
+  function esc(s) {
+    return String(s == null ? "" : s).replace(/[&<>"']/g, function (c) {
+      return { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[c];
+    });
+  }
+  function load(e, cb) {
+    var key = e.date + "/" + e.topic;
+    if (key in loaded) return cb(loaded[key]);
+    if (waiting[key]) return waiting[key].push(cb);
+    waiting[key] = [cb];
+    var s = document.createElement("script");
+    s.src = idx.base + e.date + "." + e.topic + "." + e.hash + ".js";
+    s.async = true;
+    s.onerror = function () { window.zonBoardChunk(key, null); };
+    document.head.appendChild(s);
+  }
+  function fill(cell, e) {
+    load(e, function (data) {
+      if (!data) { cell.innerHTML = '<span class="muted">(missing)</span>'; return; }
+      var top = (data.top || []).map(function (it) {
+        if (!it.title || !it.url) return esc(it.title);
+        return '<a href="' + esc(it.url) + '" target="_blank" rel="noreferrer">' + esc(it.title) + "</a>";
+      }).filter(Boolean);
+      cell.innerHTML = top.length ? top.join("<br />") : '<span class="muted">(empty)</span>';
+    });
+  }
+  function row(e, i) {
+    var dir = "../board-data/processed/" + esc(e.date) + "/" + esc(e.topic);
+    var open = [];
+    if (e.flags & 1) open.push('<a href="' + dir + '/digest.md">digest</a>');
+    if (e.flags & 2) open.push('<a href="' + dir + '/shortlist.jsonl">shortlist</a>');
+    if (idx.repo && e.flags & 1) {
+      open.push('<a href="' + esc(idx.repo) + "/blob/main/data/processed/" + esc(e.date) + "/" + esc(e.topic) +
+        '/digest.md" target="_blank" rel="noreferrer">github</a>');
+    }
+    return "<tr><td>" + esc(e.date) + "</td><td>" + e.count + "</td><td>" + open.join(" · ") +
+      '</td><td data-row="' + i + '"><span class="muted">…</span></td></tr>';
+  }
+  function render(root) {
+    root.removeAttribute("data-board-digests");
+    if (!idx.topics.length) {
+      root.innerHTML = '<div class="card"><div class="muted">暂无 digest 产物。</div></div>';
+      return;
+    }
+    var all = [];
+    root.innerHTML = idx.topics.map(function (t) {
+      var rows = t.rows.map(function (r) {
+        var e = { topic: t.id, date: r[0], count: r[1], hash: r[2], flags: r[3] };
+        all.push(e);
+        return row(e, all.length - 1);
+      });
+      return '<details open><summary><b>' + esc(t.title) + '</b> <span class="muted">(' + esc(t.id) +
+        ')</span></summary><div style="margin-top:10px"><table class="table"><thead><tr><th>Date</th><th>Count</th>' +
+        "<th>Open</th><th>Top</th></tr></thead><tbody>" + rows.join("") + "</tbody></table></div></details>";
+    }).join("\n");
+    var cells = root.querySelectorAll("td[data-row]");
+    var entry = function (c) { return all[+c.getAttribute("data-row")]; };
+    if (!("IntersectionObserver" in window)) {
+      cells.forEach(function (c) { fill(c, entry(c)); });
+      return;
+    }
+    var io = new IntersectionObserver(function (seen) {
+      seen.forEach(function (s) {
+        if (!s.isIntersecting) return;
+        io.unobserve(s.target);
+        fill(s.target, entry(s.target));
+      });
+    }, { rootMargin: "400px 0px" });
+    cells.forEach(function (c) { io.observe(c); });
+  }
+  function scan() {
+    var root = document.querySelector("[data-board-digests]");
+    if (root) render(root);
+    return !!root;
+  }
+  if (scan()) return;
+  var mo = new MutationObserver(function () { if (scan()) mo.disconnect(); });
+  mo.observe(document.documentElement, { childList: true, subtree: true });
+})();
+"""
 
 
 def _render_sources_block(issue_src: dict[str, Any] | None) -> str:
@@ -314,33 +508,87 @@ def _unique_path(path: Path) -> Path:
     raise RuntimeError(f"Unable to pick unique filename for {path}")
 
 
-def build_board(*, max_days: int) -> tuple[Path, Path]:
+def _manifest_path() -> Path:
+    return Path("docs/board-data/manifest.json")
+
+
+def _load_manifest() -> dict[str, Any]:
+    path = _manifest_path()
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _manifest_without_mtimes(manifest: dict[str, Any]) -> dict[str, Any]:
+    files = {k: {kk: vv for kk, vv in v.items() if kk != "mtime_ns"} for k, v in (manifest.get("files") or {}).items()}
+    return {**manifest, "files": files}
+
+
+def _save_manifest(manifest: dict[str, Any], *, prev: dict[str, Any] | None = None) -> None:
+    # mtimes differ on every fresh checkout (CI); only rewrite the committed manifest on real changes
+    if prev is not None and _manifest_without_mtimes(prev) == _manifest_without_mtimes(manifest):
+        return
+    path = _manifest_path()
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(manifest, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _board_content_hash(board_data: dict[str, Any]) -> str:
+    # ignore fields that change on every build (id/timestamps) so "nothing changed" is detectable
+    meta = {k: v for k, v in board_data.get("meta", {}).items() if k not in ("id", "date", "generated_at")}
+    stable = {**board_data, "meta": meta}
+    return hashlib.sha256(json.dumps(stable, ensure_ascii=False, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+def build_board(*, max_days: int, full: bool = False, gzip_chunks: bool = False) -> tuple[Path, Path, bool]:
+    """Build the board; returns (html_path, data_path, written).
+
+    Incremental by default: docs/board-data/manifest.json keeps the size/mtime/sha256 of every
+    source artifact plus the hash of the last board's content. Only changed artifacts are
+    copied, unchanged shortlists are not re-parsed, and when the board content is identical
+    to the last build no new `board-*.html` / `.data.js` is written (`written` is False).
+    `full=True` ignores the manifest.
+
+    The Digests block is not inlined: `.data.js` carries a small index and the page loads one
+    content-hashed chunk per date/topic (docs/board-data/chunks/) as rows scroll into view.
+    `gzip_chunks=True` also writes pre-compressed `.gz` siblings.
+    """
     ts = datetime.now().strftime("%Y%m%d-%H%M%S")
     board_id = f"board-{ts}"
 
     out_dir = Path("docs/boards")
     out_dir.mkdir(parents=True, exist_ok=True)
-    html_path = _unique_path(out_dir / f"{board_id}.html")
-    data_path = _unique_path(out_dir / f"{board_id}.data.js")
 
-    entries = _collect_digests(max_days=max_days)
+    manifest = {} if full else _load_manifest()
+    prev_files: dict[str, Any] = manifest.get("files") or {}
+    files: dict[str, Any] = {}
+
+    entries = _collect_digests(max_days=max_days, prev_files=prev_files, files=files)
     issue_src = _latest_issue_sources()
 
     keep_dates = {e.date for e in entries}
-    _sync_board_artifacts(entries, keep_dates=keep_dates)
-    _write_board_data_indexes(keep_dates=keep_dates)
+    artifacts_changed = _sync_board_artifacts(entries, keep_dates=keep_dates, files=files, prev_files=prev_files)
+    if full or artifacts_changed or not (_board_artifacts_root() / "index.html").exists():
+        _write_board_data_indexes(keep_dates=keep_dates)
 
-    digest_html = _render_digests(entries)
+    chunk_index, chunks = _digest_chunks(entries)
+    _write_chunks(chunks, gzip_chunks=gzip_chunks, boards_dir=out_dir)
     sources_html = _render_sources_block(issue_src)
 
-    topic_files = sorted(Path("topics").glob("*.toml"))
     topics_list = "".join(
-        f"<li><code>{_h(str(p))}</code> — {_h(_guess_topic_title(p.stem))}</li>" for p in topic_files
+        f"<li><code>{_h(f'topics/{t}.toml')}</code> — {_h(topic_registry.topic_title(t))}</li>"
+        for t in topic_registry.topic_ids()
     )
 
     kpi_today = entries[0].date if entries else "-"
     kpi_topics = str(len({e.topic_id for e in entries})) if entries else "0"
-    kpi_items = str(sum(len(e.items) for e in entries)) if entries else "0"
+    kpi_items = str(sum(e.count for e in entries)) if entries else "0"
 
     board_data = {
         "version": "zon-report@v1",
@@ -400,7 +648,7 @@ def build_board(*, max_days: int) -> tuple[Path, Path]:
                 "id": "digests",
                 "nav": "Digests",
                 "type": "html",
-                "data": {"html": f"<h2>Digests (last {max_days} days)</h2>{digest_html}"},
+                "data": {"html": f"<h2>Digests (last {max_days} days)</h2><div data-board-digests></div>"},
             },
             {
                 "id": "sources",
@@ -446,7 +694,21 @@ def build_board(*, max_days: int) -> tuple[Path, Path]:
         ],
     }
 
-    data_path.write_text("window.zonBoardData = " + json.dumps(board_data, ensure_ascii=False, indent=2) + ";\n", encoding="utf-8")
+    board_hash = _board_content_hash({**board_data, "chunks": chunk_index})
+    prev_board = manifest.get("board") or {}
+    if not full and prev_board.get("hash") == board_hash:
+        prev_html = out_dir / str(prev_board.get("html") or "")
+        prev_data = out_dir / str(prev_board.get("data") or "")
+        if prev_board.get("html") and prev_html.exists() and prev_data.exists():
+            _save_manifest({"files": files, "board": prev_board}, prev=manifest)
+            return prev_html, prev_data, False
+
+    html_path = _unique_path(out_dir / f"{board_id}.html")
+    data_path = _unique_path(out_dir / f"{board_id}.data.js")
+    data_js = f"window.zonBoardData={_dumps_min(board_data)};\n{_CHUNK_INDEX_PREFIX}{_dumps_min(chunk_index)};\n"
+    data_path.write_text(data_js, encoding="utf-8")
+    if gzip_chunks:
+        data_path.with_name(f"{data_path.name}.gz").write_bytes(gzip.compress(data_js.encode("utf-8"), mtime=0))
     html_path.write_text(
         f"""<!doctype html>
 <html lang="zh-CN">
@@ -469,6 +731,7 @@ def build_board(*, max_days: int) -> tuple[Path, Path]:
     </div>
     <script src="{_h(data_path.name)}"></script>
     <script src="https://zon-report-kit.zondev.top/zon-report.js"></script>
+    <script>{_DIGESTS_LOADER_JS}</script>
   </body>
 </html>
 """,
@@ -495,15 +758,21 @@ def build_board(*, max_days: int) -> tuple[Path, Path]:
         encoding="utf-8",
     )
 
-    return html_path, data_path
+    _save_manifest({"files": files, "board": {"hash": board_hash, "html": html_path.name, "data": data_path.name}})
+    return html_path, data_path, True
 
 
 def main() -> int:
     p = argparse.ArgumentParser(description="Build a minimalist HTML board (Zon style) into docs/boards/")
     p.add_argument("--max-days", type=int, default=14)
+    p.add_argument("--full", action="store_true", help="Ignore docs/board-data/manifest.json and rebuild everything.")
+    p.add_argument("--gzip", action="store_true", help="Also write pre-compressed .gz copies of the data/chunk files.")
     args = p.parse_args()
 
-    html_path, data_path = build_board(max_days=args.max_days)
+    html_path, data_path, written = build_board(max_days=args.max_days, full=args.full, gzip_chunks=args.gzip)
+    if not written:
+        print(f"SKIP: unchanged, latest board is still {html_path}")
+        return 0
     print(f"OK: {html_path}")
     print(f"OK: {data_path}")
     print("OK: docs/board.html")
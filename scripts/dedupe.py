@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import Any
+
+# Near-duplicate clustering of a topic's items (same paper / story from several feeds).
+#
+# Signatures are one-permutation MinHash: every shingle is hashed once, its hash picks one
+# of `num_perm` bins and each bin keeps its minimum; empty bins borrow from the next
+# non-empty bin (rotation densification). That estimates Jaccard similarity like classic
+# MinHash at O(#shingles + num_perm) per item instead of O(#shingles * num_perm).
+#
+# LSH splits a signature into `bands` bands; items sharing any band become candidates and
+# are confirmed by signature agreement >= `threshold`. Items are processed in input order
+# (config order of sources), each joining the first representative it matches, so the
+# earliest copy represents the cluster and no all-pairs comparison is done.
+
+_WORD_RE = re.compile(r"\w+")
+_HASH_BITS = 64
+# offset added per rotation step when densifying, keeps borrowed values distinguishable
+_ROTATION = 1 << _HASH_BITS
+
+
+@dataclass(frozen=True)
+class DedupeConfig:
+    threshold: float = 0.5
+    num_perm: int = 128
+    bands: int = 32
+    shingle_size: int = 2
+    # only the start of long summaries; feeds truncate descriptions at different points
+    summary_words: int = 60
+
+
+def parse_dedupe(table: Any) -> DedupeConfig | None:
+    """DedupeConfig from a topic's [dedupe] table (None when absent or `enabled = false`)."""
+    if table is None:
+        return None
+    if not isinstance(table, dict):
+        raise ValueError("[dedupe] must be a table")
+    if not bool(table.get("enabled", True)):
+        return None
+    defaults = DedupeConfig()
+    cfg = DedupeConfig(
+        threshold=float(table.get("threshold", defaults.threshold)),
+        num_perm=int(table.get("num_perm", defaults.num_perm)),
+        bands=int(table.get("bands", defaults.bands)),
+        shingle_size=int(table.get("shingle_size", defaults.shingle_size)),
+        summary_words=int(table.get("summary_words", defaults.summary_words)),
+    )
+    if not 0 < cfg.threshold <= 1:
+        raise ValueError("dedupe.threshold must be in (0, 1]")
+    if cfg.num_perm <= 0 or cfg.bands <= 0 or cfg.num_perm % cfg.bands:
+        raise ValueError("dedupe.num_perm must be a positive multiple of dedupe.bands")
+    if cfg.shingle_size <= 0:
+        raise ValueError("dedupe.shingle_size must be > 0")
+    return cfg
+
+
+def shingles(item: dict[str, Any], *, size: int, summary_words: int) -> set[str]:
+    words = _WORD_RE.findall(str(item.get("title") or "").lower())
+    words += _WORD_RE.findall(str(item.get("summary") or "").lower())[: max(0, summary_words)]
+    if len(words) <= size:
+        return {" ".join(words)} if words else set()
+    return {" ".join(words[i : i + size]) for i in range(len(words) - size + 1)}
+
+
+def signature(shingle_set: set[str], *, num_perm: int) -> list[int] | None:
+    """One-permutation MinHash signature (None for an empty set)."""
+    if not shingle_set:
+        return None
+    bins: list[int | None] = [None] * num_perm
+    for s in shingle_set:
+        h = int.from_bytes(hashlib.blake2b(s.encode("utf-8"), digest_size=8).digest(), "little")
+        b, v = h % num_perm, h // num_perm
+        cur = bins[b]
+        if cur is None or v < cur:
+            bins[b] = v
+    # walk the circular bin array backwards twice, tracking the nearest non-empty bin ahead
+    sig = [0] * num_perm
+    ahead_v, ahead_j = 0, 0
+    for j in range(2 * num_perm - 1, -1, -1):
+        v = bins[j % num_perm]
+        if v is not None:
+            ahead_v, ahead_j = v, j
+        if j < num_perm:
+            sig[j] = ahead_v + (ahead_j - j) * _ROTATION
+    return sig
+
+
+def _similarity(a: list[int], b: list[int]) -> float:
+    return sum(1 for x, y in zip(a, b) if x == y) / len(a)
+
+
+class Clusterer:
+    """Clusters items as they stream in: add() them in order and get each one's representative.
+
+    Only representatives' signatures and LSH buckets are kept, so memory grows with the
+    number of distinct items, not with the items themselves.
+    """
+
+    def __init__(self, cfg: DedupeConfig) -> None:
+        self.cfg = cfg
+        self._rows = cfg.num_perm // cfg.bands
+        self._buckets: dict[tuple[int, tuple[int, ...]], list[int]] = {}
+        self._sigs: dict[int, list[int]] = {}
+        self._n = 0
+
+    def add(self, item: dict[str, Any]) -> int:
+        """Index of `item`'s representative (its own index, counting from 0, when it leads)."""
+        cfg = self.cfg
+        i = self._n
+        self._n += 1
+        sig = signature(shingles(item, size=cfg.shingle_size, summary_words=cfg.summary_words), num_perm=cfg.num_perm)
+        if sig is None:
+            return i
+        rows = self._rows
+        keys = [(b, tuple(sig[b * rows : (b + 1) * rows])) for b in range(cfg.bands)]
+        match = -1
+        checked: set[int] = set()
+        for key in keys:
+            for rep in self._buckets.get(key, ()):
+                if rep in checked:
+                    continue
+                checked.add(rep)
+                if _similarity(sig, self._sigs[rep]) >= cfg.threshold and (match < 0 or rep < match):
+                    match = rep
+        if match >= 0:
+            return match
+        self._sigs[i] = sig
+        for key in keys:
+            self._buckets.setdefault(key, []).append(i)
+        return i
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import re
+import threading
+import urllib.parse
+from dataclasses import dataclass
+from typing import Any, Callable, Iterable
+
+# Run-scoped cache for feeds that several sources (usually in different topics) request.
+#
+# Only URLs registered as shared are cached: those are fetched and parsed once into a list
+# of unfiltered entries, and their body goes into the raw store once; every other topic's
+# manifest just points at the same object. Everything else keeps the streaming path.
+
+_WS_RE = re.compile(r"\s+")
+_PUNCT_WS_RE = re.compile(r"\s*([():,])\s*")
+_PAGING_PARAMS = ("start",)
+
+
+def _normalize_value(value: str) -> str:
+    # arXiv search queries: "(cat:cs.CV  OR cat:eess.IV )" and "(cat:cs.CV OR cat:eess.IV)" are the same
+    return _PUNCT_WS_RE.sub(r"\1", _WS_RE.sub(" ", value.strip()))
+
+
+def normalize_request_url(url: str, *, drop: Iterable[str] = ()) -> str:
+    """Canonical form of a request URL: lowercase scheme/host, default port and fragment
+    dropped, query parameters sorted with whitespace-normalized values."""
+    parts = urllib.parse.urlsplit(url.strip())
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != {"http": 80, "https": 443}.get(scheme):
+        host = f"{host}:{parts.port}"
+    dropped = set(drop)
+    query = sorted(
+        (k, _normalize_value(v))
+        for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if k not in dropped
+    )
+    return urllib.parse.urlunsplit((scheme, host, parts.path or "/", urllib.parse.urlencode(query), ""))
+
+
+def request_family(url: str) -> str:
+    """Key shared by every page of one paginated request (e.g. arXiv `start` offsets)."""
+    return normalize_request_url(url, drop=_PAGING_PARAMS)
+
+
+@dataclass(frozen=True)
+class FeedPage:
+    url: str
+    # parsed, unfiltered entries; shared between topics, so treat as read-only
+    entries: list[dict[str, Any]]
+    # raw store object holding the body
+    sha256: str
+    size: int
+
+
+class FeedCache:
+    """Fetch-and-parse-once cache for one run, safe to use from collector threads.
+
+    `shared` holds the request_family() keys used by more than one source; only those are
+    cached, see shares(). Failures are cached too, so a dead feed is tried once per run
+    rather than once per topic.
+    """
+
+    def __init__(self, *, shared: Iterable[str] = ()) -> None:
+        self._shared = set(shared)
+        self._pages: dict[str, FeedPage] = {}
+        self._errors: dict[str, BaseException] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._lock = threading.Lock()
+
+    def shares(self, url: str) -> bool:
+        return request_family(url) in self._shared
+
+    def get(self, url: str, *, load: Callable[[], FeedPage]) -> tuple[FeedPage, bool]:
+        """(page, hit): the cached page for `url`, loading it on first use (one loader per URL)."""
+        key = normalize_request_url(url)
+        with self._lock:
+            lock = self._locks.setdefault(key, threading.Lock())
+        with lock:
+            page = self._pages.get(key)
+            if page is not None:
+                return page, True
+            err = self._errors.get(key)
+            if err is not None:
+                raise err
+            try:
+                page = load()
+            except Exception as e:
+                self._errors[key] = e
+                raise
+            self._pages[key] = page
+            return page, False
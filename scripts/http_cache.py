@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import dataclass
+from email.message import Message
+from pathlib import Path
+from typing import Any, BinaryIO
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    url: str
+    etag: str
+    last_modified: str
+    stored_at: float
+    used_at: float
+    size: int
+
+
+class HttpCache:
+    """On-disk store of response bodies + validators (ETag / Last-Modified) keyed by URL.
+
+    Layout: `<root>/<sha256(url)>.json` (metadata) next to `<sha256(url)>.body`.
+    Only responses that carry a validator are stored, since nothing else can be revalidated.
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int = 256 * 1024 * 1024, max_age_days: float = 30.0) -> None:
+        self.root = Path(root)
+        self.max_bytes = int(max_bytes)
+        self.max_age_s = float(max_age_days) * 86400.0
+
+    def _key(self, url: str) -> str:
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _meta_path(self, url: str) -> Path:
+        return self.root / f"{self._key(url)}.json"
+
+    def _body_path(self, url: str) -> Path:
+        return self.root / f"{self._key(url)}.body"
+
+    def _write_atomic(self, path: Path, data: bytes) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def lookup(self, url: str) -> CachedResponse | None:
+        meta_path = self._meta_path(url)
+        if not meta_path.exists() or not self._body_path(url).exists():
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except Exception:
+            return None
+        if meta.get("url") != url:
+            return None
+        return CachedResponse(
+            url=url,
+            etag=str(meta.get("etag") or ""),
+            last_modified=str(meta.get("last_modified") or ""),
+            stored_at=float(meta.get("stored_at") or 0),
+            used_at=float(meta.get("used_at") or 0),
+            size=int(meta.get("size") or 0),
+        )
+
+    def validators(self, url: str) -> dict[str, str]:
+        """Conditional request headers for `url` (empty when nothing usable is cached)."""
+        hit = self.lookup(url)
+        if hit is None:
+            return {}
+        headers: dict[str, str] = {}
+        if hit.etag:
+            headers["If-None-Match"] = hit.etag
+        if hit.last_modified:
+            headers["If-Modified-Since"] = hit.last_modified
+        return headers
+
+    def open_body(self, url: str) -> BinaryIO | None:
+        """Cached body for `url` (after a 304) as an open binary file; also refreshes its LRU timestamp."""
+        hit = self.lookup(url)
+        if hit is None:
+            return None
+        try:
+            f = self._body_path(url).open("rb")
+        except OSError:
+            return None
+        self._write_meta(hit, used_at=time.time())
+        return f
+
+    def load(self, url: str) -> bytes | None:
+        f = self.open_body(url)
+        if f is None:
+            return None
+        with f:
+            return f.read()
+
+    def writer(self, url: str, headers: Message | dict[str, Any]) -> CacheWriter | None:
+        """Streaming sink for a 200 response body; None when the response is not cacheable."""
+        etag = str(headers.get("ETag") or "").strip()
+        last_modified = str(headers.get("Last-Modified") or "").strip()
+        if not etag and not last_modified:
+            return None
+        if "no-store" in str(headers.get("Cache-Control") or "").lower():
+            return None
+        return CacheWriter(self, url=url, etag=etag, last_modified=last_modified)
+
+    def store(self, url: str, headers: Message | dict[str, Any], body: bytes) -> bool:
+        w = self.writer(url, headers)
+        if w is None:
+            return False
+        w.write(body)
+        return w.commit()
+
+    def _write_meta(self, hit: CachedResponse, *, used_at: float) -> None:
+        meta = {
+            "url": hit.url,
+            "etag": hit.etag,
+            "last_modified": hit.last_modified,
+            "stored_at": hit.stored_at,
+            "used_at": used_at,
+            "size": hit.size,
+        }
+        self._write_atomic(self._meta_path(hit.url), json.dumps(meta, ensure_ascii=False).encode("utf-8"))
+
+    def prune(self) -> int:
+        """Drop entries older than max_age, then least-recently-used ones until under max_bytes."""
+        if not self.root.exists():
+            return 0
+        now = time.time()
+        entries: list[tuple[float, int, Path]] = []
+        removed = 0
+        for meta_path in self.root.glob("*.json"):
+            body_path = meta_path.with_suffix(".body")
+            try:
+                meta = json.loads(meta_path.read_text(encoding="utf-8"))
+                used_at = float(meta.get("used_at") or 0)
+                size = body_path.stat().st_size
+            except Exception:
+                used_at, size = 0.0, 0
+            if now - used_at > self.max_age_s or not body_path.exists():
+                self._drop(meta_path)
+                removed += 1
+                continue
+            entries.append((used_at, size, meta_path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, meta_path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._drop(meta_path)
+            total -= size
+            removed += 1
+        return removed
+
+    def _drop(self, meta_path: Path) -> None:
+        for p in (meta_path, meta_path.with_suffix(".body")):
+            try:
+                p.unlink()
+            except FileNotFoundError:
+                pass
+
+
+class CacheWriter:
+    """Writes a body to a temp file; `commit()` publishes it only if it stayed under the size cap."""
+
+    def __init__(self, cache: HttpCache, *, url: str, etag: str, last_modified: str) -> None:
+        self._cache = cache
+        self._url = url
+        self._etag = etag
+        self._last_modified = last_modified
+        self._size = 0
+        body_path = cache._body_path(url)
+        body_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp = body_path.with_name(f"{body_path.name}.{os.getpid()}.{id(self)}.tmp")
+        self._f: BinaryIO | None = self._tmp.open("wb")
+
+    def write(self, chunk: bytes) -> None:
+        if self._f is None:
+            return
+        self._size += len(chunk)
+        if self._size > self._cache.max_bytes:
+            self.abort()
+            return
+        self._f.write(chunk)
+
+    def commit(self) -> bool:
+        if self._f is None:
+            return False
+        self._f.close()
+        self._f = None
+        os.replace(self._tmp, self._cache._body_path(self._url))
+        now = time.time()
+        hit = CachedResponse(
+            url=self._url,
+            etag=self._etag,
+            last_modified=self._last_modified,
+            stored_at=now,
+            used_at=now,
+            size=self._size,
+        )
+        self._cache._write_meta(hit, used_at=now)
+        return True
+
+    def abort(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+        try:
+            self._tmp.unlink()
+        except FileNotFoundError:
+            pass
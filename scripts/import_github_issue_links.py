@@ -6,15 +6,22 @@ import json
 import os
 import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
-from urllib import error, request
+from urllib import error, parse, request
 
 
 API = "https://api.github.com"
 
+# Incremental import: links accumulate in one store per issue
+# (data/sources/issue-<owner>-<repo>-<number>.links.json, plus a .urls.txt listing), and a
+# cursor in <state-dir>/github/ keeps the ETags of the issue and comment requests and the
+# newest comment `updated_at`. Later runs only ask for comments updated since then, as
+# conditional requests, so an unchanged issue costs two 304s.
+
 
 def _read_env_file(path: str) -> dict[str, str]:
     if not path:
@@ -33,25 +40,81 @@ def _read_env_file(path: str) -> dict[str, str]:
     return out
 
 
-def _gh_get(token: str, path: str) -> Any:
-    url = API + path
-    req = request.Request(
-        url,
-        headers={
-            "Accept": "application/vnd.github+json",
-            "Authorization": f"token {token}",
-            "X-GitHub-Api-Version": "2022-11-28",
-            "User-Agent": "postcast/scripts/import_github_issue_links.py",
-        },
-    )
+@dataclass(frozen=True)
+class Page:
+    status: int  # 200, or 304 when the ETag still matches
+    data: Any
+    etag: str
+    links: dict[str, str]  # rel -> URL, from the Link header
+
+
+_LINK_RE = re.compile(r'<([^>]+)>\s*;\s*rel="([^"]+)"')
+
+
+def _parse_link_header(value: str | None) -> dict[str, str]:
+    return {rel: url for url, rel in _LINK_RE.findall(value or "")}
+
+
+def _gh_get(token: str, url: str, *, etag: str = "") -> Page:
+    headers = {
+        "Accept": "application/vnd.github+json",
+        "X-GitHub-Api-Version": "2022-11-28",
+        "User-Agent": "postcast/scripts/import_github_issue_links.py",
+    }
+    if token:
+        headers["Authorization"] = f"token {token}"
+    if etag:
+        # a 304 does not count against the rate limit
+        headers["If-None-Match"] = etag
+    req = request.Request(url, headers=headers)
     try:
         with request.urlopen(req, timeout=30) as resp:
-            return json.loads(resp.read().decode("utf-8"))
+            return Page(
+                status=resp.status,
+                data=json.loads(resp.read().decode("utf-8")),
+                etag=resp.headers.get("ETag") or "",
+                links=_parse_link_header(resp.headers.get("Link")),
+            )
     except error.HTTPError as e:
+        if e.code == 304:
+            return Page(status=304, data=None, etag=etag, links={})
         body = e.read().decode("utf-8", errors="ignore")
         raise RuntimeError(f"GitHub API error {e.code}: {body[:500]}")
 
 
+def _with_page(url: str, page: int) -> str:
+    parts = parse.urlsplit(url)
+    query = [(k, v) for k, v in parse.parse_qsl(parts.query, keep_blank_values=True) if k != "page"]
+    query.append(("page", str(page)))
+    return parse.urlunsplit(parts._replace(query=parse.urlencode(query)))
+
+
+def _get_all_pages(token: str, url: str, *, etag: str, workers: int) -> tuple[Page, list[Any]]:
+    """First page (conditional on `etag`) plus every later page's items, in page order.
+
+    When the Link header names the last page, pages 2..last are fetched concurrently;
+    otherwise `next` links are followed one by one.
+    """
+    first = _gh_get(token, url, etag=etag)
+    if first.status == 304:
+        return first, []
+    items = list(first.data or [])
+    last = first.links.get("last")
+    last_page = int(dict(parse.parse_qsl(parse.urlsplit(last).query)).get("page") or 0) if last else 0
+    if last_page > 1:
+        urls = [_with_page(last, n) for n in range(2, last_page + 1)]  # type: ignore[arg-type]
+        with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+            for page in pool.map(lambda u: _gh_get(token, u), urls):
+                items.extend(page.data or [])
+        return first, items
+    nxt = first.links.get("next")
+    while nxt:
+        page = _gh_get(token, nxt)
+        items.extend(page.data or [])
+        nxt = page.links.get("next")
+    return first, items
+
+
 URL_RE = re.compile(r"https?://[^\s\]\)\"'>]+", re.IGNORECASE)
 
 
@@ -68,17 +131,6 @@ def _extract_urls(text: str) -> list[str]:
     return out
 
 
-def _dedupe_keep_order(items: list[str]) -> list[str]:
-    seen: set[str] = set()
-    out: list[str] = []
-    for x in items:
-        if x in seen:
-            continue
-        seen.add(x)
-        out.append(x)
-    return out
-
-
 def _guess_kind(url: str) -> str:
     u = url.lower()
     if any(k in u for k in ["/rss", "feed", ".atom", "feeds.feedburner.com"]) or u.endswith(".xml"):
@@ -97,6 +149,48 @@ class IssueRef:
     number: int
 
 
+def _load_json(path: Path) -> dict[str, Any]:
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except Exception:
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(text, encoding="utf-8")
+    os.replace(tmp, path)
+
+
+def _seed_links(out_dir: Path, ref: IssueRef) -> list[dict[str, Any]]:
+    """Links of the timestamped snapshots earlier versions wrote, oldest first (for the first run)."""
+    links: list[dict[str, Any]] = []
+    for path in sorted(out_dir.glob(f"issue-{ref.owner}-{ref.repo}-{ref.number}-*.links.json")):
+        data = _load_json(path)
+        for link in data.get("links") or []:
+            if isinstance(link, dict) and link.get("url"):
+                links.append({**link, "first_seen": link.get("first_seen") or data.get("fetched_at")})
+    return links
+
+
+def _merge_links(links: list[dict[str, Any]], blobs: list[dict[str, Any]], *, now: str) -> int:
+    """Append the URLs in `blobs` that `links` does not have yet; returns how many were added."""
+    known = {str(link.get("url")) for link in links}
+    added = 0
+    for b in blobs:
+        for u in _extract_urls(b.get("body", "")):
+            if u in known:
+                continue
+            known.add(u)
+            links.append({"url": u, "kind": _guess_kind(u), "first_seen": now, "from": b.get("url")})
+            added += 1
+    return added
+
+
 def main() -> int:
     p = argparse.ArgumentParser(description="Import links from a GitHub issue + comments into data/sources/")
     p.add_argument("--owner", default="EOMZON")
@@ -106,6 +200,10 @@ def main() -> int:
     p.add_argument("--token-env", default="GITHUB_TOKEN")
     p.add_argument("--env-file", default="", help="Optional .env file path")
     p.add_argument("--out-dir", default="data/sources")
+    p.add_argument("--state-dir", default="data/state", help="Where the incremental cursor (ETags, since) is kept")
+    p.add_argument("--full", action="store_true", help="Ignore the cursor and re-read the whole issue (links still merge)")
+    p.add_argument("--workers", type=int, default=4, help="Comment pages fetched concurrently")
+    p.add_argument("--api", default=API, help="API base URL (e.g. a local stand-in for testing)")
     args = p.parse_args()
 
     env = _read_env_file(args.env_file) if args.env_file else {}
@@ -115,21 +213,38 @@ def main() -> int:
         return 2
 
     ref = IssueRef(args.owner, args.repo, args.number)
+    api = args.api.rstrip("/")
+    out_dir = Path(args.out_dir)
+    name = f"issue-{ref.owner}-{ref.repo}-{ref.number}"
+    out_json = out_dir / f"{name}.links.json"
+    out_txt = out_dir / f"{name}.urls.txt"
+    cursor_path = Path(args.state_dir) / "github" / f"{name}.json"
+    cursor = {} if args.full else _load_json(cursor_path)
+
+    issue_path = f"/repos/{ref.owner}/{ref.repo}/issues/{ref.number}"
+    issue = _gh_get(token, api + issue_path, etag=str(cursor.get("issue_etag") or ""))
 
-    issue = _gh_get(token, f"/repos/{ref.owner}/{ref.repo}/issues/{ref.number}")
-    comments = _gh_get(token, f"/repos/{ref.owner}/{ref.repo}/issues/{ref.number}/comments?per_page=100")
+    # `since` matches comments updated at/after it, so the newest one is re-read (and de-duplicated)
+    since = str(cursor.get("comments_since") or "")
+    query = {"per_page": "100", **({"since": since} if since else {})}
+    comments_url = f"{api}{issue_path}/comments?{parse.urlencode(query)}"
+    etag = str(cursor.get("comments_etag") or "") if cursor.get("comments_url") == comments_url else ""
+    first, comments = _get_all_pages(token, comments_url, etag=etag, workers=args.workers)
 
     blobs: list[dict[str, Any]] = []
-    blobs.append(
-        {
-            "type": "issue",
-            "url": issue.get("html_url"),
-            "created_at": issue.get("created_at"),
-            "updated_at": issue.get("updated_at"),
-            "body": issue.get("body") or "",
-        }
-    )
-    for c in comments if isinstance(comments, list) else []:
+    if issue.status != 304:
+        blobs.append(
+            {
+                "type": "issue",
+                "url": issue.data.get("html_url"),
+                "created_at": issue.data.get("created_at"),
+                "updated_at": issue.data.get("updated_at"),
+                "body": issue.data.get("body") or "",
+            }
+        )
+    for c in comments:
+        if not isinstance(c, dict):
+            continue
         blobs.append(
             {
                 "type": "comment",
@@ -139,38 +254,48 @@ def main() -> int:
                 "body": c.get("body") or "",
             }
         )
+        since = max(since, str(c.get("updated_at") or ""))
 
-    all_urls: list[str] = []
-    for b in blobs:
-        all_urls.extend(_extract_urls(b.get("body", "")))
-
-    urls = _dedupe_keep_order(all_urls)
-    enriched = [{"url": u, "kind": _guess_kind(u)} for u in urls]
-
-    out_dir = Path(args.out_dir)
-    out_dir.mkdir(parents=True, exist_ok=True)
-    stamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d-%H%M%S")
-    out_json = out_dir / f"issue-{ref.owner}-{ref.repo}-{ref.number}-{stamp}.links.json"
-    out_txt = out_dir / f"issue-{ref.owner}-{ref.repo}-{ref.number}-{stamp}.urls.txt"
+    now = datetime.now(tz=timezone.utc).isoformat()
+    store = _load_json(out_json)
+    links: list[dict[str, Any]] = list(store.get("links") or []) if store else _seed_links(out_dir, ref)
+    added = _merge_links(links, blobs, now=now)
+    if added or not out_json.exists():
+        _write_atomic(
+            out_json,
+            json.dumps(
+                {
+                    "issue": {"owner": ref.owner, "repo": ref.repo, "number": ref.number},
+                    "fetched_at": now,
+                    "count": len(links),
+                    "links": links,
+                },
+                ensure_ascii=False,
+                indent=2,
+            )
+            + "\n",
+        )
+        _write_atomic(out_txt, "".join(f"{link['url']}\n" for link in links))
 
-    out_json.write_text(
+    _write_atomic(
+        cursor_path,
         json.dumps(
             {
-                "issue": {"owner": ref.owner, "repo": ref.repo, "number": ref.number},
-                "fetched_at": datetime.now(tz=timezone.utc).isoformat(),
-                "count": len(enriched),
-                "links": enriched,
+                "issue_etag": issue.etag,
+                "comments_url": comments_url,
+                "comments_etag": first.etag,
+                "comments_since": since,
+                "checked_at": now,
             },
             ensure_ascii=False,
             indent=2,
         )
         + "\n",
-        encoding="utf-8",
     )
-    out_txt.write_text("\n".join(u for u in urls) + "\n", encoding="utf-8")
 
-    print(f"OK: {out_json}")
-    print(f"OK: {out_txt}")
+    unchanged = issue.status == 304 and first.status == 304
+    detail = "not modified" if unchanged else f"{len(comments)} comments read"
+    print(f"OK: {out_json} (+{added} new, {len(links)} total; {detail})")
     return 0
 
 
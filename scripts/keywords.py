@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import re
+from functools import lru_cache
+from typing import Iterable
+
+# For short ASCII tokens, require word boundary to avoid accidental substring hits
+_SHORT_TOKEN_RE = re.compile(r"[a-z0-9]{1,4}")
+
+
+def _trie_pattern(words: Iterable[str]) -> str:
+    """One regex alternation for many literals, factored by common prefix.
+
+    `re` tries alternatives one by one, so a flat `a|b|c...` costs O(#keywords) per text
+    position; a prefix trie turns that into (roughly) one branch per character.
+    """
+    trie: dict[str, dict] = {}
+    for w in words:
+        node = trie
+        for ch in w:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def walk(node: dict[str, dict]) -> str:
+        alts = [re.escape(ch) + walk(child) for ch, child in sorted(node.items()) if ch]
+        if not alts:
+            return ""
+        body = alts[0] if len(alts) == 1 else "(?:" + "|".join(alts) + ")"
+        if "" in node:
+            body = f"(?:{body})?"
+        return body
+
+    return walk(trie)
+
+
+class _KeywordSet:
+    """Compiled form of one keyword list (rules: see KeywordMatcher)."""
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        keywords = list(keywords)
+        # a non-empty include list with no usable keyword still rejects everything
+        self.given = bool(keywords)
+        literals: set[str] = set()
+        tokens: set[str] = set()
+        patterns: list[re.Pattern[str]] = []
+        for kw in keywords:
+            kw = (kw or "").strip()
+            if not kw:
+                continue
+            if kw.lower().startswith("re:"):
+                pattern = kw[3:].strip()
+                if pattern:
+                    patterns.append(re.compile(pattern, flags=re.IGNORECASE))
+                continue
+            k = kw.lower()
+            (tokens if _SHORT_TOKEN_RE.fullmatch(k) else literals).add(k)
+
+        self.literals = re.compile(_trie_pattern(literals)) if literals else None
+        self.tokens = re.compile(rf"\b{_trie_pattern(tokens)}\b") if tokens else None
+        self.patterns = patterns
+
+    def hit(self, text: str, lowered: str) -> bool:
+        if self.literals is not None and self.literals.search(lowered):
+            return True
+        if self.tokens is not None and self.tokens.search(lowered):
+            return True
+        return any(p.search(text) for p in self.patterns)
+
+
+class KeywordMatcher:
+    """include/exclude keyword filter compiled once per source.
+
+    Keywords are plain substrings (case-insensitive), short ASCII tokens (<=4 chars, matched
+    on word boundaries) or `re:<pattern>` regexes. Each text is lowercased once per check.
+    """
+
+    def __init__(self, include: Iterable[str], exclude: Iterable[str]) -> None:
+        self.include = _KeywordSet(include)
+        self.exclude = _KeywordSet(exclude)
+
+    def rejects(self, text: str) -> str | None:
+        """None if `text` passes; otherwise which list rejected it ("include" or "exclude")."""
+        text = text or ""
+        lowered = text.lower()
+        if self.include.given and not self.include.hit(text, lowered):
+            return "include"
+        if self.exclude.hit(text, lowered):
+            return "exclude"
+        return None
+
+    def matches(self, text: str) -> bool:
+        return self.rejects(text) is None
+
+
+@lru_cache(maxsize=256)
+def _compile_cached(include: tuple[str, ...], exclude: tuple[str, ...]) -> KeywordMatcher:
+    return KeywordMatcher(include, exclude)
+
+
+def compile_matcher(*, include: Iterable[str] | None, exclude: Iterable[str] | None) -> KeywordMatcher:
+    return _compile_cached(tuple(include or ()), tuple(exclude or ()))
+
+
+class WeightedKeywords:
+    """Sum of `weight` over the distinct keywords found in a text (same rules as KeywordMatcher).
+
+    Weight tables are short hand-written lists, so literals are plain substring checks (a
+    C-level scan each, cheaper than one regex pass at this size); short tokens are confirmed
+    on word boundaries only after their substring is present.
+    """
+
+    def __init__(self, weights: dict[str, float]) -> None:
+        self._literals: list[tuple[str, float]] = []
+        self._tokens: list[tuple[str, re.Pattern[str], float]] = []
+        self._patterns: list[tuple[re.Pattern[str], float]] = []
+        for kw, w in weights.items():
+            kw, w = (kw or "").strip(), float(w)
+            if not kw or not w:
+                continue
+            if kw.lower().startswith("re:"):
+                pattern = kw[3:].strip()
+                if pattern:
+                    self._patterns.append((re.compile(pattern, flags=re.IGNORECASE), w))
+                continue
+            k = kw.lower()
+            if _SHORT_TOKEN_RE.fullmatch(k):
+                self._tokens.append((k, re.compile(rf"\b{re.escape(k)}\b"), w))
+            else:
+                self._literals.append((k, w))
+
+    def __bool__(self) -> bool:
+        return bool(self._literals or self._tokens or self._patterns)
+
+    def score(self, text: str) -> float:
+        text = text or ""
+        lowered = text.lower()
+        score = sum(w for k, w in self._literals if k in lowered)
+        score += sum(w for k, p, w in self._tokens if k in lowered and p.search(lowered))
+        return score + sum(w for p, w in self._patterns if p.search(text))
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import os
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable
+
+
+@dataclass
+class SourceStats:
+    """Counters for one source in one run; filled in by the collectors as they stream.
+
+    `fetch_seconds` is time spent waiting on the network (connect, headers, body reads,
+    including the rest of a body drained after an early stop); `parse_seconds` is
+    everything else inside the fetch (XML parsing, filtering, the raw snapshot copy).
+    """
+
+    source_id: str
+    kind: str
+    requests: int = 0
+    # extra attempts after a transient failure (see resilience.FetchPolicy)
+    retries: int = 0
+    not_modified: int = 0
+    # pages served from another source's fetch of the same feed in this run (feed_cache)
+    shared: int = 0
+    fetch_seconds: float = 0.0
+    throttle_seconds: float = 0.0
+    parse_seconds: float = 0.0
+    bytes: int = 0
+    cached_bytes: int = 0
+    entries: int = 0
+    rejected_include: int = 0
+    rejected_exclude: int = 0
+    skipped_seen: int = 0
+    items: int = 0
+    seconds: float = 0.0
+    error: str | None = None
+
+    def record(self, *, topic: str, date: str) -> dict[str, Any]:
+        out: dict[str, Any] = {"scope": "source", "topic": topic, "date": date}
+        for k, v in asdict(self).items():
+            out[k] = round(v, 4) if isinstance(v, float) else v
+        return out
+
+
+# name -> (help, field in the source record); all exported as gauges labelled by topic/source
+_SOURCE_GAUGES = {
+    "postcast_source_up": ("1 if the source was collected without error.", None),
+    "postcast_source_requests": ("HTTP requests (pages) made for the source.", "requests"),
+    "postcast_source_retries": ("Requests retried after a transient failure.", "retries"),
+    "postcast_source_not_modified": ("Requests answered 304 and served from the HTTP cache.", "not_modified"),
+    "postcast_source_shared": ("Pages reused from another source's fetch of the same feed.", "shared"),
+    "postcast_source_fetch_seconds": ("Time waiting on the network.", "fetch_seconds"),
+    "postcast_source_throttle_seconds": ("Time waiting on the per-host request spacing.", "throttle_seconds"),
+    "postcast_source_parse_seconds": ("Time parsing and filtering entries.", "parse_seconds"),
+    "postcast_source_bytes": ("Body bytes downloaded.", "bytes"),
+    "postcast_source_cached_bytes": ("Body bytes read from the HTTP cache.", "cached_bytes"),
+    "postcast_source_entries": ("Feed entries parsed.", "entries"),
+    "postcast_source_rejected_include": ("Entries without any include keyword.", "rejected_include"),
+    "postcast_source_rejected_exclude": ("Entries dropped by an exclude keyword.", "rejected_exclude"),
+    "postcast_source_skipped_seen": ("Entries already published on an earlier day.", "skipped_seen"),
+    "postcast_source_items": ("Items kept.", "items"),
+    "postcast_source_seconds": ("Wall time collecting the source.", "seconds"),
+}
+_TOPIC_GAUGES = {
+    "postcast_topic_items": ("Items written to items.jsonl.", "items"),
+    "postcast_topic_duplicates": ("Items collapsed into another source's copy of the same story.", "duplicates"),
+    "postcast_topic_shortlist": ("Items written to shortlist.jsonl.", "shortlist"),
+    "postcast_topic_errors": ("Sources that failed.", "errors"),
+    "postcast_topic_seconds": ("Wall time from planning the topic to its last write.", "seconds"),
+    "postcast_topic_write_seconds": ("Time writing outputs, archive and seen index.", "write_seconds"),
+}
+
+
+def _label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def prometheus_text(records: Iterable[dict[str, Any]]) -> str:
+    """Render metrics.jsonl records in the Prometheus text exposition format."""
+    records = list(records)
+    lines: list[str] = []
+    for scope, gauges in (("source", _SOURCE_GAUGES), ("topic", _TOPIC_GAUGES)):
+        rows = [r for r in records if r.get("scope") == scope]
+        if not rows:
+            continue
+        for name, (help_text, key) in gauges.items():
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} gauge")
+            for r in rows:
+                labels = f'topic="{_label(r["topic"])}"'
+                if scope == "source":
+                    labels += f',source="{_label(r["source_id"])}"'
+                value = (0 if r.get("error") else 1) if key is None else r.get(key) or 0
+                lines.append(f"{name}{{{labels}}} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def write_prometheus(path: Path, records: Iterable[dict[str, Any]]) -> None:
+    # textfile collectors may read at any moment: write a temp file and rename it into place
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(prometheus_text(records), encoding="utf-8")
+    os.replace(tmp, path)
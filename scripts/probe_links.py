@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import re
+import sys
+import threading
+import time
+import urllib.error
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Any
+
+from resilience import FetchPolicy, build_opener  # type: ignore
+from topic_registry import load_topic, topic_ids  # type: ignore
+
+# Probes the links collected by import_github_issue_links.py (data/sources/*.links.json):
+# is the URL alive, how fast, and is it a feed or a page that advertises one
+# (<link rel="alternate" type="application/rss+xml" href=...>)?
+#
+# Results are cached per URL in data/sources/probes.json; a re-run only touches URLs that are
+# new or whose last probe is stale (successes after --max-age-days, failures after
+# --retry-hours). Only the first --max-bytes of each body are read, enough for an HTML <head>
+# or a feed's root element.
+
+USER_AGENT = "postcast/0.1 (+https://example.invalid)"
+FEED_TYPES = {"application/rss+xml": "rss", "application/atom+xml": "atom", "application/feed+json": "json"}
+_FEED_ROOT_RE = re.compile(rb"<(rss|feed|rdf:RDF)[\s>]", re.IGNORECASE)
+_CHARSET_RE = re.compile(r"charset=([\w.-]+)", re.IGNORECASE)
+
+
+class _HeadParser(HTMLParser):
+    """Collects <title> and feed <link rel="alternate"> tags (stops caring after </head>)."""
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.feeds: list[dict[str, str]] = []
+        self._in_title = False
+        self._done = False
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        if self._done:
+            return
+        if tag == "title":
+            self._in_title = True
+        elif tag == "link":
+            a = {k.lower(): (v or "").strip() for k, v in attrs}
+            rels = a.get("rel", "").lower().split()
+            kind = FEED_TYPES.get(a.get("type", "").lower())
+            if "alternate" in rels and kind and a.get("href"):
+                self.feeds.append({"href": a["href"], "type": kind, "title": a.get("title", "")})
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag == "title":
+            self._in_title = False
+        elif tag == "head":
+            self._done = True
+
+    def handle_data(self, data: str) -> None:
+        if self._in_title and not self._done:
+            self.title += data
+
+
+def sniff(body: bytes, content_type: str) -> str:
+    """"feed", "html" or "other" from the Content-Type header and the start of the body."""
+    ctype = content_type.split(";", 1)[0].strip().lower()
+    head = body[:2048].lstrip()
+    if ctype in FEED_TYPES or _FEED_ROOT_RE.search(head):
+        return "feed"
+    if ctype in ("text/html", "application/xhtml+xml") or head[:100].lower().startswith((b"<!doctype html", b"<html")):
+        return "html"
+    return "other"
+
+
+def discover_feeds(body: bytes, *, base_url: str, content_type: str) -> tuple[str, list[dict[str, str]]]:
+    """(page title, advertised feeds with absolute URLs) of an HTML page."""
+    m = _CHARSET_RE.search(content_type)
+    try:
+        text = body.decode(m.group(1) if m else "utf-8", errors="replace")
+    except LookupError:
+        text = body.decode("utf-8", errors="replace")
+    parser = _HeadParser()
+    try:
+        parser.feed(text)
+    except Exception:
+        pass  # truncated or broken markup: keep what was found
+    feeds, seen = [], set()
+    for f in parser.feeds:
+        url = urllib.parse.urljoin(base_url, f["href"])
+        if url not in seen:
+            seen.add(url)
+            feeds.append({"url": url, "type": f["type"], "title": f["title"]})
+    return " ".join(parser.title.split()), feeds
+
+
+class Prober:
+    """Fetches URLs with per-host concurrency caps and a body-size cap; safe to share between threads."""
+
+    def __init__(self, *, per_host: int, max_bytes: int, policy: FetchPolicy) -> None:
+        self.max_bytes = max_bytes
+        self.policy = policy
+        self._opener = build_opener(policy)
+        self._per_host = max(1, per_host)
+        self._slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _slot(self, url: str) -> threading.BoundedSemaphore:
+        host = (urllib.parse.urlsplit(url).hostname or "").lower()
+        with self._lock:
+            return self._slots.setdefault(host, threading.BoundedSemaphore(self._per_host))
+
+    def probe(self, url: str) -> dict[str, Any]:
+        result: dict[str, Any] = {"url": url, "checked_at": datetime.now(tz=timezone.utc).isoformat()}
+        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, "Accept": "*/*"})
+        t0 = time.perf_counter()
+        try:
+            with self._slot(url):
+                t0 = time.perf_counter()
+                with self._opener.open(req, timeout=self.policy.connect_timeout) as resp:
+                    result["latency_ms"] = round((time.perf_counter() - t0) * 1000, 1)  # time to headers
+                    body = resp.read(self.max_bytes)
+                    result.update(
+                        status=resp.status, final_url=resp.geturl(), content_type=resp.headers.get("Content-Type") or ""
+                    )
+        except Exception as e:
+            status = e.code if isinstance(e, urllib.error.HTTPError) else 0
+            error = f"HTTP {status}" if status else repr(e)[:300]
+            latency = round((time.perf_counter() - t0) * 1000, 1)
+            result.update(ok=False, status=status, kind="error", error=error, latency_ms=latency)
+            return result
+
+        result["ok"] = True
+        result["bytes"] = len(body)
+        kind = sniff(body, result["content_type"])
+        result["kind"] = kind
+        if kind == "feed":
+            ctype = result["content_type"].split(";", 1)[0].strip().lower()
+            result["feeds"] = [{"url": result["final_url"], "type": FEED_TYPES.get(ctype, "feed"), "title": ""}]
+        elif kind == "html":
+            title, feeds = discover_feeds(body, base_url=result["final_url"], content_type=result["content_type"])
+            result["title"] = title
+            result["feeds"] = feeds
+        return result
+
+
+def _is_fresh(entry: dict[str, Any] | None, *, now: float, max_age_s: float, retry_s: float) -> bool:
+    if not entry:
+        return False
+    try:
+        checked = datetime.fromisoformat(str(entry.get("checked_at"))).timestamp()
+    except ValueError:
+        return False
+    return now - checked < (max_age_s if entry.get("ok") else retry_s)
+
+
+def load_links(paths: list[Path]) -> list[str]:
+    """Unique http(s) URLs of the given links.json files, in file order."""
+    urls: list[str] = []
+    seen: set[str] = set()
+    for path in paths:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            print(f"WARN: {path}: {e}", file=sys.stderr)
+            continue
+        for link in data.get("links") or []:
+            url = str(link.get("url") if isinstance(link, dict) else link or "").strip()
+            if url.startswith(("http://", "https://")) and url not in seen:
+                seen.add(url)
+                urls.append(url)
+    return urls
+
+
+def _configured_urls() -> set[str]:
+    urls: set[str] = set()
+    for topic_id in topic_ids():
+        try:
+            cfg = load_topic(topic_id)
+        except Exception:
+            continue
+        urls.update(str(src.get("url") or "").strip() for src in cfg.sources)
+    return urls
+
+
+def _suggest_toml(results: dict[str, dict[str, Any]]) -> str:
+    """[[sources]] blocks for discovered feeds not yet used by any topic."""
+    known = _configured_urls()
+    blocks: list[str] = []
+    emitted: set[str] = set()
+    ids: set[str] = set()
+    for page_url, r in results.items():
+        for feed in r.get("feeds") or []:
+            url = feed["url"]
+            if url in known or url in emitted:
+                continue
+            emitted.add(url)
+            host = urllib.parse.urlsplit(url).hostname or "feed"
+            title = feed.get("title") or r.get("title") or host
+            if feed.get("type") == "json":
+                # the collectors only parse RSS / Atom (XML)
+                blocks.append(f"# {title} (from {page_url}): JSON Feed, not supported: {url}\n")
+                continue
+            base = re.sub(r"[^a-z0-9]+", "_", host.lower().removeprefix("www.")).strip("_") or "feed"
+            sid, n = base, 1
+            while sid in ids:
+                n += 1
+                sid = f"{base}_{n}"
+            ids.add(sid)
+            blocks.append(
+                f"# {title} (from {page_url})\n"
+                f"[[sources]]\nid = {json.dumps(sid)}\nkind = \"rss\"\nurl = {json.dumps(url)}\n"
+                f"include_keywords = []\n"
+            )
+    return "\n".join(blocks)
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Probe imported source links: liveness, latency, feed discovery.")
+    p.add_argument("links", nargs="*", help="links.json files (default: data/sources/*.links.json)")
+    p.add_argument("--cache", default="data/sources/probes.json")
+    p.add_argument("--workers", type=int, default=16)
+    p.add_argument("--per-host", type=int, default=2)
+    p.add_argument("--max-bytes", type=int, default=256 * 1024, help="Read at most this much of each body")
+    p.add_argument("--connect-timeout", type=float, default=10.0)
+    p.add_argument("--read-timeout", type=float, default=15.0)
+    p.add_argument("--max-age-days", type=float, default=7.0, help="Re-probe live URLs after this long")
+    p.add_argument("--retry-hours", type=float, default=24.0, help="Re-probe failed URLs after this long")
+    p.add_argument("--all", action="store_true", help="Ignore the cache and probe every URL")
+    p.add_argument("--suggest", action="store_true", help="Print [[sources]] TOML for feeds no topic uses yet")
+    args = p.parse_args()
+
+    paths = [Path(x) for x in args.links] or sorted(Path("data/sources").glob("*.links.json"))
+    urls = load_links(paths)
+    cache_path = Path(args.cache)
+    cache: dict[str, dict[str, Any]] = {}
+    if cache_path.exists():
+        cache = dict(json.loads(cache_path.read_text(encoding="utf-8")).get("results") or {})
+
+    now = time.time()
+    todo = [
+        u
+        for u in urls
+        if args.all
+        or not _is_fresh(cache.get(u), now=now, max_age_s=args.max_age_days * 86400, retry_s=args.retry_hours * 3600)
+    ]
+    prober = Prober(
+        per_host=args.per_host,
+        max_bytes=args.max_bytes,
+        policy=FetchPolicy(connect_timeout=args.connect_timeout, read_timeout=args.read_timeout),
+    )
+    t0 = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, args.workers), thread_name_prefix="probe") as pool:
+        futures = {pool.submit(prober.probe, u): u for u in todo}
+        for fut in as_completed(futures):
+            r = fut.result()
+            cache[r["url"]] = r
+            feeds = ", ".join(f["url"] for f in r.get("feeds") or [])
+            status = f"{r['status']} {r.get('kind')}" if r.get("ok") else r.get("error")
+            found = f" -> {feeds}" if feeds else ""
+            print(f"{'OK  ' if r.get('ok') else 'FAIL'} {r['url']} ({status}, {r.get('latency_ms')} ms){found}")
+    elapsed = time.perf_counter() - t0
+
+    results = {u: cache[u] for u in urls if u in cache}
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+    data = {"updated_at": datetime.now(tz=timezone.utc).isoformat(), "results": cache}
+    tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    os.replace(tmp, cache_path)
+
+    live = sum(1 for r in results.values() if r.get("ok"))
+    feeds = sum(len(r.get("feeds") or []) for r in results.values())
+    print(
+        f"OK: probed {len(todo)} of {len(urls)} links in {elapsed:.1f}s ({len(urls) - len(todo)} cached); "
+        f"{live} live, {feeds} feeds -> {cache_path}"
+    )
+    if args.suggest:
+        print(_suggest_toml(results))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,139 @@
+from __future__ import annotations
+
+import datetime as dt
+import heapq
+from dataclasses import dataclass, field
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable
+
+from keywords import WeightedKeywords  # type: ignore
+from seen_index import item_keys  # type: ignore
+
+# Scoring formula (per item), configured by the topic's [ranking] table:
+#
+#   score = Σ keyword_weights[k] for each distinct keyword k in title + summary
+#         + recency_weight * 0.5 ** (age_hours / half_life_hours)
+#         + priority_weight * <source `priority`>
+#         - duplicate_penalty * <earlier items with the same URL / title>
+#
+# age is measured from `published` to the end of the run date (UTC), so replays score the
+# same; unparseable dates get no recency bonus. Without a [ranking] table the shortlist is
+# simply the first top_k items, as before.
+
+
+@dataclass(frozen=True)
+class RankingConfig:
+    keyword_weights: dict[str, float] = field(default_factory=dict)
+    recency_weight: float = 0.0
+    half_life_hours: float = 48.0
+    priority_weight: float = 1.0
+    duplicate_penalty: float = 0.0
+
+
+def parse_ranking(table: Any, *, sources: list[dict[str, Any]]) -> RankingConfig | None:
+    """RankingConfig from a topic's [ranking] table (None when the table is absent).
+
+    Without `keyword_weights`, every include keyword of the topic's sources weighs 1.0.
+    """
+    if table is None:
+        return None
+    if not isinstance(table, dict):
+        raise ValueError("[ranking] must be a table")
+    weights = table.get("keyword_weights")
+    if weights is None:
+        weights = {}
+        for src in sources:
+            if isinstance(src, dict):
+                for kw in src.get("include_keywords") or []:
+                    weights.setdefault(str(kw), 1.0)
+    if not isinstance(weights, dict):
+        raise ValueError("ranking.keyword_weights must be a table of keyword = weight")
+    cfg = RankingConfig(
+        keyword_weights={str(k): float(v) for k, v in weights.items()},
+        recency_weight=float(table.get("recency_weight", 0.0)),
+        half_life_hours=float(table.get("half_life_hours", 48.0)),
+        priority_weight=float(table.get("priority_weight", 1.0)),
+        duplicate_penalty=float(table.get("duplicate_penalty", 0.0)),
+    )
+    if cfg.half_life_hours <= 0:
+        raise ValueError("ranking.half_life_hours must be > 0")
+    return cfg
+
+
+def _parse_published(value: str) -> dt.datetime | None:
+    value = (value or "").strip()
+    if not value:
+        return None
+    try:
+        when = dt.datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)  # RSS (RFC 822)
+        except (TypeError, ValueError):
+            return None
+    return when if when.tzinfo else when.replace(tzinfo=dt.timezone.utc)
+
+
+class Ranker:
+    """Scores a topic's items; the caller keeps the best in a TopK as they stream in."""
+
+    def __init__(self, cfg: RankingConfig, *, sources: list[dict[str, Any]]) -> None:
+        self.cfg = cfg
+        self._keywords = WeightedKeywords(cfg.keyword_weights)
+        self._priority = {
+            str(src.get("id")): float(src.get("priority") or 0.0) for src in sources if isinstance(src, dict)
+        }
+
+    def scorer(self, *, date: str) -> Callable[[dict[str, Any]], float]:
+        """Score function for one run's items, called in collection order (the duplicate
+        penalty counts earlier calls)."""
+        cfg = self.cfg
+        ref = dt.datetime.fromisoformat(date).replace(tzinfo=dt.timezone.utc) + dt.timedelta(days=1)
+        decay_per_hour = 0.5 ** (1.0 / cfg.half_life_hours)
+        seen: dict[str, int] = {}
+
+        def score_item(item: dict[str, Any]) -> float:
+            score = 0.0
+            if self._keywords:
+                score += self._keywords.score(f"{item.get('title') or ''}\n{item.get('summary') or ''}")
+            if cfg.recency_weight:
+                when = _parse_published(str(item.get("published") or ""))
+                if when is not None:
+                    age_hours = max(0.0, (ref - when).total_seconds() / 3600)
+                    score += cfg.recency_weight * decay_per_hour**age_hours
+            if cfg.priority_weight:
+                score += cfg.priority_weight * self._priority.get(str(item.get("source_id")), 0.0)
+            if cfg.duplicate_penalty:
+                keys = item_keys(item)
+                copies = max((seen.get(k, 0) for k in keys), default=0)
+                score -= cfg.duplicate_penalty * copies
+                for k in keys:
+                    seen[k] = seen.get(k, 0) + 1
+            return score
+
+        return score_item
+
+
+class TopK:
+    """The `k` best values pushed so far, by score (ties: the earlier push wins).
+
+    A min-heap of at most `k` entries, so selecting from a stream costs O(k) memory.
+    """
+
+    def __init__(self, k: int) -> None:
+        self.k = max(0, k)
+        self._heap: list[tuple[float, int, Any]] = []
+        self._n = 0
+
+    def push(self, score: float, value: Any) -> None:
+        # (score, -order) orders entries, so values are never compared
+        entry = (score, -self._n, value)
+        self._n += 1
+        if len(self._heap) < self.k:
+            heapq.heappush(self._heap, entry)
+        elif self._heap and entry[:2] > self._heap[0][:2]:
+            heapq.heapreplace(self._heap, entry)
+
+    def ranked(self) -> list[Any]:
+        """Kept values, best first."""
+        return [value for _, _, value in sorted(self._heap, key=lambda e: e[:2], reverse=True)]
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, MutableMapping
+
+
+class TokenBucket:
+    """Thread-safe token bucket: `rate` tokens per second, bursts of up to `capacity`.
+
+    With capacity 1 this enforces a minimum spacing of 1/rate seconds between requests,
+    which is what arXiv asks of API clients (one request every 3 seconds).
+    """
+
+    def __init__(self, *, rate: float, capacity: float = 1.0) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be > 0")
+        self.rate = float(rate)
+        self.capacity = max(1.0, float(capacity))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until `tokens` are available; returns the time spent waiting (seconds)."""
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class SharedSpacing:
+    """Minimum spacing of `interval` seconds between requests to one key, across processes.
+
+    `lock` and `slots` come from a multiprocessing context or Manager (e.g. a Manager().dict()),
+    shared by every worker; each acquire reserves the next free slot under the lock and then
+    sleeps until it outside the lock.
+    """
+
+    def __init__(self, *, interval: float, key: str, lock: Any, slots: MutableMapping[str, float]) -> None:
+        self.interval = float(interval)
+        self.key = key
+        self._lock = lock
+        self._slots = slots
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            now = time.time()
+            slot = max(now, float(self._slots.get(self.key, 0.0)))
+            self._slots[self.key] = slot + self.interval * tokens
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+        return max(0.0, delay)
@@ -0,0 +1,266 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gzip
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO
+
+try:  # Python 3.14+
+    from compression import zstd as _zstd  # type: ignore
+except ImportError:
+    _zstd = None
+
+_DAY_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# objects this young are never collected: a concurrent run may not have recorded them yet
+_GC_GRACE_S = 3600.0
+
+
+class SnapshotMissing(FileNotFoundError):
+    """Raised by open_snapshot() when that run stored no body under the name."""
+
+
+def _atomic_write(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+class RawStore:
+    """Content-addressed, compressed store of raw feed bodies.
+
+    Layout under `root` (data/raw):
+      objects/<sha[:2]>/<sha256>.zst|.gz  body, keyed by the sha256 of the uncompressed bytes
+      <date>/<topic>/manifest.json        {"sources": {source_id: [{name, url, sha256, size}, ...]},
+                                           "marks": {source_id: high-water mark the source stopped at}}
+
+    A body identical to an earlier day's (or another topic's) is stored once. zstd is used
+    when the interpreter ships it, gzip otherwise; readers handle both.
+    """
+
+    def __init__(self, root: Path, *, codec: str = "auto") -> None:
+        if codec not in ("auto", "zstd", "gzip"):
+            raise ValueError(f"unknown raw codec: {codec}")
+        if codec == "zstd" and _zstd is None:
+            raise ValueError("zstd needs Python 3.14+ (compression.zstd)")
+        self.root = Path(root)
+        self.suffix = ".zst" if codec != "gzip" and _zstd is not None else ".gz"
+        self._lock = threading.Lock()
+
+    @property
+    def objects_dir(self) -> Path:
+        return self.root / "objects"
+
+    def _object_path(self, sha256: str, suffix: str) -> Path:
+        return self.objects_dir / sha256[:2] / f"{sha256}{suffix}"
+
+    def object_path(self, sha256: str) -> Path | None:
+        for suffix in (self.suffix, ".zst", ".gz"):
+            path = self._object_path(sha256, suffix)
+            if path.exists():
+                return path
+        return None
+
+    def writer(self) -> RawWriter:
+        return RawWriter(self)
+
+    def open(self, sha256: str) -> BinaryIO:
+        """Decompressed body of an object."""
+        path = self.object_path(sha256)
+        if path is None:
+            raise FileNotFoundError(f"raw object not found: {sha256}")
+        if path.suffix == ".zst":
+            if _zstd is None:
+                raise RuntimeError(f"{path} is zstd-compressed; reading it needs Python 3.14+")
+            return _zstd.open(path, "rb")  # type: ignore[no-any-return]
+        return gzip.open(path, "rb")  # type: ignore[return-value]
+
+    def _load(self, raw_dir: Path) -> dict[str, Any]:
+        path = Path(raw_dir) / "manifest.json"
+        if not path.exists():
+            return {}
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except Exception:
+            return {}
+        return data if isinstance(data, dict) else {}
+
+    def manifest(self, raw_dir: Path) -> dict[str, list[dict[str, Any]]]:
+        """source_id -> snapshots (pages in fetch order) recorded for one day/topic."""
+        return dict(self._load(raw_dir).get("sources") or {})
+
+    def marks(self, raw_dir: Path) -> dict[str, str]:
+        """source_id -> high-water mark a paginated source stopped at on that day/topic."""
+        return dict(self._load(raw_dir).get("marks") or {})
+
+    def _update(self, raw_dir: Path, source_id: str, fn: Any, *, mark: str | None = None) -> None:
+        """Apply `fn` to the source's snapshots; `mark` replaces its high-water mark ("" drops it)."""
+        with self._lock:
+            data = self._load(raw_dir)
+            sources = dict(data.get("sources") or {})
+            sources[source_id] = fn(list(sources.get(source_id) or []))
+            out: dict[str, Any] = {"sources": sources}
+            marks = dict(data.get("marks") or {})
+            if mark is not None:
+                marks.pop(source_id, None)
+                if mark:
+                    marks[source_id] = mark
+            if marks:
+                out["marks"] = marks
+            text = json.dumps(out, ensure_ascii=False, indent=2) + "\n"
+            _atomic_write(Path(raw_dir) / "manifest.json", text.encode("utf-8"))
+
+    def forget(self, raw_dir: Path, *, source_id: str) -> None:
+        """Drop a source's snapshots (and mark) before it is collected again (e.g. a re-run of the same day)."""
+        self._update(raw_dir, source_id, lambda snaps: [], mark="")
+
+    def record_mark(self, raw_dir: Path, *, source_id: str, mark: str) -> None:
+        """Remember the high-water mark a source stopped at, so a replay stops there too."""
+        self._update(raw_dir, source_id, lambda snaps: snaps, mark=mark)
+
+    def record(self, raw_dir: Path, *, source_id: str, name: str, url: str, sha256: str, size: int) -> None:
+        snap = {"name": name, "url": url, "sha256": sha256, "size": size}
+
+        def put(snaps: list[dict[str, Any]]) -> list[dict[str, Any]]:
+            return [s for s in snaps if s.get("name") != name] + [snap]
+
+        self._update(raw_dir, source_id, put)
+
+    def open_snapshot(self, raw_dir: Path, name: str) -> BinaryIO:
+        """Body stored as `name` for a day/topic; falls back to a plain file from before the store."""
+        for snaps in self.manifest(raw_dir).values():
+            for snap in snaps:
+                if snap.get("name") == name:
+                    return self.open(str(snap["sha256"]))
+        path = Path(raw_dir) / name
+        if not path.exists():
+            # a source's snapshots are only recorded once its body was fetched in full
+            raise SnapshotMissing("no snapshot stored (source failed in the original run)")
+        return path.open("rb")
+
+    def gc(self, *, keep_days: int, today: str, dry_run: bool = False) -> dict[str, int]:
+        """Delete day directories older than `keep_days`, then objects no remaining manifest uses."""
+        cutoff = (dt.date.fromisoformat(today) - dt.timedelta(days=max(0, keep_days) - 1)).isoformat()
+        stats = {"days_removed": 0, "objects_removed": 0, "bytes_freed": 0, "objects_kept": 0}
+        if not self.root.exists():
+            return stats
+        live: set[str] = set()
+        for day in sorted(self.root.iterdir()):
+            if not day.is_dir() or not _DAY_RE.match(day.name):
+                continue
+            if day.name < cutoff:
+                stats["days_removed"] += 1
+                if not dry_run:
+                    shutil.rmtree(day)
+                continue
+            for topic_dir in day.iterdir():
+                for snaps in self.manifest(topic_dir).values():
+                    live.update(str(s.get("sha256")) for s in snaps)
+
+        if not self.objects_dir.exists():
+            return stats
+        now = time.time()
+        for fan in sorted(self.objects_dir.iterdir()):
+            for obj in sorted(fan.iterdir()) if fan.is_dir() else ():
+                sha = obj.name.split(".", 1)[0]
+                st = obj.stat()
+                if sha in live or now - st.st_mtime < _GC_GRACE_S:
+                    stats["objects_kept"] += 1
+                    continue
+                stats["objects_removed"] += 1
+                stats["bytes_freed"] += st.st_size
+                if not dry_run:
+                    obj.unlink()
+            if not dry_run and fan.is_dir() and not any(fan.iterdir()):
+                fan.rmdir()
+        return stats
+
+
+class RawWriter:
+    """Hashes and compresses a body into a temp file; `commit()` moves it into the object store.
+
+    The same body committed twice is kept once (the existing object's mtime is refreshed,
+    which keeps it clear of gc's grace period).
+    """
+
+    def __init__(self, store: RawStore) -> None:
+        self._store = store
+        self._hash = hashlib.sha256()
+        self.size = 0
+        self.sha256 = ""
+        store.objects_dir.mkdir(parents=True, exist_ok=True)
+        self._tmp = store.objects_dir / f".{os.getpid()}.{threading.get_ident()}.{id(self)}.tmp"
+        self._raw = self._tmp.open("wb")
+        if store.suffix == ".zst":
+            self._f: Any = _zstd.ZstdFile(self._raw, "wb")  # type: ignore[union-attr]
+        else:
+            self._f = gzip.GzipFile(fileobj=self._raw, mode="wb", mtime=0)
+
+    def write(self, chunk: bytes) -> None:
+        self._hash.update(chunk)
+        self.size += len(chunk)
+        self._f.write(chunk)
+
+    def _close(self) -> None:
+        self._f.close()
+        self._raw.close()
+
+    def commit(self) -> str:
+        self._close()
+        self.sha256 = self._hash.hexdigest()
+        existing = self._store.object_path(self.sha256)
+        if existing is not None:
+            self._tmp.unlink()
+            os.utime(existing)
+        else:
+            path = self._store._object_path(self.sha256, self._store.suffix)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(self._tmp, path)
+        return self.sha256
+
+    def abort(self) -> None:
+        try:
+            self._close()
+        finally:
+            self._tmp.unlink(missing_ok=True)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Raw snapshot store maintenance.")
+    parser.add_argument("--root", default="data/raw")
+    sub = parser.add_subparsers(dest="cmd", required=True)
+    p_gc = sub.add_parser("gc", help="Apply the retention policy and drop unreferenced objects.")
+    p_gc.add_argument("--keep-days", type=int, default=30, help="Keep this many most recent days (incl. today).")
+    p_gc.add_argument("--today", default=dt.date.today().isoformat())
+    p_gc.add_argument("--dry-run", action="store_true")
+    p_cat = sub.add_parser("cat", help="Write a stored snapshot (decompressed) to stdout.")
+    p_cat.add_argument("raw_dir", help="Day/topic directory, e.g. data/raw/2025-01-01/ai_papers")
+    p_cat.add_argument("name", help="Snapshot name from manifest.json, e.g. arxiv_app.atom.xml")
+    args = parser.parse_args()
+
+    store = RawStore(Path(args.root))
+    if args.cmd == "gc":
+        stats = store.gc(keep_days=args.keep_days, today=args.today, dry_run=args.dry_run)
+        prefix = "DRY-RUN: " if args.dry_run else ""
+        print(
+            f"{prefix}removed {stats['days_removed']} days, {stats['objects_removed']} objects "
+            f"({stats['bytes_freed'] / 1e6:.1f} MB); kept {stats['objects_kept']} objects"
+        )
+        return 0
+    with store.open_snapshot(Path(args.raw_dir), args.name) as f:
+        shutil.copyfileobj(f, sys.stdout.buffer)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
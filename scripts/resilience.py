@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import email.utils
+import functools
+import http.client
+import json
+import os
+import random
+import re
+import socket
+import threading
+import time
+import urllib.error
+import urllib.request
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+# Retry / circuit-breaker policy for opening source URLs (see sources._urlopen).
+#
+# Only the open is retried (connect, request, status line + headers): once a body is being
+# streamed into a parser it cannot be replayed, so a read that times out fails the source.
+# Per-host breakers live in `<state>/circuits/<host>.json`, so a feed that has been down for
+# days is skipped in milliseconds instead of costing every run its full retry budget.
+
+_RETRY_STATUSES = {408, 425, 429, 500, 502, 503, 504}
+
+
+@dataclass(frozen=True)
+class FetchPolicy:
+    retries: int = 2
+    backoff_base: float = 0.5
+    backoff_max: float = 30.0
+    # a longer Retry-After is not waited for; the request fails instead
+    max_retry_after: float = 60.0
+    connect_timeout: float = 10.0
+    # per socket read, not for the whole body
+    read_timeout: float = 30.0
+    # consecutive failed requests (after retries) that open a host's circuit
+    circuit_threshold: int = 3
+    circuit_cooldown: float = 6 * 3600.0
+    circuit_max_cooldown: float = 7 * 86400.0
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of a request while the host's circuit is open."""
+
+
+class _HTTPConnection(http.client.HTTPConnection):
+    # `timeout` (the connect deadline) applies to connecting; every later socket op gets read_timeout
+    def __init__(self, *args: Any, read_timeout: float, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._read_timeout = read_timeout
+
+    def connect(self) -> None:
+        super().connect()
+        self.sock.settimeout(self._read_timeout)
+
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    def __init__(self, *args: Any, read_timeout: float, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self._read_timeout = read_timeout
+
+    def connect(self) -> None:
+        super().connect()  # TCP connect + TLS handshake under the connect deadline
+        self.sock.settimeout(self._read_timeout)
+
+
+class _HTTPHandler(urllib.request.HTTPHandler):
+    def __init__(self, read_timeout: float) -> None:
+        super().__init__()
+        self._read_timeout = read_timeout
+
+    def http_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self.do_open(functools.partial(_HTTPConnection, read_timeout=self._read_timeout), req)
+
+
+class _HTTPSHandler(urllib.request.HTTPSHandler):
+    def __init__(self, read_timeout: float) -> None:
+        super().__init__()
+        self._read_timeout = read_timeout
+
+    def https_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        conn = functools.partial(_HTTPSConnection, read_timeout=self._read_timeout)
+        return self.do_open(conn, req, context=self._context)  # type: ignore[attr-defined]
+
+
+def build_opener(policy: FetchPolicy) -> urllib.request.OpenerDirector:
+    """urllib opener whose reads time out after `policy.read_timeout`; pass
+    `timeout=policy.connect_timeout` to open()."""
+    return urllib.request.build_opener(_HTTPHandler(policy.read_timeout), _HTTPSHandler(policy.read_timeout))
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(exc, urllib.error.HTTPError):
+        return exc.code in _RETRY_STATUSES
+    if isinstance(exc, urllib.error.URLError):
+        return isinstance(exc.reason, (OSError, socket.timeout))
+    return isinstance(exc, (OSError, TimeoutError, ConnectionError))
+
+
+def counts_against_host(exc: BaseException) -> bool:
+    """Whether a failure says something about the host's health (a 404 or 403 does not)."""
+    if isinstance(exc, urllib.error.HTTPError):
+        return exc.code >= 500 or exc.code in (408, 429)
+    return is_retryable(exc)
+
+
+def parse_retry_after(value: str | None, *, now: float | None = None) -> float | None:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    value = (value or "").strip()
+    if not value:
+        return None
+    if re.fullmatch(r"\d+", value):
+        return float(value)
+    try:
+        when = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, when.timestamp() - (time.time() if now is None else now))
+
+
+def retry_delay(policy: FetchPolicy, attempt: int, exc: BaseException) -> float | None:
+    """Seconds to sleep before retry number `attempt` (0-based), or None to give up."""
+    if attempt >= policy.retries or not is_retryable(exc):
+        return None
+    if isinstance(exc, urllib.error.HTTPError) and exc.headers is not None:
+        wait = parse_retry_after(exc.headers.get("Retry-After"))
+        if wait is not None:
+            return wait if wait <= policy.max_retry_after else None
+    # "full jitter": spreads retries from many workers instead of synchronising them
+    return random.uniform(0.0, min(policy.backoff_max, policy.backoff_base * (2**attempt)))
+
+
+@dataclass
+class _Circuit:
+    failures: int = 0
+    open_until: float = 0.0
+    cooldown: float = 0.0
+    last_error: str = ""
+    # half-open: one probe request is in flight after the cooldown expired
+    probing: bool = False
+
+
+class CircuitBreakers:
+    """Per-host consecutive-failure breakers, persisted under `state_dir` (memory only when None).
+
+    Closed: requests go through; `circuit_threshold` failures in a row open the circuit for
+    `circuit_cooldown`. Open: requests fail fast with CircuitOpenError. After the cooldown one
+    probe is let through: success closes the circuit, failure re-opens it with the cooldown
+    doubled (up to `circuit_max_cooldown`).
+    """
+
+    def __init__(self, state_dir: Path | None, policy: FetchPolicy) -> None:
+        self.root = Path(state_dir) / "circuits" if state_dir is not None else None
+        self.policy = policy
+        self._circuits: dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, host: str) -> Path | None:
+        if self.root is None:
+            return None
+        return self.root / (re.sub(r"[^A-Za-z0-9_.-]+", "_", host) + ".json")
+
+    def _get(self, host: str) -> _Circuit:
+        c = self._circuits.get(host)
+        if c is None:
+            c = _Circuit()
+            path = self._path(host)
+            if path is not None and path.exists():
+                try:
+                    data: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+                    c = _Circuit(
+                        failures=int(data.get("failures") or 0),
+                        open_until=float(data.get("open_until") or 0),
+                        cooldown=float(data.get("cooldown") or 0),
+                        last_error=str(data.get("last_error") or ""),
+                    )
+                except Exception:
+                    pass
+            self._circuits[host] = c
+        return c
+
+    def _save(self, host: str, c: _Circuit) -> None:
+        path = self._path(host)
+        if path is None:
+            return
+        if not c.failures and not c.open_until:
+            path.unlink(missing_ok=True)
+            return
+        data = {
+            "host": host,
+            "failures": c.failures,
+            "open_until": c.open_until,
+            "cooldown": c.cooldown,
+            "last_error": c.last_error,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_text(json.dumps(data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+
+    def check(self, host: str) -> None:
+        """Raise CircuitOpenError unless a request to `host` may go out now."""
+        with self._lock:
+            c = self._get(host)
+            if not c.open_until:
+                return
+            now = time.time()
+            if now < c.open_until or c.probing:
+                until = time.strftime("%Y-%m-%d %H:%M", time.localtime(c.open_until))
+                raise CircuitOpenError(f"circuit open for {host} until {until} ({c.failures} failures: {c.last_error})")
+            c.probing = True
+
+    def record_success(self, host: str) -> None:
+        with self._lock:
+            c = self._get(host)
+            if not c.failures and not c.open_until:
+                return
+            self._circuits[host] = c = _Circuit()
+            self._save(host, c)
+
+    def record_failure(self, host: str, error: BaseException) -> None:
+        with self._lock:
+            c = self._get(host)
+            c.failures += 1
+            c.last_error = repr(error)[:300]
+            if c.probing or c.failures >= self.policy.circuit_threshold:
+                cooldown = c.cooldown * 2 if c.probing and c.cooldown else self.policy.circuit_cooldown
+                c.cooldown = min(cooldown, self.policy.circuit_max_cooldown)
+                c.open_until = time.time() + c.cooldown
+                c.probing = False
+            self._save(host, c)
@@ -2,27 +2,52 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import datetime as dt
+import functools
 import json
+import multiprocessing
 import os
-from dataclasses import dataclass
+import sys
+import time
+import traceback
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import redirect_stderr, redirect_stdout
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Iterable
-
-import tomllib
+from typing import Any, Iterable, Iterator
 
 # NOTE: This file is intended to be runnable as `python scripts/run_daily.py`.
 # In that mode, `sys.path[0]` is `scripts/`, so we import sibling modules directly.
-from sources import collect_items  # type: ignore
+from aio_fetch import AsyncFetcher  # type: ignore
+from archive import Archive  # type: ignore
+from dedupe import Clusterer  # type: ignore
+from feed_cache import FeedCache  # type: ignore
+from http_cache import HttpCache  # type: ignore
+from metrics import SourceStats, write_prometheus  # type: ignore
+from rank import Ranker, TopK  # type: ignore
+from raw_store import RawStore, SnapshotMissing  # type: ignore
+from resilience import CircuitBreakers, FetchPolicy  # type: ignore
+from run_journal import TopicJournal  # type: ignore
+from search_index import SearchIndex, file_signature  # type: ignore
+from seen_index import SeenIndex  # type: ignore
+from sources import (  # type: ignore
+    SkipFn,
+    commit_marks,
+    iter_items,
+    feed_family,
+    set_feed_cache,
+    set_fetch_policy,
+    set_host_concurrency,
+    set_http_cache,
+    set_opener,
+    set_raw_store,
+    set_replay,
+    set_shared_spacing,
+    set_state_dir,
+)
 from text import build_digest_markdown  # type: ignore
-
-
-@dataclass(frozen=True)
-class TopicConfig:
-    topic_id: str
-    title: str
-    sources: list[dict[str, Any]]
-    top_k: int
+from topic_registry import TopicConfig, TopicConfigError, load_topic, topic_ids, validate_topics  # type: ignore
 
 
 def _today_yyyy_mm_dd() -> str:
@@ -30,29 +55,10 @@ def _today_yyyy_mm_dd() -> str:
 
 
 def _load_topic_config(topic_id: str) -> TopicConfig:
-    cfg_path = Path("topics") / f"{topic_id}.toml"
-    if not cfg_path.exists():
-        raise SystemExit(f"Topic config not found: {cfg_path}")
-    data = tomllib.loads(cfg_path.read_text(encoding="utf-8"))
-
-    meta = data.get("meta", {})
-    sources = data.get("sources", [])
-    if not isinstance(sources, list):
-        raise SystemExit(f"Invalid sources in {cfg_path}")
-
-    top_k = 8
-    for src in sources:
-        if isinstance(src, dict) and "top_k" in src:
-            try:
-                top_k = int(src["top_k"])
-            except Exception:
-                pass
-    return TopicConfig(
-        topic_id=meta.get("id", topic_id),
-        title=meta.get("title", topic_id),
-        sources=sources,
-        top_k=top_k,
-    )
+    try:
+        return load_topic(topic_id)
+    except TopicConfigError as e:
+        raise SystemExit(str(e))
 
 
 def _ensure_dir(path: Path) -> None:
@@ -60,10 +66,13 @@ def _ensure_dir(path: Path) -> None:
 
 
 def _write_jsonl(path: Path, items: Iterable[dict[str, Any]]) -> None:
+    # temp file + rename: a crash never leaves a half-written file in place
     _ensure_dir(path.parent)
-    with path.open("w", encoding="utf-8") as f:
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with tmp.open("w", encoding="utf-8") as f:
         for item in items:
             f.write(json.dumps(item, ensure_ascii=False) + "\n")
+    os.replace(tmp, path)
 
 
 def _append_jsonl(path: Path, items: Iterable[dict[str, Any]]) -> None:
@@ -75,50 +84,737 @@ def _append_jsonl(path: Path, items: Iterable[dict[str, Any]]) -> None:
 
 def _write_text(path: Path, content: str) -> None:
     _ensure_dir(path.parent)
-    path.write_text(content, encoding="utf-8")
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(content, encoding="utf-8")
+    os.replace(tmp, path)
 
 
-def run_one_topic(*, topic_id: str, date: str) -> None:
+@dataclass(frozen=True)
+class TopicRun:
+    cfg: TopicConfig
+    date: str
+    raw_dir: Path
+    processed_dir: Path
+    sources: list[dict[str, Any]]
+    seen: SeenIndex | None = None
+    archive: Archive | None = None
+    index: SearchIndex | None = None
+    journal: TopicJournal | None = None
+    # --resume: checkpoints of the sources an earlier attempt finished (a prefix of `sources`);
+    # `complete` when that attempt finished the whole topic
+    done: list[dict[str, Any]] = field(default_factory=list)
+    complete: bool = False
+    # rebuilt from data/raw (--replay): the day's outputs, errors.jsonl included, are replaced
+    replay: bool = False
+    # items dropped as already published; still marked so their last-seen day moves forward
+    skipped: list[dict[str, Any]] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter)
+
+    @property
+    def pending(self) -> list[dict[str, Any]]:
+        """Sources still to collect."""
+        return [] if self.complete else self.sources[len(self.done) :]
+
+    def skip_fn(self) -> SkipFn | None:
+        seen = self.seen
+        if seen is None:
+            return None
+
+        def skip(item: dict[str, Any]) -> bool:
+            if seen.seen_before(item, date=self.date):
+                self.skipped.append(
+                    {"source_id": item.get("source_id"), "url": item.get("url"), "title": item.get("title")}
+                )
+                return True
+            return False
+
+        return skip
+
+
+def _plan_topic(
+    *,
+    topic_id: str,
+    date: str,
+    offline: bool = False,
+    seen: SeenIndex | None = None,
+    archive: Archive | None = None,
+    index: SearchIndex | None = None,
+    journal_dir: str = "",
+    resume: bool = False,
+    replay: bool = False,
+) -> TopicRun:
     cfg = _load_topic_config(topic_id)
 
     raw_dir = Path("data/raw") / date / cfg.topic_id
     processed_dir = Path("data/processed") / date / cfg.topic_id
     _ensure_dir(raw_dir)
     _ensure_dir(processed_dir)
+    sources = _enabled_sources(cfg, offline=offline)
+
+    journal: TopicJournal | None = None
+    done: list[dict[str, Any]] = []
+    complete = False
+    skipped: list[dict[str, Any]] = []
+    if journal_dir:
+        journal = TopicJournal.load(Path(journal_dir), date=date, topic=cfg.topic_id)
+        if resume and journal.complete:
+            complete = all((processed_dir / name).exists() for name in ("items.jsonl", "metrics.jsonl"))
+        elif resume:
+            done = journal.finished(sources, partial=processed_dir / "items.jsonl.partial")
+            # what the finished sources skipped still gets its last-seen day moved forward
+            skipped = [s for entry in done for s in entry.get("skipped") or []]
+        if not complete:
+            journal.start(done)
 
-    all_items: list[dict[str, Any]] = []
+    return TopicRun(
+        cfg=cfg,
+        date=date,
+        raw_dir=raw_dir,
+        processed_dir=processed_dir,
+        sources=sources,
+        seen=seen,
+        archive=archive,
+        index=index,
+        journal=journal,
+        done=done,
+        complete=complete,
+        skipped=skipped,
+        replay=replay,
+    )
+
+
+def _enabled_sources(cfg: TopicConfig, *, offline: bool) -> list[dict[str, Any]]:
+    sources: list[dict[str, Any]] = []
     for src in cfg.sources:
         if not isinstance(src, dict):
             continue
         if not bool(src.get("enabled", True)):
             continue
+        # propagate offline switch to collectors without mutating topic files or the environment
+        if offline:
+            src = {**src, "offline": "1"}
+        sources.append(src)
+    return sources
+
+
+def _shared_feeds(topic_ids: list[str], *, offline: bool) -> set[str]:
+    """Feed families requested by more than one enabled source across `topic_ids`."""
+    counts: dict[str, int] = {}
+    for topic_id in topic_ids:
         try:
-            # propagate offline switch to collectors without mutating topic files
-            if os.environ.get("OFFLINE") == "1":
-                src = {**src, "offline": "1"}
-            items = collect_items(source=src, raw_dir=raw_dir)
-            all_items.extend(items)
-        except Exception as e:
-            err = {
-                "source_id": src.get("id"),
-                "kind": src.get("kind"),
-                "error": repr(e),
-            }
-            _append_jsonl(processed_dir / "errors.jsonl", [err])
-
-    # naive ranking: keep stable order, then take top_k after keyword filtering inside collectors
-    shortlist = all_items[: cfg.top_k]
-
-    _write_jsonl(processed_dir / "items.jsonl", all_items)
+            cfg = _load_topic_config(topic_id)
+        except SystemExit:
+            continue  # reported when the topic itself runs
+        for src in _enabled_sources(cfg, offline=offline):
+            family = feed_family(src)
+            if family is not None:
+                counts[family] = counts.get(family, 0) + 1
+    return {family for family, n in counts.items() if n > 1}
+
+
+# (items, stats) for one source; items may be a live stream, see _collect_source()
+SourceResult = tuple[Iterable[dict[str, Any]], SourceStats]
+
+
+def _stream_source(
+    *, src: dict[str, Any], raw_dir: Path, skip: SkipFn | None, stats: SourceStats
+) -> Iterator[dict[str, Any]]:
+    """Items of one source as its collector parses them. A failure ends the stream and is
+    recorded in `stats.error`; items yielded before it are kept."""
+    items = iter_items(source=src, raw_dir=raw_dir, skip=skip, stats=stats)
+    # time the consumer spends between items falls inside the collector's fetch blocks
+    outside = 0.0
+    try:
+        while True:
+            t0 = time.perf_counter()
+            try:
+                item = next(items, None)
+            except SnapshotMissing as e:
+                stats.error = str(e)
+                item = None
+            except Exception as e:
+                stats.error = repr(e)
+                item = None
+            t1 = time.perf_counter()
+            stats.seconds += t1 - t0
+            if item is None:
+                return
+            stats.items += 1
+            yield item
+            outside += time.perf_counter() - t1
+    finally:
+        stats.parse_seconds = max(0.0, stats.parse_seconds - outside)
+
+
+def _collect_source(
+    *, src: dict[str, Any], raw_dir: Path, skip: SkipFn | None = None, stream: bool = False
+) -> SourceResult:
+    """A source's items: a lazy stream that fetches as it is consumed, or (for worker threads)
+    a list collected up front."""
+    stats = SourceStats(source_id=str(src.get("id")), kind=str(src.get("kind") or ""))
+    items = _stream_source(src=src, raw_dir=raw_dir, skip=skip, stats=stats)
+    return (items if stream else list(items)), stats
+
+
+def _submit_topic(run: TopicRun, pool: Executor) -> list[Future]:
+    skip = run.skip_fn()
+    return [pool.submit(_collect_source, src=src, raw_dir=run.raw_dir, skip=skip) for src in run.pending]
+
+
+def _release(pending: list[Any]) -> Iterator[Any]:
+    """Hand out `pending` front to back, dropping each reference so a written source can be freed."""
+    pending.reverse()
+    while pending:
+        yield pending.pop()
+
+
+def _skip_complete_topic(run: TopicRun) -> list[dict[str, Any]]:
+    """--resume of a topic an earlier attempt finished: nothing is fetched or rewritten."""
+    if run.seen is not None:
+        # the seen index is only saved at the end of a run, which that attempt may not have reached
+        run.seen.mark(_iter_jsonl(run.processed_dir / "items.jsonl"), date=run.date)
+    print(f"SKIP: {run.cfg.topic_id} {run.date} already complete")
+    return list(_iter_jsonl(run.processed_dir / "metrics.jsonl"))
+
+
+def _finish_topic(run: TopicRun, results: Iterable[SourceResult]) -> list[dict[str, Any]]:
+    """Stream a topic's pending sources, in config order, into its outputs; returns its metrics
+    records (also written to metrics.jsonl).
+
+    Items go to items.jsonl.partial as they arrive (flushed after each source, then checkpointed
+    in the run journal), which becomes items.jsonl once the topic is done, so a crash leaves
+    everything collected so far. On --resume the finished sources' items are merged again from
+    that file instead of being fetched. Only the shortlist (a bounded top-k heap) and per-item
+    dedupe keys are held in memory.
+    """
+    if run.complete:
+        return _skip_complete_topic(run)
+    cfg = run.cfg
+    processed_dir = run.processed_dir
+    items_path = processed_dir / "items.jsonl"
+    partial = items_path.with_name(items_path.name + ".partial")
+
+    # near-duplicates (same paper / story from several feeds) collapse onto their first copy;
+    # items.jsonl keeps every copy, only representatives compete for the shortlist
+    clusterer = Clusterer(cfg.dedupe) if cfg.dedupe is not None else None
+    score_item = Ranker(cfg.ranking, sources=cfg.sources).scorer(date=run.date) if cfg.ranking is not None else None
+    # no [ranking] table: every candidate scores 0, so the first top_k win (collection order)
+    best = TopK(cfg.top_k)
+    # representative index -> what its copies point at / the copies found so far
+    rep_ref: dict[int, Any] = {}
+    alternates: dict[int, list[dict[str, Any]]] = {}
+
+    metrics: list[dict[str, Any]] = []
+    errors = n_items = n_candidates = 0
+
+    def merge(item: dict[str, Any]) -> None:
+        nonlocal n_items, n_candidates
+        i = n_items
+        n_items += 1
+        rep = clusterer.add(item) if clusterer is not None else i
+        if rep == i:
+            n_candidates += 1
+            if clusterer is not None:
+                rep_ref[i] = item.get("url") or item.get("title")
+            score = 0.0
+            if score_item is not None:
+                score = score_item(item)
+                item["score"] = round(score, 4)
+            best.push(score, (i, item))
+        else:
+            item["duplicate_of"] = rep_ref[rep]
+            alternates.setdefault(rep, []).append(
+                {"source_id": item.get("source_id"), "title": item.get("title"), "url": item.get("url")}
+            )
+        if run.seen is not None:
+            run.seen.mark((item,), date=run.date)
+
+    _ensure_dir(processed_dir)
+    if run.replay:
+        # the original run's errors (and nothing else) are reported again below
+        (processed_dir / "errors.jsonl").unlink(missing_ok=True)
+    if run.done:
+        # drop whatever followed the last checkpoint, then re-merge the rest in place
+        with partial.open("r+b") as f:
+            f.truncate(int(run.done[-1]["offset"]))
+            for line in f:
+                item = json.loads(line)
+                item.pop("score", None)
+                item.pop("duplicate_of", None)
+                merge(item)
+        for entry in run.done:
+            metrics.append(entry["metrics"])
+            errors += 1 if entry["metrics"].get("error") is not None else 0
+    raw_store = RawStore(Path("data/raw")) if run.journal is not None else None
+    with partial.open("a" if run.done else "w", encoding="utf-8") as out:
+        for src, (items, stats) in zip(run.pending, results):
+            for item in items:
+                merge(item)
+                out.write(json.dumps(item, ensure_ascii=False) + "\n")
+            out.flush()
+            if stats.error is not None:
+                _append_jsonl(
+                    processed_dir / "errors.jsonl",
+                    [{"source_id": stats.source_id, "kind": stats.kind, "error": stats.error}],
+                )
+                errors += 1
+            record = stats.record(topic=cfg.topic_id, date=run.date)
+            metrics.append(record)
+            if run.journal is not None and raw_store is not None:
+                snaps = raw_store.manifest(run.raw_dir).get(stats.source_id) or []
+                run.journal.source_done(
+                    src,
+                    items=stats.items,
+                    offset=os.fstat(out.fileno()).st_size,
+                    raw=[str(snap.get("sha256")) for snap in snaps],
+                    metrics=record,
+                    skipped=[s for s in run.skipped if s.get("source_id") == stats.source_id],
+                )
+    t_write = time.perf_counter()
+
+    shortlist: list[dict[str, Any]] = []
+    for i, item in best.ranked():
+        if i in alternates:
+            item["alternates"] = alternates[i]
+        shortlist.append(item)
+
+    os.replace(partial, items_path)
     _write_jsonl(processed_dir / "shortlist.jsonl", shortlist)
 
-    digest = build_digest_markdown(topic_title=cfg.title, date=date, items=shortlist)
+    digest = build_digest_markdown(topic_title=cfg.title, date=run.date, items=shortlist)
     _write_text(processed_dir / "digest.md", digest)
 
-    print(f"OK: {topic_id} {date} -> {processed_dir}")
+    if run.archive is not None:
+        run.archive.append_jsonl(date=run.date, topic=cfg.topic_id, kind="items", path=items_path)
+        run.archive.append(date=run.date, topic=cfg.topic_id, kind="shortlist", rows=shortlist)
+    if run.index is not None:
+        run.index.add_day(
+            date=run.date,
+            topic=cfg.topic_id,
+            items=_iter_jsonl(items_path),
+            shortlist=shortlist,
+            sig=file_signature(items_path),
+        )
+
+    if run.seen is not None:
+        run.seen.mark(run.skipped, date=run.date)
+
+    now = time.perf_counter()
+    metrics.append(
+        {
+            "scope": "topic",
+            "topic": cfg.topic_id,
+            "date": run.date,
+            "sources": len(metrics),
+            "errors": errors,
+            "items": n_items,
+            "duplicates": n_items - n_candidates,
+            "shortlist": len(shortlist),
+            "skipped_seen": len(run.skipped),
+            "resumed_sources": len(run.done),
+            "seconds": round(now - run.started, 4),
+            "write_seconds": round(now - t_write, 4),
+        }
+    )
+    _write_jsonl(processed_dir / "metrics.jsonl", metrics)
+    # high-water marks move forward only once the topic's outputs are in place
+    commit_marks(run.raw_dir)
+    if run.journal is not None:
+        run.journal.topic_done()
+
+    skipped = f" (skipped {len(run.skipped)} seen)" if run.skipped else ""
+    resumed = f" (resumed after {len(run.done)} sources)" if run.done else ""
+    print(f"OK: {cfg.topic_id} {run.date} -> {processed_dir}{skipped}{resumed}")
+    return metrics
+
+
+def run_one_topic(
+    *,
+    topic_id: str,
+    date: str,
+    offline: bool = False,
+    seen: SeenIndex | None = None,
+    archive: Archive | None = None,
+    index: SearchIndex | None = None,
+    journal_dir: str = "",
+    resume: bool = False,
+    replay: bool = False,
+) -> list[dict[str, Any]]:
+    run = _plan_topic(
+        topic_id=topic_id,
+        date=date,
+        offline=offline,
+        seen=seen,
+        archive=archive,
+        index=index,
+        journal_dir=journal_dir,
+        resume=resume,
+        replay=replay,
+    )
+    skip = run.skip_fn()
+    # one source at a time, each streamed from its parser straight into the writers
+    return _finish_topic(
+        run, (_collect_source(src=src, raw_dir=run.raw_dir, skip=skip, stream=True) for src in run.pending)
+    )
+
+
+def run_topics_concurrently(
+    *,
+    topic_ids: list[str],
+    date: str,
+    workers: int,
+    offline: bool = False,
+    seen: SeenIndex | None = None,
+    archive: Archive | None = None,
+    index: SearchIndex | None = None,
+    journal_dir: str = "",
+    resume: bool = False,
+    replay: bool = False,
+) -> list[dict[str, Any]]:
+    """Fetch every source of every topic in one thread pool, then merge per topic in config order."""
+    plan = {"offline": offline, "seen": seen, "archive": archive, "index": index, "journal_dir": journal_dir}
+    plan.update(resume=resume, replay=replay)
+    runs = [_plan_topic(topic_id=t, date=date, **plan) for t in topic_ids]  # type: ignore[arg-type]
+    metrics: list[dict[str, Any]] = []
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="collect") as pool:
+        pending = [(run, _submit_topic(run, pool)) for run in runs]
+        for run, futures in pending:
+            metrics.extend(_finish_topic(run, (f.result() for f in _release(futures))))
+    return metrics
+
+
+def run_topics_async(
+    *,
+    topic_ids: list[str],
+    date: str,
+    workers: int,
+    max_in_flight: int,
+    offline: bool = False,
+    seen: SeenIndex | None = None,
+    archive: Archive | None = None,
+    index: SearchIndex | None = None,
+    journal_dir: str = "",
+    resume: bool = False,
+    replay: bool = False,
+    connect_timeout: float = 10.0,
+    read_timeout: float = 30.0,
+) -> list[dict[str, Any]]:
+    """Like run_topics_concurrently, but all HTTP goes through one asyncio engine.
+
+    Collectors keep their blocking, streaming parsers and run in `workers` threads; their
+    requests are awaited on the event loop, which reuses keep-alive connections per host
+    and caps open responses at `max_in_flight`.
+    """
+
+    async def _run() -> list[dict[str, Any]]:
+        loop = asyncio.get_running_loop()
+        metrics: list[dict[str, Any]] = []
+        plan = {"offline": offline, "seen": seen, "archive": archive, "index": index, "journal_dir": journal_dir}
+        plan.update(resume=resume, replay=replay)
+        runs = [_plan_topic(topic_id=t, date=date, **plan) for t in topic_ids]  # type: ignore[arg-type]
+        async with AsyncFetcher(
+            max_in_flight=max_in_flight, timeout=read_timeout, connect_timeout=connect_timeout
+        ) as fetcher:
+            set_opener(fetcher.blocking_opener(loop))
+            try:
+                with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="collect") as pool:
+                    pending = [
+                        (
+                            run,
+                            [
+                                loop.run_in_executor(
+                                    pool,
+                                    functools.partial(
+                                        _collect_source, src=src, raw_dir=run.raw_dir, skip=run.skip_fn()
+                                    ),
+                                )
+                                for src in run.pending
+                            ],
+                        )
+                        for run in runs
+                    ]
+                    for run, futures in pending:
+                        results = await asyncio.gather(*futures)
+                        # file writes off the loop, so in-flight fetches keep streaming meanwhile
+                        metrics.extend(await loop.run_in_executor(None, _finish_topic, run, _release(results)))
+            finally:
+                set_opener(None)
+        return metrics
+
+    return asyncio.run(_run())
+
+
+@dataclass(frozen=True)
+class RunSettings:
+    """Everything a process needs to run topics; picklable, so --jobs workers get their own copy."""
+
+    date: str
+    offline: bool = False
+    engine: str = "threads"
+    workers: int = 1
+    per_host: int = 2
+    max_in_flight: int = 16
+    http_cache: str = ""
+    http_cache_max_bytes: int = 256 * 1024 * 1024
+    http_cache_max_age_days: float = 30.0
+    raw_codec: str = "auto"
+    retries: int = 2
+    connect_timeout: float = 10.0
+    read_timeout: float = 30.0
+    circuit_threshold: int = 3
+    circuit_cooldown_hours: float = 6.0
+    state_dir: str = ""
+    seen_index: str = ""
+    seen_days: int = 30
+    archive: str = ""
+    search_index: str = ""
+    # re-parse data/raw snapshots instead of fetching (see replay())
+    replay: bool = False
+    # per-topic checkpoints (see run_journal.py); `resume` skips the work they record as done
+    journal_dir: str = ""
+    resume: bool = False
+
+
+def _fetch_policy(settings: RunSettings) -> FetchPolicy:
+    return FetchPolicy(
+        retries=max(0, settings.retries),
+        connect_timeout=settings.connect_timeout,
+        read_timeout=settings.read_timeout,
+        circuit_threshold=max(1, settings.circuit_threshold),
+        circuit_cooldown=settings.circuit_cooldown_hours * 3600.0,
+    )
+
 
+def _configure(settings: RunSettings) -> HttpCache | None:
+    """Apply process-wide collector settings (sources module hooks); returns the HTTP cache."""
+    set_host_concurrency(settings.per_host)
+    set_state_dir(Path(settings.state_dir) if settings.state_dir else None)
+    policy = _fetch_policy(settings)
+    # without a state dir (offline) breakers still work, just for this run
+    set_fetch_policy(policy, breakers=CircuitBreakers(Path(settings.state_dir) if settings.state_dir else None, policy))
+    set_raw_store(RawStore(Path("data/raw"), codec=settings.raw_codec))
+    set_replay(RawStore(Path("data/raw")) if settings.replay else None)
+    cache: HttpCache | None = None
+    if settings.http_cache:
+        cache = HttpCache(
+            Path(settings.http_cache),
+            max_bytes=settings.http_cache_max_bytes,
+            max_age_days=settings.http_cache_max_age_days,
+        )
+    set_http_cache(cache)
+    return cache
 
-def main() -> None:
+
+def _run_topics(
+    topic_ids: list[str],
+    *,
+    settings: RunSettings,
+    seen: SeenIndex | None,
+    archive: Archive | None,
+    index: SearchIndex | None = None,
+) -> list[dict[str, Any]]:
+    common = {
+        "date": settings.date,
+        "offline": settings.offline,
+        "seen": seen,
+        "archive": archive,
+        "index": index,
+        "journal_dir": settings.journal_dir,
+        "resume": settings.resume,
+        "replay": settings.replay,
+    }
+    # feeds listed by several sources are fetched and parsed once for the whole call
+    shared = set() if settings.replay else _shared_feeds(topic_ids, offline=settings.offline)
+    set_feed_cache(FeedCache(shared=shared) if shared else None)
+    try:
+        if settings.engine == "async":
+            return run_topics_async(
+                topic_ids=topic_ids,
+                workers=max(settings.workers, settings.max_in_flight),
+                max_in_flight=settings.max_in_flight,
+                connect_timeout=settings.connect_timeout,
+                read_timeout=settings.read_timeout,
+                **common,  # type: ignore[arg-type]
+            )
+        if settings.workers > 1:
+            return run_topics_concurrently(topic_ids=topic_ids, workers=settings.workers, **common)  # type: ignore[arg-type]
+        metrics: list[dict[str, Any]] = []
+        for topic_id in topic_ids:
+            metrics.extend(run_one_topic(topic_id=topic_id, **common))  # type: ignore[arg-type]
+        return metrics
+    finally:
+        set_feed_cache(None)
+
+
+@dataclass(frozen=True)
+class TopicOutcome:
+    topic_id: str
+    ok: bool
+    log_path: str
+    error: str = ""
+    metrics: list[dict[str, Any]] = field(default_factory=list)
+    # seen-index records marked by the worker, merged (and saved) by the parent
+    seen_records: list[tuple[int, int, int]] = field(default_factory=list)
+
+
+def _init_worker(settings: RunSettings, lock: Any, slots: Any) -> None:
+    _configure(settings)
+    # arXiv-style request spacing must hold across all workers, not per process
+    set_shared_spacing(lock, slots)
+
+
+def _topic_job(topic_id: str, settings: RunSettings) -> TopicOutcome:
+    """Run one topic in a worker process, with stdout/stderr going to data/logs/<date>/<topic>.log.
+
+    The worker only reads the seen index and never touches the archive or search index; those
+    are shared files, so the parent applies the returned records / written JSONL after the worker ends.
+    """
+    log_path = Path("data/logs") / settings.date / f"{topic_id}.log"
+    _ensure_dir(log_path.parent)
+    with log_path.open("a", encoding="utf-8") as log, redirect_stdout(log), redirect_stderr(log):
+        print(f"=== {dt.datetime.now().isoformat(timespec='seconds')} pid={os.getpid()} topic={topic_id}")
+        seen = SeenIndex.load(Path(settings.seen_index), retention_days=settings.seen_days) if settings.seen_index else None
+        try:
+            metrics = _run_topics([topic_id], settings=settings, seen=seen, archive=None)
+        except (Exception, SystemExit) as e:
+            traceback.print_exc()
+            return TopicOutcome(topic_id=topic_id, ok=False, log_path=str(log_path), error=repr(e))
+    return TopicOutcome(
+        topic_id=topic_id,
+        ok=True,
+        log_path=str(log_path),
+        metrics=metrics,
+        seen_records=seen.touched() if seen is not None else [],
+    )
+
+
+def _iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    if not path.exists():
+        return
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+def run_topics_in_processes(
+    topic_ids: list[str],
+    *,
+    settings: RunSettings,
+    jobs: int,
+    seen: SeenIndex | None = None,
+    archive: Archive | None = None,
+    index: SearchIndex | None = None,
+) -> tuple[list[dict[str, Any]], list[TopicOutcome]]:
+    """Run each topic in its own worker process (up to `jobs` at once); returns (metrics, failures).
+
+    Results are applied in topic order: seen-index records are merged and items/shortlist are
+    archived and indexed from the files the worker wrote.
+    """
+    ctx = multiprocessing.get_context("spawn")
+    metrics: list[dict[str, Any]] = []
+    failed: list[TopicOutcome] = []
+    with ctx.Manager() as manager:
+        lock, slots = manager.Lock(), manager.dict()
+        with ProcessPoolExecutor(
+            max_workers=jobs, mp_context=ctx, initializer=_init_worker, initargs=(settings, lock, slots)
+        ) as pool:
+            futures = [pool.submit(_topic_job, t, settings) for t in topic_ids]
+            for topic_id, fut in zip(topic_ids, futures):
+                try:
+                    outcome = fut.result()
+                except Exception as e:  # worker died (e.g. killed, unpicklable result)
+                    outcome = TopicOutcome(topic_id=topic_id, ok=False, log_path="", error=repr(e))
+                if not outcome.ok:
+                    failed.append(outcome)
+                    print(f"FAIL: {topic_id} {settings.date}: {outcome.error} (log: {outcome.log_path or '-'})")
+                    continue
+                metrics.extend(outcome.metrics)
+                if seen is not None:
+                    seen.merge(outcome.seen_records)
+                summary = next((m for m in outcome.metrics if m.get("scope") == "topic"), {})
+                if summary and (archive is not None or index is not None):
+                    topic = str(summary["topic"])
+                    processed_dir = Path("data/processed") / settings.date / topic
+                    if archive is not None:
+                        for kind in ("items", "shortlist"):
+                            path = processed_dir / f"{kind}.jsonl"
+                            if path.exists():
+                                archive.append_jsonl(date=settings.date, topic=topic, kind=kind, path=path)
+                    if index is not None:
+                        index.add_day(
+                            date=settings.date,
+                            topic=topic,
+                            items=_iter_jsonl(processed_dir / "items.jsonl"),
+                            shortlist=_iter_jsonl(processed_dir / "shortlist.jsonl"),
+                            sig=file_signature(processed_dir / "items.jsonl"),
+                        )
+                errors = f", {summary['errors']} source errors" if summary.get("errors") else ""
+                print(f"OK: {topic_id} {settings.date} ({summary.get('items', 0)} items{errors}; log: {outcome.log_path})")
+    return metrics, failed
+
+
+def _replay_dates(spec: str) -> list[str]:
+    """Dates of a --replay spec: `YYYY-MM-DD` or an inclusive range `YYYY-MM-DD..YYYY-MM-DD`."""
+    first, _, last = spec.partition("..")
+    start = dt.date.fromisoformat(first.strip())
+    end = dt.date.fromisoformat(last.strip()) if last else start
+    if end < start:
+        raise ValueError(f"empty date range: {spec}")
+    return [(start + dt.timedelta(days=i)).isoformat() for i in range((end - start).days + 1)]
+
+
+def _replay_date(date: str, topic_ids: list[str], settings: RunSettings) -> tuple[list[dict[str, Any]], str]:
+    """Rebuild one day's outputs from its raw snapshots; returns (metrics, error)."""
+    settings = replace(settings, date=date)
+    try:
+        # only topics that were actually collected that day
+        todo = [t for t in topic_ids if (Path("data/raw") / date / _load_topic_config(t).topic_id).is_dir()]
+        if not todo:
+            print(f"SKIP: replay {date}: nothing stored under data/raw/{date}")
+            return [], ""
+        # read-only: items first seen on an earlier day stay skipped, as in the original run
+        seen = SeenIndex.load(Path(settings.seen_index), retention_days=settings.seen_days) if settings.seen_index else None
+        return _run_topics(todo, settings=settings, seen=seen, archive=None), ""
+    except (Exception, SystemExit) as e:
+        traceback.print_exc()
+        return [], repr(e)
+
+
+def replay(
+    topic_ids: list[str], *, dates: list[str], settings: RunSettings, jobs: int = 1
+) -> tuple[list[dict[str, Any]], list[str]]:
+    """Rebuild items/shortlist/digest for `dates` from data/raw without the network; returns
+    (metrics, failed dates). With jobs > 1, dates run in parallel worker processes.
+
+    Nothing shared is written: manifests, harvesting state, the seen index, the archive and the
+    search index stay as the original runs left them (`search_index.py update` picks up the
+    rebuilt days).
+    """
+    if jobs > 1 and len(dates) > 1:
+        ctx = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(max_workers=jobs, mp_context=ctx, initializer=_configure, initargs=(settings,)) as pool:
+            futures = [pool.submit(_replay_date, d, topic_ids, settings) for d in dates]
+            results = []
+            for fut in futures:
+                try:
+                    results.append(fut.result())
+                except Exception as e:  # worker died
+                    results.append(([], repr(e)))
+    else:
+        results = [_replay_date(d, topic_ids, settings) for d in dates]
+
+    metrics: list[dict[str, Any]] = []
+    failed: list[str] = []
+    for date, (date_metrics, error) in zip(dates, results):
+        metrics.extend(date_metrics)
+        if error:
+            failed.append(date)
+            print(f"FAIL: replay {date}: {error}")
+    return metrics, failed
+
+
+def main() -> int:
     parser = argparse.ArgumentParser(description="Daily collector + digest builder (text-first).")
     parser.add_argument("--date", default=os.environ.get("DATE") or _today_yyyy_mm_dd())
     parser.add_argument("--topic", action="append", default=[])
@@ -128,18 +824,206 @@ def main() -> None:
         action="store_true",
         help="Do not use network; collectors read local fixtures when possible.",
     )
+    parser.add_argument(
+        "--replay",
+        metavar="DATE[..DATE]",
+        default="",
+        help="Rebuild items/shortlist/digest for a date or inclusive range from data/raw snapshots (no network).",
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run topics in N worker processes (one topic per process, logs in data/logs/<date>/); "
+        "with --replay, replay N dates at once. Default: 1.",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Fetch sources concurrently with N threads (across all topics). Default: 1 (serial).",
+    )
+    parser.add_argument(
+        "--per-host",
+        type=int,
+        default=2,
+        help="Max concurrent requests per host when --workers > 1 (0 = unlimited).",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=["threads", "async"],
+        default="threads",
+        help="HTTP engine: urllib per request (threads) or pooled keep-alive asyncio connections (async).",
+    )
+    parser.add_argument(
+        "--max-in-flight",
+        type=int,
+        default=16,
+        help="Max concurrent open responses with --engine async.",
+    )
+    parser.add_argument(
+        "--http-cache",
+        default="data/cache/http",
+        help="Directory for the conditional-GET cache (ETag/Last-Modified). Empty string disables it.",
+    )
+    parser.add_argument("--http-cache-max-mb", type=int, default=256)
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=2,
+        help="Retries per request after a transient failure (connect error, timeout, 429/5xx), "
+        "with jittered exponential backoff or the server's Retry-After.",
+    )
+    parser.add_argument("--connect-timeout", type=float, default=10.0, help="Seconds to connect (and TLS handshake).")
+    parser.add_argument("--read-timeout", type=float, default=30.0, help="Seconds any single read may stall.")
+    parser.add_argument(
+        "--circuit-threshold",
+        type=int,
+        default=3,
+        help="Consecutive failed requests to a host (across runs) before it is skipped for --circuit-cooldown-hours.",
+    )
+    parser.add_argument("--circuit-cooldown-hours", type=float, default=6.0)
+    parser.add_argument("--http-cache-max-age-days", type=float, default=30.0)
+    parser.add_argument(
+        "--raw-codec",
+        choices=["auto", "zstd", "gzip"],
+        default="auto",
+        help="Compression of raw snapshots in data/raw/objects (auto: zstd when available, else gzip).",
+    )
+    parser.add_argument(
+        "--state-dir",
+        default="data/state",
+        help="Per-source harvesting state (e.g. arXiv pagination high-water marks).",
+    )
+    parser.add_argument(
+        "--seen-index",
+        default="data/state/seen.idx",
+        help="Cross-day index of already published items, skipped by collectors. Empty string disables it.",
+    )
+    parser.add_argument("--seen-days", type=int, default=30, help="Retention window of the seen index (days).")
+    parser.add_argument(
+        "--archive",
+        default="data/archive",
+        help="Columnar history archive that items/shortlist are appended to. Empty string disables it.",
+    )
+    parser.add_argument(
+        "--search-index",
+        default="data/index/items.sqlite",
+        help="SQLite full-text index each topic's items are added to (see search_index.py). Empty string disables it.",
+    )
+    parser.add_argument(
+        "--journal-dir",
+        default="data/state/runs",
+        help="Per-topic run checkpoints (<dir>/<date>/<topic>.json). Empty string disables them.",
+    )
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Continue an interrupted run of --date: skip finished topics and re-merge finished sources "
+        "from items.jsonl.partial instead of fetching them again.",
+    )
+    parser.add_argument(
+        "--prom-file",
+        default="",
+        help="Also write this run's metrics as a Prometheus textfile (e.g. for node_exporter).",
+    )
     args = parser.parse_args()
 
     if args.all:
-        topics = sorted(p.stem for p in Path("topics").glob("*.toml"))
+        topics = topic_ids()
     else:
         topics = args.topic or ["ai_papers"]
+    # every selected topic must load before anything is fetched
+    config_errors = validate_topics(topics)
+    if config_errors:
+        for err in config_errors:
+            print(f"ERROR: {err}", file=sys.stderr)
+        return 2
+
+    try:
+        RawStore(Path("data/raw"), codec=args.raw_codec)
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.replay:
+        try:
+            dates = _replay_dates(args.replay)
+        except ValueError as e:
+            parser.error(f"--replay: {e}")
+        settings = RunSettings(
+            date=dates[0],
+            workers=args.workers,
+            raw_codec=args.raw_codec,
+            seen_index=args.seen_index,
+            seen_days=args.seen_days,
+            replay=True,
+        )
+        _configure(settings)
+        metrics, failed_dates = replay(topics, dates=dates, settings=settings, jobs=args.jobs)
+        if args.prom_file:
+            write_prometheus(Path(args.prom_file), metrics)
+        if failed_dates:
+            print(f"ERROR: replay failed for {len(failed_dates)}/{len(dates)} dates: {', '.join(failed_dates)}", file=sys.stderr)
+            return 1
+        return 0
+
+    # OFFLINE=1 in the environment is still honoured, but never written back to it
+    offline = args.offline or os.environ.get("OFFLINE") == "1"
+    if args.resume and offline:
+        parser.error("--resume needs the run journal, which offline runs do not keep")
+    # offline runs read fixtures; keep them from touching the cache or committed state/indexes/archive
+    settings = RunSettings(
+        date=args.date,
+        offline=offline,
+        engine=args.engine,
+        workers=args.workers,
+        per_host=args.per_host,
+        max_in_flight=args.max_in_flight,
+        http_cache="" if offline else args.http_cache,
+        http_cache_max_bytes=args.http_cache_max_mb * 1024 * 1024,
+        http_cache_max_age_days=args.http_cache_max_age_days,
+        raw_codec=args.raw_codec,
+        retries=args.retries,
+        connect_timeout=args.connect_timeout,
+        read_timeout=args.read_timeout,
+        circuit_threshold=args.circuit_threshold,
+        circuit_cooldown_hours=args.circuit_cooldown_hours,
+        state_dir="" if offline else args.state_dir,
+        seen_index="" if offline else args.seen_index,
+        seen_days=args.seen_days,
+        archive="" if offline else args.archive,
+        search_index="" if offline else args.search_index,
+        journal_dir="" if offline else args.journal_dir,
+        resume=args.resume,
+    )
+    cache = _configure(settings)
+    seen = SeenIndex.load(Path(settings.seen_index), retention_days=settings.seen_days) if settings.seen_index else None
+    archive = Archive(Path(settings.archive)) if settings.archive else None
+    index = SearchIndex(Path(settings.search_index)) if settings.search_index else None
+
+    failed: list[TopicOutcome] = []
+    shared = {"seen": seen, "archive": archive, "index": index}
+    try:
+        if args.jobs > 1 and len(topics) > 1:
+            metrics, failed = run_topics_in_processes(topics, settings=settings, jobs=args.jobs, **shared)  # type: ignore[arg-type]
+        else:
+            metrics = _run_topics(topics, settings=settings, **shared)  # type: ignore[arg-type]
+    finally:
+        if index is not None:
+            index.close()
+
+    if args.prom_file:
+        write_prometheus(Path(args.prom_file), metrics)
+    if seen is not None:
+        seen.save(today=args.date)
+    if cache is not None:
+        cache.prune()
 
-    for topic_id in topics:
-        if args.offline:
-            os.environ["OFFLINE"] = "1"
-        run_one_topic(topic_id=topic_id, date=args.date)
+    if failed:
+        print(f"ERROR: {len(failed)}/{len(topics)} topics failed: {', '.join(o.topic_id for o in failed)}", file=sys.stderr)
+        return 1
+    return 0
 
 
 if __name__ == "__main__":
-    main()
+    raise SystemExit(main())
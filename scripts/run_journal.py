@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+# Checkpoints of one topic's run for one date, so an interrupted run can be resumed
+# (run_daily.py --resume). Layout: <root>/<date>/<topic>.json
+#
+#   {"date", "topic", "status": "running" | "done", "updated_at",
+#    "sources": [{"id", "config", "items", "offset", "raw": [sha256, ...], "metrics": {...},
+#                 "skipped": [{"source_id", "url", "title"}, ...]}, ...]}
+#
+# Sources are merged in config order, so the finished ones always form a prefix of the topic's
+# sources; `offset` is the size of items.jsonl.partial once that source's items were flushed.
+# `config` fingerprints the source table: a source whose config changed since is not resumed.
+# `skipped` lists the source's items dropped as already published, so a resumed run can still
+# mark them as seen on this date.
+
+
+def source_fingerprint(src: dict[str, Any]) -> str:
+    blob = json.dumps(src, ensure_ascii=False, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:16]
+
+
+class TopicJournal:
+    def __init__(self, path: Path, *, date: str, topic: str) -> None:
+        self.path = Path(path)
+        self.date = date
+        self.topic = topic
+        self._lock = threading.Lock()
+        self._data: dict[str, Any] = {"date": date, "topic": topic, "status": "running", "sources": []}
+
+    @classmethod
+    def load(cls, root: Path, *, date: str, topic: str) -> TopicJournal:
+        journal = cls(Path(root) / date / f"{topic}.json", date=date, topic=topic)
+        try:
+            data = json.loads(journal.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return journal
+        if isinstance(data, dict) and data.get("date") == date and data.get("topic") == topic:
+            journal._data = {**data, "sources": list(data.get("sources") or [])}
+        return journal
+
+    @property
+    def complete(self) -> bool:
+        return self._data.get("status") == "done"
+
+    def finished(self, sources: list[dict[str, Any]], *, partial: Path) -> list[dict[str, Any]]:
+        """Checkpoints still valid for `sources`: the longest prefix whose configs are unchanged
+        and whose items are all in `partial`."""
+        done: list[dict[str, Any]] = []
+        for src, entry in zip(sources, self._data["sources"]):
+            if entry.get("id") != str(src.get("id")) or entry.get("config") != source_fingerprint(src):
+                break
+            done.append(entry)
+        try:
+            size = partial.stat().st_size
+        except FileNotFoundError:
+            return []
+        while done and int(done[-1].get("offset") or 0) > size:
+            done.pop()
+        return done
+
+    def start(self, done: list[dict[str, Any]]) -> None:
+        """Begin an attempt that keeps the checkpoints in `done` (none for a fresh run)."""
+        with self._lock:
+            self._data = {"date": self.date, "topic": self.topic, "status": "running", "sources": list(done)}
+            self._save()
+
+    def source_done(
+        self,
+        src: dict[str, Any],
+        *,
+        items: int,
+        offset: int,
+        raw: list[str],
+        metrics: dict[str, Any],
+        skipped: list[dict[str, Any]],
+    ) -> None:
+        entry = {
+            "id": str(src.get("id")),
+            "config": source_fingerprint(src),
+            "items": items,
+            "offset": offset,
+            "raw": raw,
+            "metrics": metrics,
+            "skipped": skipped,
+        }
+        with self._lock:
+            self._data["sources"].append(entry)
+            self._save()
+
+    def topic_done(self) -> None:
+        with self._lock:
+            self._data["status"] = "done"
+            self._save()
+
+    def _save(self) -> None:
+        self._data["updated_at"] = datetime.now(tz=timezone.utc).isoformat()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(self._data, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+        os.replace(tmp, self.path)
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import sqlite3
+import sys
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, Iterable, Iterator
+
+from archive import Archive  # type: ignore
+
+# Full-text index over every collected item (data/index/items.sqlite, SQLite FTS5).
+#
+#   items      one row per item per day/topic (the fields the CLI shows and filters on)
+#   items_fts  external-content FTS5 table over title + summary, kept in sync by triggers
+#   days       (date, topic) -> signature of the items.jsonl it was built from
+#
+# A run indexes only its own day/topic (add_day replaces those rows); `update` walks
+# data/processed (and, for days whose JSONL was pruned, data/archive) and re-indexes only
+# the days whose signature changed, e.g. after a --replay. Queries hit the FTS index plus
+# the (topic, date) index, so they stay in the milliseconds however long the history gets.
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    id INTEGER PRIMARY KEY,
+    date TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    source_id TEXT NOT NULL DEFAULT '',
+    url TEXT NOT NULL DEFAULT '',
+    title TEXT NOT NULL DEFAULT '',
+    summary TEXT NOT NULL DEFAULT '',
+    published TEXT NOT NULL DEFAULT '',
+    shortlisted INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS items_date ON items (date);
+CREATE INDEX IF NOT EXISTS items_topic_date ON items (topic, date);
+CREATE VIRTUAL TABLE IF NOT EXISTS items_fts USING fts5 (
+    title, summary, content='items', content_rowid='id', tokenize='unicode61 remove_diacritics 2'
+);
+CREATE TRIGGER IF NOT EXISTS items_ai AFTER INSERT ON items BEGIN
+    INSERT INTO items_fts (rowid, title, summary) VALUES (new.id, new.title, new.summary);
+END;
+CREATE TRIGGER IF NOT EXISTS items_ad AFTER DELETE ON items BEGIN
+    INSERT INTO items_fts (items_fts, rowid, title, summary) VALUES ('delete', old.id, old.title, old.summary);
+END;
+CREATE TABLE IF NOT EXISTS days (
+    date TEXT NOT NULL,
+    topic TEXT NOT NULL,
+    sig TEXT NOT NULL,
+    items INTEGER NOT NULL,
+    indexed_at REAL NOT NULL,
+    PRIMARY KEY (date, topic)
+);
+"""
+# title matches count more than summary matches
+_BM25 = "bm25(items_fts, 4.0, 1.0)"
+_TERM_RE = re.compile(r"[\w.+#-]+\*?")
+
+
+@dataclass(frozen=True)
+class SearchHit:
+    date: str
+    topic: str
+    source_id: str
+    title: str
+    url: str
+    published: str
+    shortlisted: bool
+    # summary excerpt with matches in [brackets] (the summary's start without a query)
+    snippet: str
+
+
+def fts_query(text: str) -> str:
+    """FTS5 expression for plain search text: every term must match (`term*` = prefix)."""
+    terms = []
+    for term in _TERM_RE.findall(text):
+        prefix = term.endswith("*")
+        word = term.rstrip("*").strip(".-")
+        if word:
+            terms.append('"' + word.replace('"', '""') + '"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+def file_signature(path: Path) -> str:
+    """Cheap change marker for a JSONL file (size + mtime); "" when it is missing."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return ""
+    return f"{st.st_size}:{st.st_mtime_ns}"
+
+
+def _str(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _iter_jsonl(path: Path) -> Iterator[dict[str, Any]]:
+    if not path.exists():
+        return
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+
+
+class SearchIndex:
+    """SQLite FTS5 index of collected items; one connection, safe to share between threads."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._db = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.Lock()
+        # WAL: the query CLI can read while a run is writing
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        self._db.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+    def __enter__(self) -> SearchIndex:
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+    def signatures(self) -> dict[tuple[str, str], str]:
+        with self._lock:
+            return {(d, t): s for d, t, s in self._db.execute("SELECT date, topic, sig FROM days")}
+
+    def add_day(
+        self,
+        *,
+        date: str,
+        topic: str,
+        items: Iterable[dict[str, Any]],
+        shortlist: Iterable[dict[str, Any]] = (),
+        sig: str = "",
+    ) -> int:
+        """Replace the indexed items of one day/topic; returns how many were indexed."""
+        picked = {_str(i.get("url")) for i in shortlist if i.get("url")}
+        n = 0
+
+        def rows() -> Iterator[tuple[Any, ...]]:
+            nonlocal n
+            for i in items:
+                n += 1
+                url = _str(i.get("url"))
+                yield (
+                    date,
+                    topic,
+                    _str(i.get("source_id")),
+                    url,
+                    _str(i.get("title")),
+                    _str(i.get("summary")),
+                    _str(i.get("published")),
+                    int(bool(url) and url in picked),
+                )
+
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM items WHERE date = ? AND topic = ?", (date, topic))
+            self._db.executemany(
+                "INSERT INTO items (date, topic, source_id, url, title, summary, published, shortlisted)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows(),
+            )
+            self._db.execute(
+                "INSERT OR REPLACE INTO days (date, topic, sig, items, indexed_at) VALUES (?, ?, ?, ?, ?)",
+                (date, topic, sig, n, time.time()),
+            )
+        return n
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute("DELETE FROM items")
+            self._db.execute("DELETE FROM days")
+            self._db.execute("INSERT INTO items_fts (items_fts) VALUES ('rebuild')")
+
+    def optimize(self) -> None:
+        """Merge FTS segments (worth doing after a bulk update)."""
+        with self._lock, self._db:
+            self._db.execute("INSERT INTO items_fts (items_fts) VALUES ('optimize')")
+
+    def search(
+        self,
+        query: str = "",
+        *,
+        topics: Iterable[str] = (),
+        since: str = "",
+        until: str = "",
+        shortlist_only: bool = False,
+        limit: int = 20,
+        raw: bool = False,
+    ) -> list[SearchHit]:
+        """Items matching `query` (every term, in title or summary), best match first.
+
+        `raw` passes `query` through as an FTS5 expression (OR, NEAR, column filters...).
+        Without a query the filters alone select items, newest first. Dates are inclusive.
+        """
+        match = query.strip() if raw else fts_query(query)
+        where: list[str] = []
+        params: list[Any] = []
+        topics = list(topics)
+        if topics:
+            where.append(f"items.topic IN ({', '.join('?' * len(topics))})")
+            params.extend(topics)
+        if since:
+            where.append("items.date >= ?")
+            params.append(since)
+        if until:
+            where.append("items.date <= ?")
+            params.append(until)
+        if shortlist_only:
+            where.append("items.shortlisted = 1")
+
+        cols = "items.date, items.topic, items.source_id, items.title, items.url, items.published, items.shortlisted"
+        if match:
+            sql = (
+                f"SELECT {cols}, snippet(items_fts, 1, '[', ']', '…', 16) FROM items_fts"
+                " JOIN items ON items.id = items_fts.rowid WHERE items_fts MATCH ?"
+            )
+            sql += "".join(f" AND {w}" for w in where)
+            sql += f" ORDER BY {_BM25}, items.date DESC LIMIT ?"
+            params = [match, *params]
+        else:
+            sql = f"SELECT {cols}, substr(items.summary, 1, 160) FROM items"
+            sql += (" WHERE " + " AND ".join(where)) if where else ""
+            sql += " ORDER BY items.date DESC, items.id LIMIT ?"
+        params.append(max(1, limit))
+        with self._lock:
+            rows = self._db.execute(sql, params).fetchall()
+        return [
+            SearchHit(
+                date=r[0],
+                topic=r[1],
+                source_id=r[2],
+                title=r[3],
+                url=r[4],
+                published=r[5],
+                shortlisted=bool(r[6]),
+                snippet=" ".join(r[7].split()),
+            )
+            for r in rows
+        ]
+
+
+def update(
+    index: SearchIndex, *, processed: Path, archive: Archive | None = None, full: bool = False
+) -> tuple[int, int]:
+    """Index every day/topic under `processed` whose items.jsonl changed since it was indexed;
+    days only left in `archive` (JSONL pruned) are read from there. Returns (days, items)."""
+    if full:
+        index.clear()
+    known = index.signatures()
+    days = items = 0
+
+    def put(date: str, topic: str, sig: str, load: Any) -> None:
+        nonlocal days, items
+        if known.get((date, topic)) == sig:
+            return
+        rows, shortlist = load()
+        items += index.add_day(date=date, topic=topic, items=rows, shortlist=shortlist, sig=sig)
+        days += 1
+
+    seen: set[tuple[str, str]] = set()
+    for path in sorted(Path(processed).glob("*/*/items.jsonl")):
+        date, topic = path.parent.parent.name, path.parent.name
+        seen.add((date, topic))
+        put(
+            date,
+            topic,
+            file_signature(path),
+            lambda p=path: (_iter_jsonl(p), _iter_jsonl(p.with_name("shortlist.jsonl"))),
+        )
+    if archive is not None:
+        for date, topic, kind in archive.keys():
+            if kind != "items" or (date, topic) in seen:
+                continue
+            segment = archive.segment(date=date, topic=topic, kind="items") or {}
+            put(
+                date,
+                topic,
+                f"sha256:{segment.get('sha256', '')}",
+                lambda d=date, t=topic: (
+                    archive.read(date=d, topic=t, kind="items") or [],
+                    archive.read(date=d, topic=t, kind="shortlist", columns=["url"]) or [],
+                ),
+            )
+    if days:
+        index.optimize()
+    return days, items
+
+
+def main() -> int:
+    p = argparse.ArgumentParser(description="Full-text search over collected items (data/index/items.sqlite).")
+    p.add_argument("--db", default="data/index/items.sqlite")
+    sub = p.add_subparsers(dest="cmd", required=True)
+
+    q = sub.add_parser("query", help="Search titles and summaries")
+    q.add_argument("text", nargs="?", default="", help="Words that must all match; `word*` matches a prefix")
+    q.add_argument("--topic", action="append", default=[])
+    q.add_argument("--since", default="", help="First date (YYYY-MM-DD, inclusive)")
+    q.add_argument("--until", default="", help="Last date (YYYY-MM-DD, inclusive)")
+    q.add_argument("--shortlist", action="store_true", help="Only items that made a shortlist")
+    q.add_argument("--limit", type=int, default=20)
+    q.add_argument("--raw", action="store_true", help="Treat text as an FTS5 expression (OR, NEAR, title:...)")
+    q.add_argument("--json", action="store_true", help="Print hits as JSONL")
+
+    u = sub.add_parser("update", help="Index days of data/processed (and data/archive) that changed")
+    u.add_argument("--processed", default="data/processed")
+    u.add_argument("--archive", default="data/archive", help="Also index archived days; empty string skips it")
+    u.add_argument("--full", action="store_true", help="Drop the index and rebuild it")
+    args = p.parse_args()
+
+    with SearchIndex(Path(args.db)) as index:
+        if args.cmd == "update":
+            archive = Archive(Path(args.archive)) if args.archive else None
+            t0 = time.perf_counter()
+            days, items = update(index, processed=Path(args.processed), archive=archive, full=args.full)
+            print(f"OK: indexed {days} days ({items} items) in {time.perf_counter() - t0:.2f}s -> {index.path}")
+            return 0
+
+        t0 = time.perf_counter()
+        try:
+            hits = index.search(
+                args.text,
+                topics=args.topic,
+                since=args.since,
+                until=args.until,
+                shortlist_only=args.shortlist,
+                limit=args.limit,
+                raw=args.raw,
+            )
+        except sqlite3.OperationalError as e:  # bad --raw expression
+            print(f"ERROR: {e}", file=sys.stderr)
+            return 2
+        ms = (time.perf_counter() - t0) * 1000
+        if args.json:
+            for hit in hits:
+                sys.stdout.write(json.dumps(asdict(hit), ensure_ascii=False) + "\n")
+            return 0
+        for hit in hits:
+            star = "*" if hit.shortlisted else " "
+            print(f"{hit.date} {star} [{hit.topic}/{hit.source_id}] {hit.title}\n    {hit.url}\n    {hit.snippet}")
+        print(f"-- {len(hits)} hits in {ms:.1f} ms", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
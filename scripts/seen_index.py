@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import datetime as dt
+import hashlib
+import os
+import re
+import struct
+import urllib.parse
+from pathlib import Path
+from typing import Any, Iterable
+
+# File layout: MAGIC, u32 count, then `count` records sorted by key hash:
+#   u64 blake2b-64(key), u32 first-seen day, u32 last-seen day (days since 1970-01-01)
+# 16 bytes per key; sorted so the file is byte-for-byte stable for the same content.
+MAGIC = b"PCSEEN1\0"
+_RECORD = struct.Struct("<QII")
+_HEADER = struct.Struct("<8sI")
+
+_ARXIV_ID_RE = re.compile(r"arxiv\.org/(?:abs|pdf)/([^?#]+?)(?:v\d+)?(?:\.pdf)?/?$", re.IGNORECASE)
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "ref", "source"}
+# Titles shorter than this ("Weekly update", "Episode 12") are too generic to dedupe on.
+_MIN_TITLE_KEY_LEN = 20
+
+
+def _day_number(date: str) -> int:
+    return dt.date.fromisoformat(date).toordinal() - dt.date(1970, 1, 1).toordinal()
+
+
+def normalize_url(url: str) -> str:
+    url = (url or "").strip()
+    if not url:
+        return ""
+    m = _ARXIV_ID_RE.search(url)
+    if m:
+        return f"arxiv:{m.group(1).lower()}"
+    parts = urllib.parse.urlsplit(url)
+    host = (parts.hostname or "").lower().removeprefix("www.")
+    if parts.port and parts.port not in (80, 443):
+        host = f"{host}:{parts.port}"
+    query = [
+        (k, v)
+        for k, v in urllib.parse.parse_qsl(parts.query, keep_blank_values=True)
+        if not (k.lower().startswith("utm_") or k.lower() in _TRACKING_PARAMS)
+    ]
+    path = parts.path.rstrip("/") or "/"
+    return urllib.parse.urlunsplit(("", host, path, urllib.parse.urlencode(sorted(query)), "")).lstrip("/")
+
+
+def normalize_title(title: str) -> str:
+    return re.sub(r"\s+", " ", re.sub(r"[^\w\s]", " ", (title or "").lower())).strip()
+
+
+def item_keys(item: dict[str, Any]) -> list[str]:
+    keys: list[str] = []
+    url = normalize_url(str(item.get("url") or ""))
+    if url:
+        keys.append(f"url:{url}")
+    title = normalize_title(str(item.get("title") or ""))
+    if len(title) >= _MIN_TITLE_KEY_LEN:
+        keys.append(f"title:{title}")
+    return keys
+
+
+def _hash_key(key: str) -> int:
+    return int.from_bytes(hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+class SeenIndex:
+    """Items published on earlier days, keyed by normalized URL / arXiv ID and title.
+
+    An item counts as seen for `date` if any of its keys was first recorded on an earlier
+    day and last recorded within `retention_days`; re-running the same date is therefore
+    idempotent. Entries not seen for longer than the retention window are dropped on save.
+    """
+
+    def __init__(self, path: Path, *, retention_days: int = 30) -> None:
+        self.path = Path(path)
+        self.retention_days = int(retention_days)
+        self._days: dict[int, tuple[int, int]] = {}
+        self._touched: set[int] = set()
+        self._dirty = False
+
+    @classmethod
+    def load(cls, path: Path, *, retention_days: int = 30) -> SeenIndex:
+        index = cls(path, retention_days=retention_days)
+        if not index.path.exists():
+            return index
+        data = index.path.read_bytes()
+        if len(data) < _HEADER.size:
+            return index
+        magic, count = _HEADER.unpack_from(data, 0)
+        if magic != MAGIC:
+            raise ValueError(f"Not a seen index: {index.path}")
+        for h, first, last in _RECORD.iter_unpack(data[_HEADER.size : _HEADER.size + count * _RECORD.size]):
+            index._days[h] = (first, last)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._days)
+
+    def seen_before(self, item: dict[str, Any], *, date: str) -> bool:
+        day = _day_number(date)
+        for key in item_keys(item):
+            hit = self._days.get(_hash_key(key))
+            if hit is not None and hit[0] < day and day - hit[1] <= self.retention_days:
+                return True
+        return False
+
+    def mark(self, items: Iterable[dict[str, Any]], *, date: str) -> None:
+        day = _day_number(date)
+        for item in items:
+            for key in item_keys(item):
+                h = _hash_key(key)
+                first, last = self._days.get(h, (day, day))
+                self._days[h] = (min(first, day), max(last, day))
+                self._touched.add(h)
+                self._dirty = True
+
+    def touched(self) -> list[tuple[int, int, int]]:
+        """(key hash, first day, last day) of every key marked since load, for merge() elsewhere."""
+        return [(h, *self._days[h]) for h in sorted(self._touched)]
+
+    def merge(self, records: Iterable[tuple[int, int, int]]) -> None:
+        """Fold in touched() records from another instance (e.g. a worker process)."""
+        for h, first, last in records:
+            cur = self._days.get(h)
+            self._days[h] = (first, last) if cur is None else (min(cur[0], first), max(cur[1], last))
+            self._touched.add(h)
+            self._dirty = True
+
+    def save(self, *, today: str | None = None) -> None:
+        if today is not None:
+            cutoff = _day_number(today) - self.retention_days
+            expired = [h for h, (_, last) in self._days.items() if last < cutoff]
+            for h in expired:
+                del self._days[h]
+            self._dirty = self._dirty or bool(expired)
+        if not self._dirty and self.path.exists():
+            return
+        buf = bytearray(_HEADER.pack(MAGIC, len(self._days)))
+        for h in sorted(self._days):
+            buf += _RECORD.pack(h, *self._days[h])
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+        tmp.write_bytes(bytes(buf))
+        os.replace(tmp, self.path)
+        self._dirty = False
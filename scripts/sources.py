@@ -1,65 +1,426 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import os
 import re
+import threading
+import time
+import urllib.error
 import urllib.parse
 import urllib.request
 import xml.etree.ElementTree as ET
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, Callable, Iterator
+
+from feed_cache import FeedCache, FeedPage, request_family  # type: ignore
+from http_cache import HttpCache  # type: ignore
+from keywords import compile_matcher  # type: ignore
+from metrics import SourceStats  # type: ignore
+from ratelimit import SharedSpacing, TokenBucket  # type: ignore
+from raw_store import RawStore  # type: ignore
+from resilience import CircuitBreakers, FetchPolicy, build_opener, counts_against_host, retry_delay  # type: ignore
 
 
 USER_AGENT = "postcast/0.1 (+https://example.invalid)"
+ARXIV_API_URL = "https://export.arxiv.org/api/query"
 
+# Per-host concurrency cap for _fetch (0 = unlimited). Collectors may run in
+# worker threads, so this keeps a busy run from hammering a single host.
+_HOST_LIMIT = 0
+_HOST_SLOTS: dict[str, threading.BoundedSemaphore] = {}
+_HOST_LOCK = threading.Lock()
+_HOST_BUCKETS: dict[str, TokenBucket] = {}
+# Cross-process request spacing (multiprocessing lock + shared dict); see set_shared_spacing().
+_SHARED_SPACING: tuple[Any, Any] | None = None
 
-def _fetch(url: str) -> bytes:
-    if url.startswith("file://"):
-        p = Path(url.removeprefix("file://"))
-        return p.read_bytes()
-    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-    with urllib.request.urlopen(req, timeout=30) as resp:
-        return resp.read()
+# Optional conditional-GET cache (ETag / Last-Modified); see set_http_cache().
+_HTTP_CACHE: HttpCache | None = None
 
+# Retries, connect/read deadlines and per-host circuit breakers for every request; see set_fetch_policy().
+_FETCH_POLICY = FetchPolicy()
+_URL_OPENER = build_opener(_FETCH_POLICY)
+_BREAKERS: CircuitBreakers | None = None
 
-def _write_bytes(path: Path, data: bytes) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_bytes(data)
+# Replaces urllib for HTTP(S) when set (e.g. the pooled asyncio engine); see set_opener().
+# Signature: (url, extra_headers) -> response with .read(n), .headers, context manager;
+# non-2xx statuses must raise urllib.error.HTTPError.
+Opener = Callable[[str, dict[str, str]], Any]
+_OPENER: Opener | None = None
+
+# Where per-source harvesting state (e.g. arXiv high-water marks) lives; see set_state_dir().
+_STATE_DIR: Path | None = None
+
+# Content-addressed store for raw bodies (plain files under raw_dir when unset); see set_raw_store().
+_RAW_STORE: RawStore | None = None
+
+# Replay mode: bodies are read back from this store's snapshots instead of fetched; see set_replay().
+_REPLAY: RawStore | None = None
+
+# Run-scoped fetch-and-parse-once cache for feeds several sources request; see set_feed_cache().
+_FEED_CACHE: FeedCache | None = None
 
+# High-water marks collectors reached, per raw_dir (day/topic), until commit_marks() writes them.
+_PENDING_MARKS: dict[Path, list[tuple[Path, str, str, str]]] = {}
+_PENDING_LOCK = threading.Lock()
 
-def _kw_norm(s: str) -> str:
-    return re.sub(r"\s+", " ", (s or "").strip().lower())
 
+def set_host_concurrency(limit: int) -> None:
+    global _HOST_LIMIT
+    with _HOST_LOCK:
+        _HOST_LIMIT = max(0, int(limit))
+        _HOST_SLOTS.clear()
 
-def _kw_hit(*, text: str, kw: str) -> bool:
-    kw = (kw or "").strip()
-    if not kw:
-        return False
-    t = text or ""
-    if kw.lower().startswith("re:"):
-        pattern = kw[3:].strip()
-        if not pattern:
-            return False
-        return re.search(pattern, t, flags=re.IGNORECASE) is not None
 
-    k = kw.lower()
-    tl = t.lower()
-    # For short ASCII tokens, require word boundary to avoid accidental substring hits
-    if re.fullmatch(r"[a-z0-9]{1,4}", k):
-        return re.search(rf"\b{re.escape(k)}\b", tl) is not None
-    return k in tl
+def set_shared_spacing(lock: Any, slots: Any) -> None:
+    """Space per-host requests across worker processes (pass None, None to go back to in-process)."""
+    global _SHARED_SPACING
+    _SHARED_SPACING = (lock, slots) if lock is not None else None
+
+
+def set_http_cache(cache: HttpCache | None) -> None:
+    global _HTTP_CACHE
+    _HTTP_CACHE = cache
+
+
+def set_fetch_policy(policy: FetchPolicy, *, breakers: CircuitBreakers | None = None) -> None:
+    global _FETCH_POLICY, _URL_OPENER, _BREAKERS
+    _FETCH_POLICY = policy
+    _URL_OPENER = build_opener(policy)
+    _BREAKERS = breakers
+
+
+def set_opener(opener: Opener | None) -> None:
+    global _OPENER
+    _OPENER = opener
+
+
+def set_state_dir(path: Path | None) -> None:
+    global _STATE_DIR
+    _STATE_DIR = Path(path) if path is not None else None
+
+
+def set_raw_store(store: RawStore | None) -> None:
+    global _RAW_STORE
+    _RAW_STORE = store
+
+
+def set_replay(store: RawStore | None) -> None:
+    """Re-parse stored raw snapshots (no network, no rate limiting, manifests left untouched)."""
+    global _REPLAY
+    _REPLAY = store
+
+
+def set_feed_cache(cache: FeedCache | None) -> None:
+    global _FEED_CACHE
+    _FEED_CACHE = cache
+
+
+@contextmanager
+def _host_slot(url: str):
+    host = (urllib.parse.urlsplit(url).hostname or "").lower()
+    with _HOST_LOCK:
+        sem = _HOST_SLOTS.get(host)
+        if sem is None and _HOST_LIMIT > 0:
+            sem = _HOST_SLOTS[host] = threading.BoundedSemaphore(_HOST_LIMIT)
+    if sem is None:
+        yield
+        return
+    with sem:
+        yield
+
+
+class _TeeReader:
+    """File-like wrapper that copies every chunk read from `stream` into `sinks`."""
+
+    def __init__(self, stream: BinaryIO, *sinks: Any) -> None:
+        self._stream = stream
+        self._sinks = [s for s in sinks if s is not None]
+        self.eof = False
+
+    def read(self, n: int = -1) -> bytes:
+        chunk = self._stream.read(n)
+        if chunk:
+            for sink in self._sinks:
+                sink.write(chunk)
+        if not chunk or n is None or n < 0:
+            self.eof = True
+        return chunk
+
+    def drain(self, bufsize: int = 64 * 1024) -> None:
+        while not self.eof:
+            self.read(bufsize)
+
+
+class _MeteredReader:
+    """File-like wrapper that adds time spent in `read` and bytes returned to `stats`."""
+
+    def __init__(self, stream: BinaryIO, stats: SourceStats, *, cached: bool = False) -> None:
+        self._stream = stream
+        self._stats = stats
+        self._cached = cached
+
+    def read(self, n: int = -1) -> bytes:
+        t0 = time.perf_counter()
+        chunk = self._stream.read(n)
+        self._stats.fetch_seconds += time.perf_counter() - t0
+        if self._cached:
+            self._stats.cached_bytes += len(chunk)
+        else:
+            self._stats.bytes += len(chunk)
+        return chunk
+
+
+def _urlopen_once(url: str, headers: dict[str, str]):
+    if _OPENER is not None:
+        return _OPENER(url, {"User-Agent": USER_AGENT, **headers})
+    req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT, **headers})
+    return _URL_OPENER.open(req, timeout=_FETCH_POLICY.connect_timeout)
+
+
+def _urlopen(url: str, headers: dict[str, str], *, stats: SourceStats | None = None):
+    """Open `url` with bounded, jittered retries (honouring Retry-After), behind the host's circuit breaker."""
+    policy, breakers = _FETCH_POLICY, _BREAKERS
+    host = (urllib.parse.urlsplit(url).hostname or "").lower()
+    if breakers is not None:
+        breakers.check(host)
+    attempt = 0
+    while True:
+        try:
+            resp = _urlopen_once(url, headers)
+        except Exception as e:
+            if isinstance(e, urllib.error.HTTPError) and e.code == 304:
+                if breakers is not None:
+                    breakers.record_success(host)
+                raise
+            delay = retry_delay(policy, attempt, e)
+            if delay is None:
+                if breakers is not None:
+                    # any HTTP answer (404, 403, ...) still shows the host is up
+                    if counts_against_host(e):
+                        breakers.record_failure(host, e)
+                    else:
+                        breakers.record_success(host)
+                raise
+            if isinstance(e, urllib.error.HTTPError):
+                e.close()
+            if stats is not None:
+                stats.retries += 1
+            time.sleep(delay)
+            attempt += 1
+            continue
+        if breakers is not None:
+            breakers.record_success(host)
+        return resp
+
+
+@contextmanager
+def _open_url(url: str, *, stats: SourceStats | None = None) -> Iterator[BinaryIO]:
+    """Open `url` as a binary stream, going through the conditional-GET cache when configured."""
+    if url.startswith("file://"):
+        with Path(url.removeprefix("file://")).open("rb") as f:
+            yield f
+        return
+
+    cache = _HTTP_CACHE
+    with _host_slot(url):
+        resp = None
+        cached: BinaryIO | None = None
+        try:
+            resp = _urlopen(url, cache.validators(url) if cache is not None else {}, stats=stats)
+        except urllib.error.HTTPError as e:
+            if e.code != 304 or cache is None:
+                raise
+            cached = cache.open_body(url)
+            if cached is None:
+                # cache entry vanished between validators() and open_body(): refetch unconditionally
+                resp = _urlopen(url, {}, stats=stats)
+
+        if cached is not None:
+            if stats is not None:
+                stats.not_modified += 1
+            with cached:
+                yield cached
+            return
+
+        with resp:
+            writer = cache.writer(url, resp.headers) if cache is not None else None
+            if writer is None:
+                yield resp
+                return
+            tee = _TeeReader(resp, writer)
+            try:
+                yield tee  # type: ignore[misc]
+            except BaseException:
+                writer.abort()
+                raise
+            if tee.eof:
+                writer.commit()
+            else:
+                writer.abort()
+
+
+@contextmanager
+def _raw_sink(url: str, raw_path: Path, *, stats: SourceStats) -> Iterator[Any]:
+    """Destination of a body's raw copy: the raw store, recorded under `raw_path`'s name in its
+    day/topic manifest once the body is complete, or `raw_path` itself without a store."""
+    store = _RAW_STORE
+    if store is None:
+        raw_path.parent.mkdir(parents=True, exist_ok=True)
+        with raw_path.open("wb") as f:
+            yield f
+        return
+    writer = store.writer()
+    try:
+        yield writer
+    except BaseException:
+        writer.abort()
+        raise
+    sha256 = writer.commit()
+    store.record(raw_path.parent, source_id=stats.source_id, name=raw_path.name, url=url, sha256=sha256, size=writer.size)
+
+
+def _forget_raw(raw_dir: Path, *, stats: SourceStats) -> None:
+    if _RAW_STORE is not None and _REPLAY is None:
+        _RAW_STORE.forget(raw_dir, source_id=stats.source_id)
+
+
+@contextmanager
+def _open_teed(url: str, raw_path: Path, *, stats: SourceStats, sinks: tuple[Any, ...] = ()) -> Iterator[_TeeReader]:
+    """Stream `url` while copying the body to its raw snapshot `raw_path` (and any extra `sinks`).
+
+    Parsers may stop early; whatever they did not consume is still copied to the raw
+    snapshot (and the HTTP cache) on exit, without being parsed, so both stay complete.
+    Network time and bytes go to `stats`; the rest of the time inside the block counts
+    as parse time.
+    """
+    if _REPLAY is not None:
+        with _open_snapshot(raw_path, stats=stats, sinks=sinks) as tee:
+            yield tee
+        return
+    stats.requests += 1
+    t0 = time.perf_counter()
+    fetch_before = stats.fetch_seconds
+    not_modified = stats.not_modified
+    opened = False
+    try:
+        with _open_url(url, stats=stats) as stream, _raw_sink(url, raw_path, stats=stats) as raw:
+            opened = True
+            stats.fetch_seconds += time.perf_counter() - t0  # connect + response headers
+            metered = _MeteredReader(stream, stats, cached=stats.not_modified > not_modified)
+            tee = _TeeReader(metered, raw, *sinks)  # type: ignore[arg-type]
+            yield tee
+            tee.drain()
+    finally:
+        elapsed = time.perf_counter() - t0
+        if opened:
+            stats.parse_seconds += elapsed - (stats.fetch_seconds - fetch_before)
+        else:
+            stats.fetch_seconds += elapsed  # failed to connect / error status
+
+
+@contextmanager
+def _open_snapshot(raw_path: Path, *, stats: SourceStats, sinks: tuple[Any, ...] = ()) -> Iterator[_TeeReader]:
+    """Replay counterpart of _open_teed: the body stored for `raw_path` by an earlier run."""
+    assert _REPLAY is not None
+    t0 = time.perf_counter()
+    fetch_before = stats.fetch_seconds
+    with _REPLAY.open_snapshot(raw_path.parent, raw_path.name) as f:
+        tee = _TeeReader(_MeteredReader(f, stats, cached=True), *sinks)  # type: ignore[arg-type]
+        yield tee
+    stats.parse_seconds += time.perf_counter() - t0 - (stats.fetch_seconds - fetch_before)
+
+
+def _replay_pages(raw_dir: Path, *, source_id: str, suffix: str) -> int:
+    """Pages an earlier run stored for a paginated source (`<id>.p<N><suffix>` after the first)."""
+    assert _REPLAY is not None
+    snaps = _REPLAY.manifest(raw_dir).get(source_id)
+    if snaps:
+        return len(snaps)
+    return len(list(raw_dir.glob(f"{source_id}.p*{suffix}"))) + 1  # plain files from before the store
+
+
+class _HashSink:
+    def __init__(self) -> None:
+        self.sha256 = hashlib.sha256()
+        self.size = 0
+
+    def write(self, chunk: bytes) -> None:
+        self.sha256.update(chunk)
+        self.size += len(chunk)
+
+
+# Parses a feed body into unfiltered entry dicts (shared between topics via the FeedCache).
+EntryParser = Callable[[Any], Iterator[dict[str, Any]]]
+
+
+def _load_shared(
+    url: str, raw_path: Path, *, stats: SourceStats, parse: EntryParser, bucket: TokenBucket | SharedSpacing | None
+) -> FeedPage:
+    if bucket is not None:
+        stats.throttle_seconds += bucket.acquire()
+    digest = _HashSink()  # same key the raw store files the body under
+    with _open_teed(url, raw_path, stats=stats, sinks=(digest,)) as stream:
+        entries = list(parse(stream))
+    return FeedPage(url=url, entries=entries, sha256=digest.sha256.hexdigest(), size=digest.size)
+
+
+@contextmanager
+def _entries(
+    url: str,
+    raw_path: Path,
+    *,
+    stats: SourceStats,
+    parse: EntryParser,
+    bucket: TokenBucket | SharedSpacing | None = None,
+) -> Iterator[Iterator[dict[str, Any]]]:
+    """Parsed, unfiltered entries of `url`, with the body saved at `raw_path`.
+
+    Feeds the run's FeedCache shares are fetched and parsed once, then replayed from memory
+    for every other source that asks (their manifests point at the same raw object);
+    anything else is streamed (callers may stop early).
+    """
+    cache, store = _FEED_CACHE, _RAW_STORE
+    if cache is None or store is None or _REPLAY is not None or url.startswith("file://") or not cache.shares(url):
+        if bucket is not None:
+            stats.throttle_seconds += bucket.acquire()
+        with _open_teed(url, raw_path, stats=stats) as stream:
+            yield parse(stream)
+        return
+    page, hit = cache.get(url, load=lambda: _load_shared(url, raw_path, stats=stats, parse=parse, bucket=bucket))
+    if hit:
+        stats.shared += 1
+        store.record(
+            raw_path.parent, source_id=stats.source_id, name=raw_path.name, url=url, sha256=page.sha256, size=page.size
+        )
+    yield iter(page.entries)
+
+
+def _iter_closed(stream: Any, want: Callable[[list[str]], bool]) -> Iterator[tuple[str, ET.Element]]:
+    """Incrementally parse `stream`, yielding `(root_tag, element)` for each completed element
+    whose tag path (root first) satisfies `want`. Yielded elements are detached afterwards,
+    so memory stays bounded by one entry rather than the whole document."""
+    path: list[str] = []
+    parents: list[ET.Element] = []
+    for event, el in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            path.append(el.tag)
+            parents.append(el)
+            continue
+        if want(path):
+            yield path[0], el
+            if len(parents) > 1:
+                parents[-2].remove(el)
+            el.clear()
+        path.pop()
+        parents.pop()
 
 
 def _matches_keywords(*, text: str, include: list[str], exclude: list[str]) -> bool:
-    if include:
-        ok = any(_kw_hit(text=text, kw=k) for k in include if (k or "").strip())
-        if not ok:
-            return False
-    if exclude:
-        bad = any(_kw_hit(text=text, kw=k) for k in exclude if (k or "").strip())
-        if bad:
-            return False
-    return True
+    return compile_matcher(include=include, exclude=exclude).matches(text)
 
 
 @dataclass(frozen=True)
@@ -70,17 +431,85 @@ class ArxivQuery:
     max_results: int
     include_keywords: list[str]
     exclude_keywords: list[str]
+    api_url: str = ARXIV_API_URL
 
 
-def _arxiv_api_url(q: ArxivQuery) -> str:
+def _arxiv_api_url(q: ArxivQuery, *, start: int = 0) -> str:
     params = {
         "search_query": q.query,
-        "start": 0,
+        "start": start,
         "max_results": q.max_results,
         "sortBy": q.sort_by,
         "sortOrder": q.sort_order,
     }
-    return "https://export.arxiv.org/api/query?" + urllib.parse.urlencode(params)
+    return q.api_url + "?" + urllib.parse.urlencode(params)
+
+
+def _host_bucket(url: str, *, interval: float) -> TokenBucket | SharedSpacing | None:
+    """Shared per-host request spacing (one request per `interval` seconds)."""
+    if interval <= 0 or url.startswith("file://") or _REPLAY is not None:
+        return None
+    host = (urllib.parse.urlsplit(url).hostname or "").lower()
+    if _SHARED_SPACING is not None:
+        lock, slots = _SHARED_SPACING
+        return SharedSpacing(interval=interval, key=host, lock=lock, slots=slots)
+    with _HOST_LOCK:
+        bucket = _HOST_BUCKETS.get(host)
+        if bucket is None:
+            bucket = _HOST_BUCKETS[host] = TokenBucket(rate=1.0 / interval)
+        return bucket
+
+
+def _hwm_path(source: dict[str, Any], q: ArxivQuery, *, topic: str) -> Path | None:
+    """Per topic: topics may reuse a source id and query, and each must see every new entry once."""
+    if _STATE_DIR is None:
+        return None
+    sid = re.sub(r"[^A-Za-z0-9_.-]+", "_", str(source.get("id") or "arxiv"))
+    digest = hashlib.sha1(q.query.encode("utf-8")).hexdigest()[:10]
+    return _STATE_DIR / "arxiv" / re.sub(r"[^A-Za-z0-9_.-]+", "_", topic) / f"{sid}-{digest}.json"
+
+
+# Mark files keep one mark per run date ({"query", "marks": {date: mark}}); a run reads the newest
+# mark of an earlier date, so running a date again sees the same entries as its first run.
+_HWM_KEEP_DATES = 30
+
+
+def _load_marks(path: Path) -> dict[str, str]:
+    try:
+        marks = json.loads(path.read_text(encoding="utf-8")).get("marks")
+    except Exception:
+        return {}
+    return {str(d): str(m) for d, m in marks.items() if m} if isinstance(marks, dict) else {}
+
+
+def _read_hwm(path: Path | None, *, before: str) -> str:
+    if path is None or not path.exists():
+        return ""
+    marks = _load_marks(path)
+    earlier = [d for d in marks if d < before]
+    return marks[max(earlier)] if earlier else ""
+
+
+def _write_hwm(path: Path, *, query: str, date: str, mark: str) -> None:
+    marks = _load_marks(path) if path.exists() else {}
+    marks[date] = mark
+    marks = {d: marks[d] for d in sorted(marks)[-_HWM_KEEP_DATES:]}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(
+        json.dumps({"query": query, "marks": marks}, ensure_ascii=False, indent=2) + "\n",
+        encoding="utf-8",
+    )
+    os.replace(tmp, path)
+
+
+def commit_marks(raw_dir: Path) -> None:
+    """Write the high-water marks the collectors of one day/topic (`raw_dir`) reached; called
+    once the topic's outputs are written, so an interrupted run never moves a mark."""
+    with _PENDING_LOCK:
+        pending = _PENDING_MARKS.pop(Path(raw_dir), [])
+    for path, query, date, mark in pending:
+        _write_hwm(path, query=query, date=date, mark=mark)
 
 
 def _atom_text(el: ET.Element | None, tag: str) -> str:
@@ -102,75 +531,175 @@ def _atom_links(entry: ET.Element) -> dict[str, str]:
     return out
 
 
-def collect_arxiv(*, source: dict[str, Any], raw_dir: Path) -> list[dict[str, Any]]:
-    q = ArxivQuery(
+def _arxiv_entries(stream: Any) -> Iterator[dict[str, Any]]:
+    ns = {"a": "http://www.w3.org/2005/Atom"}
+    entry_tag = f"{{{ns['a']}}}entry"
+    for _, entry in _iter_closed(stream, lambda path: len(path) == 2 and path[1] == entry_tag):
+        links = _atom_links(entry)
+        authors = []
+        for a in entry.findall("a:author", ns):
+            name = _atom_text(a, "name")
+            if name:
+                authors.append(name)
+        yield {
+            "title": _atom_text(entry, "title"),
+            "summary": _atom_text(entry, "summary"),
+            "url": links.get("alternate") or links.get("related") or "",
+            "published": _atom_text(entry, "published"),
+            "updated": _atom_text(entry, "updated"),
+            "authors": authors,
+        }
+
+
+def _arxiv_query(source: dict[str, Any]) -> ArxivQuery:
+    return ArxivQuery(
         query=str(source.get("query") or ""),
         sort_by=str(source.get("sort_by") or "submittedDate"),
         sort_order=str(source.get("sort_order") or "descending"),
-        max_results=int(source.get("max_results") or 50),
+        max_results=int(source.get("page_size") or source.get("max_results") or 50),
         include_keywords=list(source.get("include_keywords") or []),
         exclude_keywords=list(source.get("exclude_keywords") or []),
+        api_url=str(source.get("api_url") or ARXIV_API_URL),
     )
-    if not q.query:
-        return []
 
-    offline = str(source.get("offline") or "").strip().lower() in ("1", "true", "yes") or (
-        str(__import__("os").environ.get("OFFLINE", "")).strip() == "1"
+
+def _arxiv_offline(source: dict[str, Any]) -> bool:
+    return str(source.get("offline") or "").strip().lower() in ("1", "true", "yes") or (
+        str(os.environ.get("OFFLINE", "")).strip() == "1"
     )
-    fixture_path = str(source.get("fixture_path") or "fixtures/arxiv_sample.atom.xml")
-    if offline:
-        xml_bytes = Path(fixture_path).read_bytes()
-    else:
-        url = _arxiv_api_url(q)
-        xml_bytes = _fetch(url)
 
-    raw_path = raw_dir / f"{source.get('id','arxiv')}.atom.xml"
-    _write_bytes(raw_path, xml_bytes)
 
-    root = ET.fromstring(xml_bytes)
-    ns = {"a": "http://www.w3.org/2005/Atom"}
-    items: list[dict[str, Any]] = []
-    for entry in root.findall("a:entry", ns):
-        title = _atom_text(entry, "title")
-        summary = _atom_text(entry, "summary")
-        published = _atom_text(entry, "published") or _atom_text(entry, "updated")
-        links = _atom_links(entry)
-        url_abs = links.get("alternate") or links.get("related") or ""
+def feed_family(source: dict[str, Any]) -> str | None:
+    """FeedCache key of what collecting `source` requests (None when nothing is fetched)."""
+    kind = str(source.get("kind") or "").strip().lower()
+    if kind == "arxiv":
+        q = _arxiv_query(source)
+        if not q.query or _arxiv_offline(source):
+            return None
+        return request_family(_arxiv_api_url(q))
+    if kind in ("rss", "atom", "feed"):
+        url = _strip(str(source.get("url") or ""))
+        return request_family(url) if url and not url.startswith("file://") else None
+    return None
 
-        authors = []
-        for a in entry.findall("a:author", ns):
-            name = _atom_text(a, "name")
-            if name:
-                authors.append(name)
 
-        text_for_filter = f"{title}\n{summary}"
-        if not _matches_keywords(text=text_for_filter, include=q.include_keywords, exclude=q.exclude_keywords):
-            continue
+# Optional predicate to drop items before they are kept (e.g. already published on an earlier day).
+SkipFn = Callable[[dict[str, Any]], bool]
 
-        items.append(
-            {
-                "source": "arxiv",
-                "source_id": source.get("id", "arxiv"),
-                "title": title,
-                "summary": summary,
-                "url": url_abs,
-                "published": published,
-                "authors": authors,
-                "fetched_at": datetime.now(tz=timezone.utc).isoformat(),
-            }
-        )
 
-    return items
+def iter_arxiv(
+    *, source: dict[str, Any], raw_dir: Path, skip: SkipFn | None = None, stats: SourceStats | None = None
+) -> Iterator[dict[str, Any]]:
+    """Items of an arXiv source as they are parsed. The high-water mark reached is only kept
+    once the caller has consumed every page, and only written by commit_marks()."""
+    q = _arxiv_query(source)
+    if not q.query:
+        return
+
+    offline = _arxiv_offline(source)
+    fixture_path = str(source.get("fixture_path") or "fixtures/arxiv_sample.atom.xml")
+
+    # Pagination walks `start` offsets until it reaches entries at/below the previous run's
+    # high-water mark. That needs a newest-first sort on a date field; anything else (or the
+    # very first run, with no mark yet) fetches a single page as before.
+    mark_field = {"submittedDate": "published", "lastUpdatedDate": "updated"}.get(q.sort_by, "")
+    paginate = (
+        bool(source.get("paginate", False)) and not offline and bool(mark_field) and q.sort_order == "descending"
+    )
+    # raw_dir is data/raw/<date>/<topic>
+    run_date = raw_dir.parent.name
+    hwm_path = _hwm_path(source, q, topic=raw_dir.name) if paginate else None
+    hwm = _read_hwm(hwm_path, before=run_date)
+    max_pages = max(1, int(source.get("max_pages") or 10)) if hwm else 1
+    bucket_interval = float(source.get("request_interval") if source.get("request_interval") is not None else 3.0)
+
+    matcher = compile_matcher(include=q.include_keywords, exclude=q.exclude_keywords)
+    if stats is None:
+        stats = SourceStats(source_id=str(source.get("id", "arxiv")), kind="arxiv")
+    _forget_raw(raw_dir, stats=stats)
+    if _REPLAY is not None:
+        # walk exactly the pages the original run fetched, stopping at the mark it stopped at
+        max_pages = _replay_pages(raw_dir, source_id=stats.source_id, suffix=".atom.xml")
+        hwm = _REPLAY.marks(raw_dir).get(stats.source_id, "")
+    elif hwm and _RAW_STORE is not None:
+        _RAW_STORE.record_mark(raw_dir, source_id=stats.source_id, mark=hwm)
+    newest = hwm
+    for page in range(max_pages):
+        url = f"file://{fixture_path}" if offline else _arxiv_api_url(q, start=page * q.max_results)
+        suffix = "" if page == 0 else f".p{page}"
+        raw_path = raw_dir / f"{source.get('id','arxiv')}{suffix}.atom.xml"
+        bucket = _host_bucket(url, interval=bucket_interval)
+
+        seen_entries = 0
+        reached_hwm = False
+        with _entries(url, raw_path, stats=stats, parse=_arxiv_entries, bucket=bucket) as entries:
+            for entry in entries:
+                seen_entries += 1
+                stats.entries += 1
+                if mark_field:
+                    stamp = entry[mark_field]
+                    if hwm and stamp and stamp <= hwm:
+                        reached_hwm = True
+                        break
+                    if stamp > newest:
+                        newest = stamp
+
+                title = entry["title"]
+                summary = entry["summary"]
+                rejected = matcher.rejects(f"{title}\n{summary}")
+                if rejected == "include":
+                    stats.rejected_include += 1
+                    continue
+                if rejected == "exclude":
+                    stats.rejected_exclude += 1
+                    continue
+
+                item = {
+                    "source": "arxiv",
+                    "source_id": source.get("id", "arxiv"),
+                    "title": title,
+                    "summary": summary,
+                    "url": entry["url"],
+                    "published": entry["published"] or entry["updated"],
+                    "authors": list(entry["authors"]),
+                    "fetched_at": datetime.now(tz=timezone.utc).isoformat(),
+                }
+                if skip is not None and skip(item):
+                    stats.skipped_seen += 1
+                    continue
+                yield item
+
+        if reached_hwm or seen_entries < q.max_results:
+            break
 
+    if hwm_path is not None and newest:
+        with _PENDING_LOCK:
+            _PENDING_MARKS.setdefault(raw_dir, []).append((hwm_path, q.query, run_date, newest))
 
-def collect_items(*, source: dict[str, Any], raw_dir: Path) -> list[dict[str, Any]]:
+
+def collect_arxiv(
+    *, source: dict[str, Any], raw_dir: Path, skip: SkipFn | None = None, stats: SourceStats | None = None
+) -> list[dict[str, Any]]:
+    return list(iter_arxiv(source=source, raw_dir=raw_dir, skip=skip, stats=stats))
+
+
+def iter_items(
+    *, source: dict[str, Any], raw_dir: Path, skip: SkipFn | None = None, stats: SourceStats | None = None
+) -> Iterator[dict[str, Any]]:
+    """Items of one source, streamed from the parser (nothing is fetched until iteration starts)."""
     kind = str(source.get("kind") or "").strip().lower()
     if kind == "arxiv":
-        return collect_arxiv(source=source, raw_dir=raw_dir)
+        return iter_arxiv(source=source, raw_dir=raw_dir, skip=skip, stats=stats)
     if kind in ("rss", "atom", "feed"):
-        return collect_rss(source=source, raw_dir=raw_dir)
+        return iter_rss(source=source, raw_dir=raw_dir, skip=skip, stats=stats)
     # Future: rss/github/hf/etc.
-    return []
+    return iter(())
+
+
+def collect_items(
+    *, source: dict[str, Any], raw_dir: Path, skip: SkipFn | None = None, stats: SourceStats | None = None
+) -> list[dict[str, Any]]:
+    return list(iter_items(source=source, raw_dir=raw_dir, skip=skip, stats=stats))
 
 
 def _strip(s: str) -> str:
@@ -187,29 +716,21 @@ def _first_text(el: ET.Element | None, paths: list[str], ns: dict[str, str] | No
     return ""
 
 
-def collect_rss(*, source: dict[str, Any], raw_dir: Path) -> list[dict[str, Any]]:
-    url = _strip(str(source.get("url") or ""))
-    if not url:
-        return []
-    xml_bytes = _fetch(url)
-    raw_path = raw_dir / f"{source.get('id','feed')}.xml"
-    _write_bytes(raw_path, xml_bytes)
-
-    include = list(source.get("include_keywords") or [])
-    exclude = list(source.get("exclude_keywords") or [])
-    max_results = int(source.get("max_results") or 50)
+def _is_feed_entry(path: list[str]) -> bool:
+    # Atom: <feed><entry/>; RSS 2.0: <rss><channel><item/>
+    if "feed" in path[0].lower():
+        return len(path) == 2 and path[1] == "{http://www.w3.org/2005/Atom}entry"
+    return len(path) == 3 and path[1] == "channel" and path[2] == "item"
 
-    root = ET.fromstring(xml_bytes)
-    tag = root.tag.lower()
-    items: list[dict[str, Any]] = []
 
-    # Atom
-    if "feed" in tag:
-        ns = {"a": "http://www.w3.org/2005/Atom"}
-        for entry in root.findall("a:entry", ns):
+def _feed_entries(stream: Any) -> Iterator[dict[str, Any]]:
+    ns = {"a": "http://www.w3.org/2005/Atom"}
+    for root_tag, entry in _iter_closed(stream, _is_feed_entry):
+        if "feed" in root_tag.lower():
+            # Atom
             title = _first_text(entry, ["a:title"], ns)
             summary = _first_text(entry, ["a:summary", "a:content"], ns)
-            updated = _first_text(entry, ["a:updated", "a:published"], ns)
+            published = _first_text(entry, ["a:updated", "a:published"], ns)
             link = ""
             for l in entry.findall("a:link", ns):
                 href = _strip(l.attrib.get("href") or "")
@@ -219,53 +740,66 @@ def collect_rss(*, source: dict[str, Any], raw_dir: Path) -> list[dict[str, Any]
                     break
                 if not link and href:
                     link = href
+        else:
+            # RSS 2.0
+            title = _first_text(entry, ["title"])
+            summary = _first_text(entry, ["description"])
+            published = _first_text(entry, ["pubDate"])
+            link = _first_text(entry, ["link"])
+        yield {"title": title, "summary": summary, "url": link, "published": published}
+
+
+def iter_rss(
+    *, source: dict[str, Any], raw_dir: Path, skip: SkipFn | None = None, stats: SourceStats | None = None
+) -> Iterator[dict[str, Any]]:
+    url = _strip(str(source.get("url") or ""))
+    if not url:
+        return
+    raw_path = raw_dir / f"{source.get('id','feed')}.xml"
 
-            text_for_filter = f"{title}\n{summary}"
-            if not _matches_keywords(text=text_for_filter, include=include, exclude=exclude):
+    matcher = compile_matcher(
+        include=list(source.get("include_keywords") or []),
+        exclude=list(source.get("exclude_keywords") or []),
+    )
+    max_results = int(source.get("max_results") or 50)
+    if stats is None:
+        stats = SourceStats(source_id=str(source.get("id", "feed")), kind=str(source.get("kind") or "rss"))
+    _forget_raw(raw_dir, stats=stats)
+
+    n = 0
+    with _entries(url, raw_path, stats=stats, parse=_feed_entries) as entries:
+        for entry in entries:
+            stats.entries += 1
+            title = entry["title"]
+            summary = entry["summary"]
+            rejected = matcher.rejects(f"{title}\n{summary}")
+            if rejected == "include":
+                stats.rejected_include += 1
                 continue
-
-            items.append(
-                {
-                    "source": "rss",
-                    "source_id": source.get("id", "feed"),
-                    "title": title,
-                    "summary": summary,
-                    "url": link,
-                    "published": updated,
-                    "authors": [],
-                    "fetched_at": datetime.now(tz=timezone.utc).isoformat(),
-                }
-            )
-            if len(items) >= max_results:
-                break
-        return items
-
-    # RSS 2.0
-    channel = root.find("channel")
-    if channel is not None:
-        for item in channel.findall("item"):
-            title = _first_text(item, ["title"])
-            summary = _first_text(item, ["description"])
-            pub = _first_text(item, ["pubDate"])
-            link = _first_text(item, ["link"])
-
-            text_for_filter = f"{title}\n{summary}"
-            if not _matches_keywords(text=text_for_filter, include=include, exclude=exclude):
+            if rejected == "exclude":
+                stats.rejected_exclude += 1
                 continue
 
-            items.append(
-                {
-                    "source": "rss",
-                    "source_id": source.get("id", "feed"),
-                    "title": title,
-                    "summary": summary,
-                    "url": link,
-                    "published": pub,
-                    "authors": [],
-                    "fetched_at": datetime.now(tz=timezone.utc).isoformat(),
-                }
-            )
-            if len(items) >= max_results:
+            item = {
+                "source": "rss",
+                "source_id": source.get("id", "feed"),
+                "title": title,
+                "summary": summary,
+                "url": entry["url"],
+                "published": entry["published"],
+                "authors": [],
+                "fetched_at": datetime.now(tz=timezone.utc).isoformat(),
+            }
+            if skip is not None and skip(item):
+                stats.skipped_seen += 1
+                continue
+            yield item
+            n += 1
+            if n >= max_results:
                 break
 
-    return items
+
+def collect_rss(
+    *, source: dict[str, Any], raw_dir: Path, skip: SkipFn | None = None, stats: SourceStats | None = None
+) -> list[dict[str, Any]]:
+    return list(iter_rss(source=source, raw_dir=raw_dir, skip=skip, stats=stats))
@@ -25,6 +25,10 @@ def build_digest_markdown(*, topic_title: str, date: str, items: list[dict[str,
         meta_bits = [b for b in [published, src] if b]
         if meta_bits:
             lines.append(f"   - {' · '.join(meta_bits)}")
+        alternates = [a for a in it.get("alternates") or [] if (a.get("url") or "").strip()]
+        if alternates:
+            links = ", ".join(f"[{(a.get('source_id') or '链接')}]({a['url'].strip()})" for a in alternates)
+            lines.append(f"   - 另见：{links}")
 
     lines.append("")
     lines.append("## Notes")
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+import re
+import threading
+import tomllib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from dedupe import DedupeConfig, parse_dedupe  # type: ignore
+from keywords import WeightedKeywords, compile_matcher  # type: ignore
+from rank import RankingConfig, parse_ranking  # type: ignore
+
+# One place that reads topics/*.toml, shared by run_daily.py and build_board.py.
+#
+# Each file is parsed once per process and re-read only when its size/mtime change. Full
+# validation (schema, keyword regexes, [ranking]/[dedupe]) happens on first load, so a bad
+# config stops a run before any network work instead of surfacing as an errors.jsonl entry.
+# Loading also compiles every source's include/exclude matcher, which is kept in
+# keywords.compile_matcher's cache for the collectors.
+
+SOURCE_KINDS = ("arxiv", "rss", "atom", "feed")
+DEFAULT_TOP_K = 8
+
+_INT_FIELDS = ("max_results", "page_size", "max_pages", "top_k")
+_NUMBER_FIELDS = ("request_interval", "priority")
+_BOOL_FIELDS = ("enabled", "paginate")
+_KEYWORD_FIELDS = ("include_keywords", "exclude_keywords")
+
+
+class TopicConfigError(ValueError):
+    """A topic file is missing or invalid; the message lists every problem found."""
+
+
+@dataclass(frozen=True)
+class TopicConfig:
+    topic_id: str
+    title: str
+    sources: list[dict[str, Any]]
+    top_k: int
+    ranking: RankingConfig | None = None
+    dedupe: DedupeConfig | None = None
+
+
+def _is_int(v: Any) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _is_number(v: Any) -> bool:
+    return isinstance(v, (int, float)) and not isinstance(v, bool)
+
+
+def _check_source(src: Any, where: str, problems: list[str]) -> None:
+    if not isinstance(src, dict):
+        problems.append(f"{where}: must be a table")
+        return
+    sid = src.get("id")
+    if not isinstance(sid, str) or not sid.strip():
+        problems.append(f"{where}.id: required string")
+    for key in _INT_FIELDS:
+        if key in src and (not _is_int(src[key]) or src[key] <= 0):
+            problems.append(f"{where}.{key}: must be a positive integer")
+    for key in _NUMBER_FIELDS:
+        if key in src and not _is_number(src[key]):
+            problems.append(f"{where}.{key}: must be a number")
+    if _is_number(src.get("request_interval")) and src["request_interval"] < 0:
+        problems.append(f"{where}.request_interval: must be >= 0")
+    for key in _BOOL_FIELDS:
+        if key in src and not isinstance(src[key], bool):
+            problems.append(f"{where}.{key}: must be true or false")
+    lists_ok = True
+    for key in _KEYWORD_FIELDS:
+        if key in src and (not isinstance(src[key], list) or not all(isinstance(k, str) for k in src[key])):
+            problems.append(f"{where}.{key}: must be a list of strings")
+            lists_ok = False
+    if lists_ok:
+        try:
+            compile_matcher(include=src.get("include_keywords"), exclude=src.get("exclude_keywords"))
+        except re.error as e:
+            problems.append(f"{where}: bad re: keyword: {e}")
+
+    # disabled sources may be placeholders or kinds not implemented yet
+    if src.get("enabled", True) is False:
+        return
+    kind = str(src.get("kind") or "").strip().lower()
+    if kind not in SOURCE_KINDS:
+        problems.append(f"{where}.kind: must be one of {', '.join(SOURCE_KINDS)} (got {src.get('kind')!r})")
+    elif kind == "arxiv":
+        if not isinstance(src.get("query"), str) or not src["query"].strip():
+            problems.append(f"{where}.query: required for kind 'arxiv'")
+    else:
+        url = src.get("url")
+        if not isinstance(url, str) or not re.match(r"^(https?|file)://", url.strip()):
+            problems.append(f"{where}.url: required http(s):// or file:// URL for kind {kind!r}")
+
+
+def parse_topic(data: dict[str, Any], *, topic_id: str, path: Path) -> TopicConfig:
+    """Validate one parsed topic file; raises TopicConfigError listing every problem."""
+    problems: list[str] = []
+    meta = data.get("meta", {})
+    if not isinstance(meta, dict):
+        problems.append("[meta]: must be a table")
+        meta = {}
+    for key in ("id", "title", "language"):
+        if key in meta and not isinstance(meta[key], str):
+            problems.append(f"meta.{key}: must be a string")
+
+    sources = data.get("sources", [])
+    if not isinstance(sources, list):
+        problems.append("sources: must be an array of [[sources]] tables")
+        sources = []
+    ids: set[str] = set()
+    for i, src in enumerate(sources):
+        where = f"sources[{i}]"
+        _check_source(src, where, problems)
+        sid = src.get("id") if isinstance(src, dict) else None
+        if isinstance(sid, str):
+            if sid in ids:
+                problems.append(f"{where}.id: duplicate source id {sid!r}")
+            ids.add(sid)
+
+    # top-level `top_k`; older files set it on a source (the last one wins)
+    top_k = data.get("top_k")
+    if top_k is None:
+        per_source = [s["top_k"] for s in sources if isinstance(s, dict) and _is_int(s.get("top_k"))]
+        top_k = per_source[-1] if per_source else DEFAULT_TOP_K
+    elif not _is_int(top_k) or top_k <= 0:
+        problems.append("top_k: must be a positive integer")
+
+    ranking = dedupe = None
+    try:
+        ranking = parse_ranking(data.get("ranking"), sources=[s for s in sources if isinstance(s, dict)])
+        if ranking is not None:
+            WeightedKeywords(ranking.keyword_weights)
+    except (TypeError, ValueError, re.error) as e:
+        problems.append(f"[ranking]: {e}")
+    try:
+        dedupe = parse_dedupe(data.get("dedupe"))
+    except (TypeError, ValueError) as e:
+        problems.append(f"[dedupe]: {e}")
+
+    if problems:
+        raise TopicConfigError(f"Invalid topic config {path}:\n  " + "\n  ".join(problems))
+    return TopicConfig(
+        topic_id=meta.get("id", topic_id),
+        title=meta.get("title", topic_id),
+        sources=sources,
+        top_k=int(top_k),
+        ranking=ranking,
+        dedupe=dedupe,
+    )
+
+
+@dataclass
+class _Entry:
+    sig: tuple[int, int]
+    data: dict[str, Any] | None
+    error: str
+    config: TopicConfig | None = None
+
+
+class TopicRegistry:
+    """Memoized, validated view of the topic files under `root` (thread-safe)."""
+
+    def __init__(self, root: Path = Path("topics")) -> None:
+        self.root = Path(root)
+        self._entries: dict[Path, _Entry] = {}
+        self._lock = threading.Lock()
+
+    def path(self, topic_id: str) -> Path:
+        return self.root / f"{topic_id}.toml"
+
+    def ids(self) -> list[str]:
+        return sorted(p.stem for p in self.root.glob("*.toml"))
+
+    def _entry(self, topic_id: str) -> _Entry | None:
+        path = self.path(topic_id)
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            return None
+        key = path.resolve()
+        sig = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.sig != sig:
+                try:
+                    entry = _Entry(sig=sig, data=tomllib.loads(path.read_text(encoding="utf-8")), error="")
+                except (OSError, UnicodeDecodeError, tomllib.TOMLDecodeError) as e:
+                    entry = _Entry(sig=sig, data=None, error=f"Invalid topic config {path}: {e}")
+                self._entries[key] = entry
+            return entry
+
+    def get(self, topic_id: str) -> TopicConfig:
+        entry = self._entry(topic_id)
+        if entry is None:
+            raise TopicConfigError(f"Topic config not found: {self.path(topic_id)}")
+        if entry.config is None and not entry.error:
+            try:
+                entry.config = parse_topic(entry.data or {}, topic_id=topic_id, path=self.path(topic_id))
+            except TopicConfigError as e:
+                entry.error = str(e)
+        if entry.config is None:
+            raise TopicConfigError(entry.error)
+        return entry.config
+
+    def validate(self, topic_ids: list[str]) -> list[str]:
+        """Error messages for every topic in `topic_ids` that fails to load (empty when all are fine)."""
+        errors: list[str] = []
+        for topic_id in topic_ids:
+            try:
+                self.get(topic_id)
+            except TopicConfigError as e:
+                errors.append(str(e))
+        return errors
+
+    def title(self, topic_id: str) -> str:
+        """meta.title for display; falls back to the id, and does not require a valid config."""
+        entry = self._entry(topic_id)
+        meta = (entry.data or {}).get("meta") if entry is not None else None
+        title = meta.get("title") if isinstance(meta, dict) else None
+        return title.strip() if isinstance(title, str) and title.strip() else topic_id
+
+
+_DEFAULT = TopicRegistry()
+
+
+def load_topic(topic_id: str) -> TopicConfig:
+    return _DEFAULT.get(topic_id)
+
+
+def validate_topics(topic_ids: list[str]) -> list[str]:
+    return _DEFAULT.validate(topic_ids)
+
+
+def topic_ids() -> list[str]:
+    return _DEFAULT.ids()
+
+
+def topic_title(topic_id: str) -> str:
+    return _DEFAULT.title(topic_id)
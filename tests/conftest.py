@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+# scripts/ are flat modules importing each other as siblings, as when run as `python scripts/x.py`
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "scripts"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+import sources  # noqa: E402
+from resilience import FetchPolicy  # noqa: E402
+from stub_server import StubServer  # noqa: E402
+
+
+@pytest.fixture
+def stub() -> Iterator[StubServer]:
+    server = StubServer().start()
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+@pytest.fixture(autouse=True)
+def clean_sources(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[None]:
+    """Run every test in its own directory with the collectors' process-wide settings reset."""
+    monkeypatch.chdir(tmp_path)
+    yield
+    sources.set_http_cache(None)
+    sources.set_state_dir(None)
+    sources.set_raw_store(None)
+    sources.set_replay(None)
+    sources.set_feed_cache(None)
+    sources.set_opener(None)
+    sources.set_fetch_policy(FetchPolicy())
+    sources.set_host_concurrency(0)
+    sources._HOST_BUCKETS.clear()
+    sources._PENDING_MARKS.clear()
@@ -0,0 +1,29 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from archive import Archive
+
+
+def test_append_jsonl_round_trips_sparse_columns(tmp_path: Path) -> None:
+    rows = [
+        {"source": "rss", "title": "a", "url": "https://a"},
+        {"source": "arxiv", "title": "b", "score": 1.5},
+        {"source": "rss", "title": "c", "duplicate_of": "https://a", "alternates": [{"url": None}]},
+    ]
+    path = tmp_path / "items.jsonl"
+    path.write_text("".join(json.dumps(r, ensure_ascii=False) + "\n" for r in rows) + "\n", encoding="utf-8")
+    archive = Archive(tmp_path / "archive")
+
+    assert archive.append_jsonl(date="2026-01-02", topic="t", kind="items", path=path)
+    assert archive.read(date="2026-01-02", topic="t", kind="items") == rows
+    assert archive.read(date="2026-01-02", topic="t", kind="items", columns=["score"]) == [{}, {"score": 1.5}, {}]
+    assert archive.segment(date="2026-01-02", topic="t", kind="items")["order"] == [
+        "source", "title", "url", "score", "duplicate_of", "alternates"
+    ]
+
+    # unchanged file: nothing appended
+    size = (tmp_path / "archive" / "2026-01.pca").stat().st_size
+    assert not archive.append_jsonl(date="2026-01-02", topic="t", kind="items", path=path)
+    assert (tmp_path / "archive" / "2026-01.pca").stat().st_size == size
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+from pathlib import Path
+from urllib.error import HTTPError
+
+import pytest
+
+import sources
+from raw_store import RawStore, SnapshotMissing
+from stub_server import Reply, Request, StubServer
+
+PAGE = 3
+
+
+def _atom(entries: list[int]) -> bytes:
+    body = "".join(
+        f"<entry><title>paper {n}</title><summary>s</summary>"
+        f"<link rel='alternate' href='https://arxiv.org/abs/{n}'/>"
+        f"<published>2026-01-{n:02d}T00:00:00Z</published><updated>2026-01-{n:02d}T00:00:00Z</updated></entry>"
+        for n in entries
+    )
+    return f"<feed xmlns='http://www.w3.org/2005/Atom'>{body}</feed>".encode()
+
+
+class Archive:
+    """arXiv listing, newest first: entry n was submitted on 2026-01-n."""
+
+    def __init__(self, newest: int) -> None:
+        self.newest = newest
+
+    def __call__(self, req: Request) -> Reply:
+        start, size = int(req.query["start"]), int(req.query["max_results"])
+        numbers = list(range(self.newest, 0, -1))[start : start + size]
+        return Reply(body=_atom(numbers), headers={"Content-Type": "application/atom+xml"})
+
+
+def _source(stub: StubServer, **extra: object) -> dict[str, object]:
+    return {
+        "id": "ax",
+        "kind": "arxiv",
+        "query": "cat:cs.AI",
+        "api_url": stub.url("/api/query"),
+        "page_size": PAGE,
+        "paginate": True,
+        "request_interval": 0,
+        **extra,
+    }
+
+
+def _titles(stub: StubServer, tmp_path: Path, topic: str, *, date: str) -> list[str]:
+    raw_dir = tmp_path / "raw" / date / topic
+    items = sources.collect_arxiv(source=_source(stub), raw_dir=raw_dir)
+    # as run_daily does once the topic's outputs are written
+    sources.commit_marks(raw_dir)
+    return [it["title"] for it in items]
+
+
+def test_pages_back_to_the_high_water_mark(stub: StubServer, tmp_path: Path) -> None:
+    archive = Archive(newest=5)
+    stub.routes["/api/query"] = archive
+    sources.set_state_dir(tmp_path / "state")
+
+    # no mark yet: a single page
+    assert _titles(stub, tmp_path, "t1", date="2026-01-05") == ["paper 5", "paper 4", "paper 3"]
+    assert len(stub.requests) == 1
+
+    archive.newest = 12
+    first = _titles(stub, tmp_path, "t1", date="2026-01-12")
+    assert first == [f"paper {n}" for n in range(12, 5, -1)]
+    assert [r.query["start"] for r in stub.requests[1:]] == ["0", "3", "6"]
+
+    # running the same date again (a manual rerun, a crash without --resume) yields the same items
+    assert _titles(stub, tmp_path, "t1", date="2026-01-12") == first
+
+    # only a later date stops at the mark
+    stub.requests.clear()
+    assert _titles(stub, tmp_path, "t1", date="2026-01-13") == []
+    assert len(stub.requests) == 1
+
+
+def test_marks_only_move_once_committed(stub: StubServer, tmp_path: Path) -> None:
+    archive = Archive(newest=5)
+    stub.routes["/api/query"] = archive
+    sources.set_state_dir(tmp_path / "state")
+    _titles(stub, tmp_path, "t1", date="2026-01-05")
+
+    # an interrupted run: collected, but the topic never finished
+    archive.newest = 7
+    sources.collect_arxiv(source=_source(stub), raw_dir=tmp_path / "raw" / "2026-01-07" / "t1")
+    assert _titles(stub, tmp_path, "t1", date="2026-01-08") == ["paper 7", "paper 6"]
+
+
+def test_topics_sharing_a_source_id_keep_separate_marks(stub: StubServer, tmp_path: Path) -> None:
+    archive = Archive(newest=5)
+    stub.routes["/api/query"] = archive
+    sources.set_state_dir(tmp_path / "state")
+
+    assert _titles(stub, tmp_path, "t1", date="2026-01-05") == _titles(stub, tmp_path, "t2", date="2026-01-05")
+
+    archive.newest = 7
+    assert _titles(stub, tmp_path, "t1", date="2026-01-07") == ["paper 7", "paper 6"]
+    assert _titles(stub, tmp_path, "t2", date="2026-01-07") == ["paper 7", "paper 6"]
+    assert sorted(p.parent.name for p in (tmp_path / "state" / "arxiv").rglob("ax-*.json")) == ["t1", "t2"]
+
+
+def test_replay_stops_at_the_mark_the_original_run_used(stub: StubServer, tmp_path: Path) -> None:
+    archive = Archive(newest=5)
+    stub.routes["/api/query"] = archive
+    sources.set_state_dir(tmp_path / "state")
+    sources.set_raw_store(RawStore(tmp_path / "raw"))
+    _titles(stub, tmp_path, "t1", date="2026-01-05")
+    archive.newest = 7
+    original = _titles(stub, tmp_path, "t1", date="2026-01-07")
+    assert original == ["paper 7", "paper 6"]
+
+    # replay: no harvesting state, no network; "paper 5" is on the stored page but below the mark
+    stub.requests.clear()
+    sources.set_state_dir(None)
+    sources.set_replay(RawStore(tmp_path / "raw"))
+    assert _titles(stub, tmp_path, "t1", date="2026-01-07") == original
+    assert stub.requests == []
+
+
+def test_replay_of_a_source_that_failed_says_so(stub: StubServer, tmp_path: Path) -> None:
+    stub.routes["/api/query"] = Reply(status=500, body=b"down")
+    sources.set_raw_store(RawStore(tmp_path / "raw"))
+    with pytest.raises(HTTPError):
+        _titles(stub, tmp_path, "t1", date="2026-01-05")
+
+    sources.set_replay(RawStore(tmp_path / "raw"))
+    with pytest.raises(SnapshotMissing, match=r"^no snapshot stored \(source failed in the original run\)$"):
+        _titles(stub, tmp_path, "t1", date="2026-01-05")
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import sources
+from http_cache import HttpCache
+from metrics import SourceStats
+from stub_server import Reply, Request, StubServer
+
+
+def _rss(*titles: str) -> bytes:
+    items = "".join(f"<item><title>{t}</title><link>https://example.com/{t}</link></item>" for t in titles)
+    return f"<?xml version='1.0'?><rss><channel><title>t</title>{items}</channel></rss>".encode()
+
+
+def _collect(stub: StubServer, tmp_path: Path) -> tuple[list[str], SourceStats]:
+    stats = SourceStats(source_id="f", kind="rss")
+    items = sources.collect_rss(
+        source={"id": "f", "kind": "rss", "url": stub.url("/feed.xml")}, raw_dir=tmp_path / "raw", stats=stats
+    )
+    return [it["title"] for it in items], stats
+
+
+def test_conditional_get_reuses_cached_body_on_304(stub: StubServer, tmp_path: Path) -> None:
+    feed = {"etag": '"v1"', "body": _rss("a", "b")}
+
+    def serve(req: Request) -> Reply:
+        if req.headers.get("if-none-match") == feed["etag"]:
+            return Reply(status=304, headers={"ETag": feed["etag"]})
+        return Reply(body=feed["body"], headers={"ETag": feed["etag"], "Content-Type": "application/rss+xml"})
+
+    stub.routes["/feed.xml"] = serve
+    sources.set_http_cache(HttpCache(tmp_path / "cache"))
+
+    titles, stats = _collect(stub, tmp_path)
+    assert titles == ["a", "b"]
+    assert stats.not_modified == 0
+    assert "if-none-match" not in stub.requests[0].headers
+
+    titles, stats = _collect(stub, tmp_path)
+    assert titles == ["a", "b"]
+    assert stats.not_modified == 1
+    assert stub.requests[1].headers["if-none-match"] == '"v1"'
+
+    feed.update(etag='"v2"', body=_rss("c"))
+    titles, stats = _collect(stub, tmp_path)
+    assert titles == ["c"]
+    assert stats.not_modified == 0
+
+
+def test_responses_without_validators_are_not_cached(stub: StubServer, tmp_path: Path) -> None:
+    stub.routes["/feed.xml"] = Reply(body=_rss("a"))
+    sources.set_http_cache(HttpCache(tmp_path / "cache"))
+
+    _collect(stub, tmp_path)
+    _collect(stub, tmp_path)
+    assert all("if-none-match" not in r.headers for r in stub.requests)
+    assert len(stub.requests) == 2
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+import import_github_issue_links
+from stub_server import Reply, Request, StubServer
+
+ISSUE = "/repos/o/r/issues/7"
+PER_PAGE = 2
+
+
+class GitHub:
+    """Issue + comments endpoints with ETags, paginating comments PER_PAGE at a time."""
+
+    def __init__(self, stub: StubServer, *, link_last: bool) -> None:
+        self.stub = stub
+        self.link_last = link_last
+        self.issue = {"html_url": "https://github.com/o/r/issues/7", "body": "see https://a.example/feed.xml"}
+        self.comments: list[dict[str, str]] = []
+
+    def comment(self, n: int, url: str) -> None:
+        self.comments.append(
+            {
+                "html_url": f"https://github.com/o/r/issues/7#issuecomment-{n}",
+                "updated_at": f"2026-01-{n:02d}T00:00:00Z",
+                "body": f"new source: {url}",
+            }
+        )
+
+    def _json(self, req: Request, data: object, **headers: str) -> Reply:
+        body = json.dumps(data).encode()
+        etag = '"' + hashlib.sha1(body).hexdigest()[:12] + '"'
+        if req.headers.get("if-none-match") == etag:
+            return Reply(status=304, headers={"ETag": etag})
+        return Reply(body=body, headers={"ETag": etag, "Content-Type": "application/json", **headers})
+
+    def serve_issue(self, req: Request) -> Reply:
+        return self._json(req, self.issue)
+
+    def serve_comments(self, req: Request) -> Reply:
+        since = req.query.get("since", "")
+        matching = [c for c in self.comments if c["updated_at"] >= since]
+        page = int(req.query.get("page") or 1)
+        pages = max(1, -(-len(matching) // PER_PAGE))
+
+        def link(n: int) -> str:
+            query = "&".join(f"{k}={v}" for k, v in {**req.query, "page": str(n)}.items())
+            return f"<{self.stub.url(req.path)}?{query}>"
+
+        rels = []
+        if page < pages:
+            rels.append(f'{link(page + 1)}; rel="next"')
+            if self.link_last:
+                rels.append(f'{link(pages)}; rel="last"')
+        headers = {"Link": ", ".join(rels)} if rels else {}
+        return self._json(req, matching[(page - 1) * PER_PAGE : page * PER_PAGE], **headers)
+
+
+def _run(stub: StubServer, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    argv = ["import", "--owner", "o", "--repo", "r", "--number", "7", "--token", "t", "--api", stub.base_url]
+    argv += ["--out-dir", str(tmp_path / "sources"), "--state-dir", str(tmp_path / "state")]
+    monkeypatch.setattr(sys, "argv", argv)
+    assert import_github_issue_links.main() == 0
+    store = json.loads((tmp_path / "sources" / "issue-o-r-7.links.json").read_text(encoding="utf-8"))
+    return [link["url"] for link in store["links"]]
+
+
+@pytest.mark.parametrize("link_last", [False, True], ids=["next", "last"])
+def test_incremental_import(
+    stub: StubServer,
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+    link_last: bool,
+) -> None:
+    gh = GitHub(stub, link_last=link_last)
+    for n in range(1, 6):
+        gh.comment(n, f"https://c{n}.example/rss")
+    stub.routes[ISSUE] = gh.serve_issue
+    stub.routes[ISSUE + "/comments"] = gh.serve_comments
+
+    urls = _run(stub, tmp_path, monkeypatch)
+    assert urls == ["https://a.example/feed.xml"] + [f"https://c{n}.example/rss" for n in range(1, 6)]
+    assert sorted(r.query.get("page", "1") for r in stub.hits(ISSUE + "/comments")) == ["1", "2", "3"]
+    cursor = json.loads((tmp_path / "state" / "github" / "issue-o-r-7.json").read_text(encoding="utf-8"))
+    assert cursor["comments_since"] == "2026-01-05T00:00:00Z"
+
+    # `since` moved on, so the newest comment is read once more under the new URL ...
+    stub.requests.clear()
+    assert _run(stub, tmp_path, monkeypatch) == urls
+    assert [r.query.get("since") for r in stub.hits(ISSUE + "/comments")] == ["2026-01-05T00:00:00Z"]
+
+    # ... after which an unchanged issue costs two conditional requests, both answered 304
+    stub.requests.clear()
+    assert _run(stub, tmp_path, monkeypatch) == urls
+    assert len(stub.requests) == 2
+    assert all(r.headers.get("if-none-match") for r in stub.requests)
+    assert "not modified" in capsys.readouterr().out
+
+    # only comments updated since the cursor are asked for
+    stub.requests.clear()
+    gh.comment(6, "https://c6.example/rss")
+    assert _run(stub, tmp_path, monkeypatch) == urls + ["https://c6.example/rss"]
+    assert stub.hits(ISSUE + "/comments")[0].query["since"] == "2026-01-05T00:00:00Z"
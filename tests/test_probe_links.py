@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import probe_links
+from resilience import FetchPolicy
+from stub_server import Reply, StubServer
+
+
+def test_suggestions_leave_json_feeds_commented_out(stub: StubServer) -> None:
+    stub.routes["/feed.json"] = Reply(body=b'{"version": "1.1"}', headers={"Content-Type": "application/feed+json"})
+    prober = probe_links.Prober(per_host=1, max_bytes=1 << 16, policy=FetchPolicy())
+    results = {stub.url("/feed.json"): prober.probe(stub.url("/feed.json"))}
+    results["https://x.org/"] = {
+        "title": "X",
+        "feeds": [
+            {"url": "https://x.org/feed.json", "type": "json", "title": ""},
+            {"url": "https://x.org/atom.xml", "type": "atom", "title": ""},
+        ],
+    }
+
+    toml = probe_links._suggest_toml(results)
+    assert toml.count("[[sources]]") == 1
+    assert 'url = "https://x.org/atom.xml"' in toml
+    assert f"JSON Feed, not supported: {stub.url('/feed.json')}" in toml
+    assert "JSON Feed, not supported: https://x.org/feed.json" in toml
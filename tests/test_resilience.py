@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import time
+import urllib.error
+from pathlib import Path
+
+import pytest
+
+import sources
+from metrics import SourceStats
+from resilience import CircuitBreakers, CircuitOpenError, FetchPolicy
+from stub_server import Reply, Request, StubServer
+
+RSS = b"<?xml version='1.0'?><rss><channel><title>t</title><item><title>a</title></item></channel></rss>"
+
+
+def _sequence(*replies: Reply):
+    """Route answering with `replies` in turn, then repeating the last one."""
+    queue = list(replies)
+
+    def serve(req: Request) -> Reply:
+        return queue.pop(0) if len(queue) > 1 else queue[0]
+
+    return serve
+
+
+def _collect(stub: StubServer, tmp_path: Path) -> SourceStats:
+    stats = SourceStats(source_id="f", kind="rss")
+    sources.collect_rss(source={"id": "f", "kind": "rss", "url": stub.url("/feed.xml")}, raw_dir=tmp_path, stats=stats)
+    return stats
+
+
+def _policy(**kw: float) -> FetchPolicy:
+    return FetchPolicy(**{"backoff_base": 0.0, "circuit_threshold": 2, "circuit_cooldown": 0.2, **kw})
+
+
+def test_transient_errors_are_retried(stub: StubServer, tmp_path: Path) -> None:
+    stub.routes["/feed.xml"] = _sequence(Reply(status=503), Reply(status=503), Reply(body=RSS))
+    sources.set_fetch_policy(_policy())
+
+    assert _collect(stub, tmp_path).retries == 2
+    assert len(stub.requests) == 3
+
+
+def test_retry_budget_is_bounded(stub: StubServer, tmp_path: Path) -> None:
+    stub.routes["/feed.xml"] = Reply(status=502)
+    sources.set_fetch_policy(_policy(retries=1))
+
+    with pytest.raises(urllib.error.HTTPError):
+        _collect(stub, tmp_path)
+    assert len(stub.requests) == 2
+
+
+def test_retry_after_is_honoured_up_to_a_limit(stub: StubServer, tmp_path: Path) -> None:
+    stub.routes["/feed.xml"] = _sequence(Reply(status=429, headers={"Retry-After": "0"}), Reply(body=RSS))
+    sources.set_fetch_policy(_policy())
+    assert _collect(stub, tmp_path).retries == 1
+
+    stub.requests.clear()
+    stub.routes["/feed.xml"] = Reply(status=429, headers={"Retry-After": "3600"})
+    with pytest.raises(urllib.error.HTTPError):
+        _collect(stub, tmp_path)
+    assert len(stub.requests) == 1
+
+
+def test_circuit_opens_fails_fast_and_recovers(stub: StubServer, tmp_path: Path) -> None:
+    policy = _policy(retries=0)
+    breakers = CircuitBreakers(tmp_path / "state", policy)
+    sources.set_fetch_policy(policy, breakers=breakers)
+    state = tmp_path / "state" / "circuits" / "127.0.0.1.json"
+    stub.routes["/feed.xml"] = Reply(status=500)
+
+    for _ in range(2):
+        with pytest.raises(urllib.error.HTTPError):
+            _collect(stub, tmp_path)
+    assert state.exists()
+
+    # open: no request goes out
+    with pytest.raises(CircuitOpenError):
+        _collect(stub, tmp_path)
+    assert len(stub.requests) == 2
+
+    # half-open: the failed probe re-opens the circuit with the cooldown doubled
+    time.sleep(0.3)
+    with pytest.raises(urllib.error.HTTPError):
+        _collect(stub, tmp_path)
+    assert len(stub.requests) == 3
+    with pytest.raises(CircuitOpenError):
+        _collect(stub, tmp_path)
+    time.sleep(0.25)
+    with pytest.raises(CircuitOpenError):
+        _collect(stub, tmp_path)
+
+    # a successful probe closes it again
+    time.sleep(0.25)
+    stub.routes["/feed.xml"] = Reply(body=RSS)
+    _collect(stub, tmp_path)
+    _collect(stub, tmp_path)
+    assert len(stub.requests) == 5
+    assert not state.exists()
+
+
+def test_missing_pages_do_not_count_against_the_host(stub: StubServer, tmp_path: Path) -> None:
+    policy = _policy()
+    sources.set_fetch_policy(policy, breakers=CircuitBreakers(tmp_path / "state", policy))
+
+    for _ in range(3):
+        with pytest.raises(urllib.error.HTTPError):
+            _collect(stub, tmp_path)
+    assert len(stub.requests) == 3
+    assert not (tmp_path / "state" / "circuits").exists()